@@ -0,0 +1,71 @@
+#!/usr/bin/env python
+"""
+Benchmark for data-only browser sessions.
+Loads the public JobRight and Wellfound pages with and without resource
+blocking and compares bytes transferred and page-load time. Needs Chrome.
+
+Usage:
+    python src/benchmarks/bench_data_only.py --repeat 3 --headless
+"""
+import argparse
+import os
+import sys
+import json
+import statistics
+
+# Add the project root to the path so we can import our modules
+project_root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.append(project_root)
+
+from src.scrapers.core.browser import start_browser, stop_browser, page_load_stats
+
+URLS = ['https://jobright.ai/', 'https://wellfound.com/jobs']
+
+def transferred_bytes(driver):
+    """Sum the encoded bytes of every request finished since the last call."""
+    total = 0
+    for entry in driver.get_log('performance'):
+        message = json.loads(entry['message'])['message']
+        if message.get('method') == 'Network.loadingFinished':
+            total += message['params'].get('encodedDataLength', 0)
+    return total
+
+def measure(url, repeat, headless, data_only):
+    """Load a page in a fresh browser and return median seconds, bytes and requests."""
+    driver = start_browser(headless=headless, data_only=data_only)
+    try:
+        # Page caches would hide the difference
+        driver.execute_cdp_cmd('Network.setCacheDisabled', {'cacheDisabled': True})
+        load_times, sizes, requests = [], [], []
+        for _ in range(repeat):
+            driver.get('about:blank')
+            transferred_bytes(driver)
+            driver.get(url)
+            stats = page_load_stats(driver)
+            load_times.append(stats['load_time'] or 0.0)
+            requests.append(stats['requests'])
+            sizes.append(transferred_bytes(driver))
+        return statistics.median(load_times), statistics.median(sizes), statistics.median(requests)
+    finally:
+        stop_browser(driver)
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark data-only browser sessions')
+    parser.add_argument('--repeat', type=int, default=3, help='Page loads per URL and mode')
+    parser.add_argument('--headless', action='store_true', help='Run Chrome headless')
+    parser.add_argument('--url', action='append', help='Page to load (repeatable), defaults to the scraped sites')
+    args = parser.parse_args()
+    
+    print(f'{"url":<32}{"mode":<11}{"load (s)":>10}{"KiB":>10}{"requests":>10}')
+    for url in args.url or URLS:
+        results = {}
+        for mode, data_only in (('full', False), ('data-only', True)):
+            results[mode] = measure(url, args.repeat, args.headless, data_only)
+            load_time, size, requests = results[mode]
+            print(f'{url:<32}{mode:<11}{load_time:>10.2f}{size / 1024:>10.0f}{requests:>10.0f}')
+        full, fast = results['full'], results['data-only']
+        if full[0] and full[1]:
+            print(f'{"":<32}{"saved":<11}{1 - fast[0] / full[0]:>10.0%}{1 - fast[1] / full[1]:>10.0%}')
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,69 @@
+#!/usr/bin/env python
+"""
+Benchmark for Excel export.
+Compares the DataFrame export path with the streaming write-only path.
+
+Usage:
+    python src/benchmarks/bench_excel_export.py --rows 50000
+"""
+import argparse
+import os
+import sys
+import shutil
+import tempfile
+import time
+import tracemalloc
+
+# Add the project root to the path so we can import our modules
+project_root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.append(project_root)
+
+import pandas as pd
+
+from src.scrapers.core.data_handler import JOBRIGHT_COLUMNS, StreamingExcelSink
+
+def make_rows(count):
+    """Generate JobRight-shaped rows."""
+    for i in range(count):
+        row = {column: f'{column} {i}' for column in JOBRIGHT_COLUMNS}
+        row['Description'] = 'Build and maintain data pipelines. ' * 8
+        yield row
+
+def export_dataframe(rows, output_file):
+    """Current path: build a DataFrame, then df.to_excel."""
+    pd.DataFrame(list(rows)).to_excel(output_file, index=False, sheet_name='Sheet1')
+
+def export_streaming(rows, output_file):
+    """Streaming path: write rows one by one in write-only mode."""
+    with StreamingExcelSink(output_file, columns=JOBRIGHT_COLUMNS) as sink:
+        for row in rows:
+            sink.write(row)
+
+def measure(name, export, count, output_dir):
+    """Run one export and return elapsed seconds and peak traced memory."""
+    output_file = os.path.join(output_dir, f'{name}.xlsx')
+    tracemalloc.start()
+    start = time.perf_counter()
+    export(make_rows(count), output_file)
+    elapsed = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return elapsed, peak
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark Excel export paths')
+    parser.add_argument('--rows', type=int, default=50000, help='Number of rows to export')
+    args = parser.parse_args()
+    
+    output_dir = tempfile.mkdtemp()
+    try:
+        print(f'Exporting {args.rows} rows')
+        print(f'{"path":<12}{"seconds":>10}{"peak MB":>10}{"rows/s":>12}')
+        for name, export in (('dataframe', export_dataframe), ('streaming', export_streaming)):
+            elapsed, peak = measure(name, export, args.rows, output_dir)
+            print(f'{name:<12}{elapsed:>10.2f}{peak / 2**20:>10.1f}{args.rows / elapsed:>12.0f}')
+    finally:
+        shutil.rmtree(output_dir)
+
+if __name__ == '__main__':
+    main()
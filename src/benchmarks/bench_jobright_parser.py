@@ -0,0 +1,76 @@
+#!/usr/bin/env python
+"""
+Benchmark for JobRight /list/jobs parsing.
+Compares the row-at-a-time parser with the page-level columnar parser.
+
+Usage:
+    python src/benchmarks/bench_jobright_parser.py --pages 200
+    python src/benchmarks/bench_jobright_parser.py --payload recorded_1.json recorded_2.json
+"""
+import argparse
+import copy
+import json
+import os
+import sys
+import time
+
+# Add the project root to the path so we can import our modules
+project_root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.append(project_root)
+
+from src.scrapers.jobright.parser import parse_job_list, job_to_record
+
+FIXTURE = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'fixtures', 'jobright_list_jobs.json')
+
+def load_pages(paths, pages, page_size):
+    """Load recorded payloads, or build pages from the bundled fixture."""
+    if paths:
+        bodies = []
+        for path in paths:
+            with open(path) as f:
+                bodies.append(f.read())
+        return bodies
+    
+    with open(FIXTURE) as f:
+        sample = json.load(f)
+    jobs = sample['result']['jobList']
+    
+    bodies = []
+    for page in range(pages):
+        job_list = []
+        for i in range(page_size):
+            job = copy.deepcopy(jobs[i % len(jobs)])
+            job['jobResult']['applyLink'] += f'?p={page}&i={i}'
+            job_list.append(job)
+        bodies.append(json.dumps({'result': {'jobList': job_list}}))
+    return bodies
+
+def parse_rows(body):
+    """Row-at-a-time parsing, as capture_responses used to do."""
+    return [job_to_record(item) for item in json.loads(body)['result']['jobList']]
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark JobRight response parsing')
+    parser.add_argument('--payload', nargs='*', help='Recorded /list/jobs response bodies')
+    parser.add_argument('--pages', type=int, default=200, help='Pages to generate from the fixture')
+    parser.add_argument('--page-size', type=int, default=20, help='Jobs per generated page')
+    parser.add_argument('--repeat', type=int, default=3, help='Best of N runs')
+    args = parser.parse_args()
+    
+    bodies = load_pages(args.payload, args.pages, args.page_size)
+    
+    print(f'{"parser":<12}{"rows":>10}{"seconds":>10}{"rows/s":>12}')
+    for name, parse, count in (
+        ('per-row', parse_rows, len),
+        ('columnar', parse_job_list, lambda batch: len(batch['Apply now'])),
+    ):
+        best = None
+        for _ in range(args.repeat):
+            start = time.perf_counter()
+            rows = sum(count(parse(body)) for body in bodies)
+            elapsed = time.perf_counter() - start
+            best = elapsed if best is None else min(best, elapsed)
+        print(f'{name:<12}{rows:>10}{best:>10.3f}{rows / best:>12.0f}')
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,85 @@
+#!/usr/bin/env python
+"""
+Benchmark for JSON decoding on the network capture paths.
+Compares the available backends on /list/jobs bodies, CDP performance log
+messages and the Wellfound GraphQL handoff (decoded once versus the old
+JSON-string-wrapped-in-JSON format).
+
+Usage:
+    python src/benchmarks/bench_json_decode.py --repeat 2000
+"""
+import argparse
+import json
+import os
+import sys
+import time
+
+# Add the project root to the path so we can import our modules
+project_root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.append(project_root)
+
+from src.scrapers.core import json_backend
+
+FIXTURE = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'fixtures', 'jobright_list_jobs.json')
+
+def make_payloads():
+    """Build one sample of each payload kind."""
+    with open(FIXTURE) as f:
+        body = f.read()
+    
+    perf_message = json.dumps({
+        'message': {
+            'method': 'Network.responseReceived',
+            'params': {
+                'requestId': '1234.56',
+                'type': 'XHR',
+                'response': {
+                    'url': 'https://jobright.ai/swan/recommend/list/jobs?refresh=false&position=20',
+                    'status': 200,
+                    'mimeType': 'application/json',
+                    'headers': {'content-type': 'application/json', 'cache-control': 'no-cache'},
+                },
+            },
+        },
+        'webview': 'ABCDEF',
+    })
+    
+    graphql = json.dumps({'data': {'talent': {'searchStartups': {'edges': [
+        {'node': {'__typename': 'StartupSearchResult', 'startupId': str(i), 'name': f'Startup {i}',
+                  'highlightedJobListings': [{'title': 'Engineer', 'locationNames': ['Remote']}]}}
+        for i in range(20)
+    ]}}}})
+    
+    return {
+        'list/jobs body': body,
+        'perf log entry': perf_message,
+        'graphql (raw)': graphql,
+    }
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark JSON decoding backends')
+    parser.add_argument('--repeat', type=int, default=2000, help='Decodes per payload')
+    args = parser.parse_args()
+    
+    payloads = make_payloads()
+    wrapped = json.dumps(payloads['graphql (raw)'])
+    
+    print(f'{"payload":<24}{"backend":<10}{"decodes/s":>12}')
+    for backend in json_backend.BACKENDS:
+        json_backend.set_backend(backend)
+        for name, payload in payloads.items():
+            start = time.perf_counter()
+            for _ in range(args.repeat):
+                json_backend.loads(payload)
+            elapsed = time.perf_counter() - start
+            print(f'{name:<24}{backend:<10}{args.repeat / elapsed:>12.0f}')
+    
+    # The old Wellfound handoff decoded twice with the standard library
+    start = time.perf_counter()
+    for _ in range(args.repeat):
+        json.loads(json.loads(wrapped))
+    elapsed = time.perf_counter() - start
+    print(f'{"graphql (wrapped, old)":<24}{"json x2":<10}{args.repeat / elapsed:>12.0f}')
+
+if __name__ == '__main__':
+    main()
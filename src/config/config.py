@@ -63,20 +63,50 @@ class Config:
         config['general'] = {
             'headless': 'false',
             'output_dir': os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(__file__))), 'output'),
-            'log_dir': os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(__file__))), 'logs')
+            'log_dir': os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(__file__))), 'logs'),
+            'incremental_overlap': '0.8',
+            'incremental_patience': '2',
+            'cache_max_mb': '256',
+            'session_max_age': '604800',
+            'blocked_resource_types': 'image,media,font',
+            'blocked_url_patterns': '*google-analytics.com*,*googletagmanager.com*,*doubleclick.net*,*facebook.net*,'
+                                    '*hotjar.com*,*segment.io*,*segment.com/analytics*,*mixpanel.com*,*amplitude.com*,'
+                                    '*intercom.io*,*clarity.ms*,*sentry.io*'
         }
         
         # JobRight settings
         config['jobright'] = {
             'enable': 'true',
-            'login_url': 'https://app.jobright.ai/user/login'
+            'login_url': 'https://app.jobright.ai/user/login',
+            'capture_timeout': '10',
+            'session_check_timeout': '10',
+            'feed_keep': '100',
+            'api_page_param': 'position',
+            'api_concurrency': '4',
+            'api_max_requests': '500',
+            'rate_min_delay': '0.5',
+            'rate_max_delay': '30',
+            'rate_initial_delay': '2',
+            'rate_backoff': '2',
+            'rate_recovery': '0.25',
+            'rate_retries': '3'
         }
         
         # Wellfound settings
         config['wellfound'] = {
             'enable': 'true',
             'login_url': 'https://wellfound.com/login',
-            'proxy': 'localhost:8080'
+            'proxy': 'localhost:8080',
+            'graphql_cursor_variable': 'after',
+            'graphql_capture_timeout': '30',
+            'overview_concurrency': '4',
+            'cache_ttl_overview': '604800',
+            'rate_min_delay': '1',
+            'rate_max_delay': '30',
+            'rate_initial_delay': '5',
+            'rate_backoff': '2',
+            'rate_recovery': '0.25',
+            'rate_retries': '3'
         }
         
         # Write configuration to file
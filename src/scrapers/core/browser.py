@@ -3,20 +3,259 @@ Browser management utility for scapers.
 Provides functions to start and stop browsers with proper configuration.
 """
 import os
+import re
 import sys
+import json
+import time
+import shutil
 import logging
+import threading
+import subprocess
+from contextlib import contextmanager
 import undetected_chromedriver as uc
 from selenium import webdriver
 from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.common.desired_capabilities import DesiredCapabilities
-from webdriver_manager.chrome import ChromeDriverManager
-from webdriver_manager.core.os_manager import OperationSystemManager, ChromeType
 
 from src.scrapers.core.logger import get_logger
+from src.scrapers.core.cdp_capture import enable_performance_log
 
 logger = get_logger(__name__)
 
-def start_browser(headless=False, proxy=None, user_data_dir=None, enable_performance_logging=True):
+# URL patterns of resource types a data-only session can do without
+RESOURCE_PATTERNS = {
+    'image': ['*.png', '*.jpg', '*.jpeg', '*.gif', '*.webp', '*.avif', '*.ico', '*.svg'],
+    'media': ['*.mp4', '*.webm', '*.mp3', '*.m4a', '*.ogg'],
+    'font': ['*.woff', '*.woff2', '*.ttf', '*.otf', '*.eot'],
+    'stylesheet': ['*.css'],
+}
+# Blocked by default; stylesheets stay so pages lay out and scroll as usual
+DATA_ONLY_RESOURCE_TYPES = ('image', 'media', 'font')
+# Analytics and tracking scripts, none of which the sites need to work
+DATA_ONLY_URL_PATTERNS = (
+    '*google-analytics.com*', '*googletagmanager.com*', '*doubleclick.net*', '*facebook.net*',
+    '*hotjar.com*', '*segment.io*', '*segment.com/analytics*', '*mixpanel.com*', '*amplitude.com*',
+    '*intercom.io*', '*clarity.ms*', '*sentry.io*',
+)
+
+def blocked_url_patterns(resource_types=None, url_patterns=None):
+    """
+    Get the URL patterns blocked in a data-only session.
+    
+    Defaults are read from ``blocked_resource_types`` and
+    ``blocked_url_patterns`` in the general section of ``config.ini``.
+    
+    Args:
+        resource_types (list): Resource types to block, see RESOURCE_PATTERNS
+        url_patterns (list): Extra URL patterns to block, '*' is a wildcard
+    
+    Returns:
+        list: URL patterns for ``Network.setBlockedURLs``
+    """
+    from src.config.config import config
+    
+    if resource_types is None:
+        setting = config.get_setting('general', 'blocked_resource_types', ','.join(DATA_ONLY_RESOURCE_TYPES))
+        resource_types = [t.strip() for t in setting.split(',') if t.strip()]
+    if url_patterns is None:
+        setting = config.get_setting('general', 'blocked_url_patterns', ','.join(DATA_ONLY_URL_PATTERNS))
+        url_patterns = [p.strip() for p in setting.split(',') if p.strip()]
+    
+    patterns = []
+    for resource_type in resource_types:
+        if resource_type not in RESOURCE_PATTERNS:
+            logger.warning(f'Unknown resource type to block: {resource_type}')
+            continue
+        patterns.extend(RESOURCE_PATTERNS[resource_type])
+    return patterns + list(url_patterns)
+
+def block_resources(driver, patterns):
+    """
+    Block requests matching URL patterns through DevTools.
+    
+    Blocked requests fail immediately with ``net::ERR_BLOCKED_BY_CLIENT``.
+    The default patterns match none of the API requests the scrapers read.
+    
+    Args:
+        driver (WebDriver): Browser instance
+        patterns (list): URL patterns, see ``blocked_url_patterns``
+    """
+    driver.execute_cdp_cmd('Network.enable', {})
+    driver.execute_cdp_cmd('Network.setBlockedURLs', {'urls': list(patterns)})
+    logger.info(f'Blocking {len(patterns)} URL patterns')
+
+def clear_browser_data(driver):
+    """
+    Clear the cookies and storage of every site the browser visited.
+    
+    WebDriver's ``delete_all_cookies`` and the page's own storage only reach
+    the origin currently loaded, so this goes through DevTools: cookies are
+    cleared browser-wide, and local storage, IndexedDB, caches and service
+    workers for the current origin and every origin that had cookies, such
+    as login and SSO redirect domains.
+    
+    Args:
+        driver (WebDriver): Browser instance
+    
+    Returns:
+        int: Number of origins whose storage was cleared
+    """
+    origins = set()
+    origin = driver.execute_script('window.sessionStorage.clear(); return window.location.origin;')
+    if origin and origin.startswith('http'):
+        origins.add(origin)
+    for cookie in driver.execute_cdp_cmd('Storage.getCookies', {}).get('cookies', []):
+        domain = cookie.get('domain', '').lstrip('.')
+        if domain:
+            origins.update((f'https://{domain}', f'http://{domain}'))
+    
+    driver.execute_cdp_cmd('Network.clearBrowserCookies', {})
+    for origin in sorted(origins):
+        driver.execute_cdp_cmd('Storage.clearDataForOrigin', {'origin': origin, 'storageTypes': 'all'})
+    return len(origins)
+
+def page_load_stats(driver):
+    """
+    Measure the current page through the Navigation and Resource Timing APIs.
+    
+    Transfer sizes of cross-origin resources are only reported by servers
+    that send ``Timing-Allow-Origin``, so ``bytes`` is a lower bound.
+    
+    Args:
+        driver (WebDriver): Browser instance with a loaded page
+    
+    Returns:
+        dict: ``load_time`` (seconds until the load event), ``requests`` and
+            ``bytes`` transferred
+    """
+    return driver.execute_script("""
+        const nav = performance.getEntriesByType('navigation')[0];
+        const resources = performance.getEntriesByType('resource');
+        let bytes = nav ? nav.transferSize : 0;
+        for (const r of resources) bytes += r.transferSize || 0;
+        return {
+            load_time: nav ? nav.loadEventEnd / 1000 : null,
+            requests: resources.length + (nav ? 1 : 0),
+            bytes: bytes,
+        };
+    """)
+
+# Chrome binaries looked for when there is no cached one, by platform
+CHROME_PATHS = {
+    'linux': [
+        '/usr/bin/google-chrome-stable',  # Ubuntu/Debian
+        '/usr/bin/google-chrome',        # Alternative
+        '/usr/bin/chromium-browser',     # Chromium alternative
+        '/usr/bin/chromium',
+    ],
+    'darwin': ['/Applications/Google Chrome.app/Contents/MacOS/Google Chrome'],
+    'win32': [
+        os.path.join(os.environ.get(var, ''), 'Google', 'Chrome', 'Application', 'chrome.exe')
+        for var in ('PROGRAMFILES', 'PROGRAMFILES(X86)', 'LOCALAPPDATA')
+    ],
+}
+# Resolved binary, driver and version of earlier runs
+RESOLVER_CACHE = os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))),
+                              '.cache', 'chrome.json')
+
+def find_chrome_binary():
+    """
+    Find the installed Chrome binary.
+    
+    Returns:
+        str: Path to the binary, or None if Chrome is not found
+    """
+    platform = 'linux' if sys.platform.startswith('linux') else sys.platform
+    for path in CHROME_PATHS.get(platform, []):
+        if os.path.exists(path):
+            return path
+    for name in ('google-chrome-stable', 'google-chrome', 'chromium-browser', 'chromium', 'chrome'):
+        path = shutil.which(name)
+        if path:
+            return path
+    return None
+
+def chrome_version(binary):
+    """
+    Get the major version of a Chrome binary without going to the network.
+    
+    On Windows the version is the name of the directory next to
+    ``chrome.exe``; elsewhere the binary is asked with ``--version``.
+    
+    Args:
+        binary (str): Path to the Chrome binary
+    
+    Returns:
+        int: Major version, or None if it cannot be determined
+    """
+    try:
+        if sys.platform == 'win32':
+            versions = [d for d in os.listdir(os.path.dirname(binary)) if re.fullmatch(r'\d+(\.\d+){3}', d)]
+            output = max(versions, key=lambda v: tuple(int(x) for x in v.split('.'))) if versions else ''
+        else:
+            output = subprocess.run([binary, '--version'], capture_output=True, text=True, timeout=10).stdout
+        match = re.search(r'(\d+)\.\d+\.\d+', output)
+        return int(match.group(1)) if match else None
+    except Exception as e:
+        logger.warning(f'Cannot get the version of {binary}: {e}')
+        return None
+
+def resolve_chrome(refresh=False, cache_file=RESOLVER_CACHE):
+    """
+    Resolve the Chrome binary, its major version and a matching chromedriver.
+    
+    The result is cached on disk, keyed by the binary's path and mtime, so
+    later calls neither probe paths nor run anything until Chrome is
+    updated. Only a cache miss can go to the network, to download the
+    driver through webdriver-manager. If that fails, a chromedriver on the
+    PATH is used; without one nothing is cached, so the driver is resolved
+    again on the next call instead of being left to undetected_chromedriver
+    for good.
+    
+    Args:
+        refresh (bool): Ignore the cached result
+        cache_file (str): Path to the cache file
+    
+    Returns:
+        dict: ``binary``, ``mtime``, ``version_main`` and ``driver``, any of
+            which can be None if it could not be resolved
+    """
+    if not refresh:
+        try:
+            with open(cache_file, 'r', encoding='utf-8') as f:
+                cached = json.load(f)
+            binary, driver = cached.get('binary'), cached.get('driver')
+            if (binary and os.path.exists(binary) and os.stat(binary).st_mtime == cached.get('mtime')
+                    and driver and os.path.exists(driver)):
+                return cached
+        except (OSError, ValueError):
+            pass
+    
+    binary = find_chrome_binary()
+    if binary is None:
+        logger.warning('Chrome binary not found in common locations. You may need to install Chrome.')
+        return {'binary': None, 'mtime': None, 'version_main': None, 'driver': None}
+    resolved = {'binary': binary, 'mtime': os.stat(binary).st_mtime, 'version_main': chrome_version(binary), 'driver': None}
+    try:
+        from webdriver_manager.chrome import ChromeDriverManager
+        resolved['driver'] = ChromeDriverManager().install()
+    except Exception as e:
+        resolved['driver'] = shutil.which('chromedriver')
+        logger.warning(f'Cannot install chromedriver: {e}, using {resolved["driver"]} from the PATH')
+    logger.info(f'Resolved Chrome {resolved["version_main"]} at {binary}, driver {resolved["driver"]}')
+    if resolved['driver'] is None:
+        return resolved
+    
+    try:
+        os.makedirs(os.path.dirname(cache_file), exist_ok=True)
+        with open(cache_file, 'w', encoding='utf-8') as f:
+            json.dump(resolved, f)
+    except OSError as e:
+        logger.warning(f'Cannot cache resolved Chrome: {e}')
+    return resolved
+
+def start_browser(headless=False, proxy=None, user_data_dir=None, enable_performance_logging=True, data_only=False,
+                  arguments=None):
     """
     Start and configure a browser instance with appropriate options.
     
@@ -25,13 +264,21 @@ def start_browser(headless=False, proxy=None, user_data_dir=None, enable_perform
         proxy (str): Proxy server to use (format: "host:port")
         user_data_dir (str): Path to Chrome user data directory
         enable_performance_logging (bool): Enable performance logging
+        data_only (bool): Block images, fonts, media and analytics scripts,
+            see ``blocked_url_patterns``
+        arguments (list): Extra Chrome command line arguments
         
     Returns:
         WebDriver: Configured browser instance
     """
     try:
+        start = time.monotonic()
         chrome_options = uc.ChromeOptions()
         
+        if data_only:
+            # Also skips decoding images that slip past the URL patterns
+            chrome_options.add_experimental_option('prefs', {'profile.managed_default_content_settings.images': 2})
+        
         if user_data_dir:
             chrome_options.add_argument(f"--user-data-dir={user_data_dir}")
             
@@ -40,64 +287,45 @@ def start_browser(headless=False, proxy=None, user_data_dir=None, enable_perform
             
         if headless:
             chrome_options.add_argument('--headless')
-            
-        if enable_performance_logging:
-            chrome_options.set_capability('goog:loggingPrefs', {'performance': 'ALL'})
+        
+        for argument in arguments or []:
+            chrome_options.add_argument(argument)
             
         capabilities = DesiredCapabilities.CHROME
         if enable_performance_logging:
-            capabilities['goog:loggingPrefs'] = {'performance': 'ALL'}
-        
-        # Check if we're running in WSL or Linux
-        is_wsl = 'WSL' in os.uname().release if hasattr(os, 'uname') else False
-        is_linux = sys.platform.startswith('linux')
-        
-        if is_wsl or is_linux:
-            logger.info('Running in WSL/Linux environment - setting up Chrome accordingly')
-            # For Linux/WSL environments, we need to specify the Chrome binary location
-            chrome_paths = [
-                '/usr/bin/google-chrome-stable',  # Ubuntu/Debian
-                '/usr/bin/google-chrome',        # Alternative
-                '/usr/bin/chromium-browser',     # Chromium alternative
-            ]
+            enable_performance_log(chrome_options, capabilities)
+        
+        chrome = resolve_chrome()
+        resolved = time.monotonic()
+        if chrome['binary']:
+            chrome_options.binary_location = chrome['binary']
+        
+        try:
+            # A driver at a given path is patched in place and kept, so later
+            # starts skip the download
+            driver = uc.Chrome(
+                options=chrome_options,
+                desired_capabilities=capabilities,
+                version_main=chrome['version_main'],
+                driver_executable_path=chrome['driver'],
+            )
+        except Exception as inner_e:
+            if not chrome['driver']:
+                raise
+            logger.warning(f'Failed to initialize undetected_chromedriver: {inner_e}')
+            logger.info('Trying alternative approach with regular selenium...')
             
-            chrome_binary = None
-            for path in chrome_paths:
-                if os.path.exists(path):
-                    chrome_binary = path
-                    break
-                    
-            if chrome_binary:
-                logger.info(f'Found Chrome binary at: {chrome_binary}')
-                chrome_options.binary_location = chrome_binary
-            else:
-                logger.warning('Chrome binary not found in common locations. You may need to install Chrome.')
-                
-            try:
-                # Try with undetected_chromedriver
-                driver = uc.Chrome(options=chrome_options, desired_capabilities=capabilities)
-            except Exception as inner_e:
-                logger.warning(f'Failed to initialize undetected_chromedriver: {inner_e}')
-                logger.info('Trying alternative approach with regular selenium...')
-                
-                # Alternative approach with regular selenium
-                from selenium.webdriver.chrome.service import Service
-                from webdriver_manager.chrome import ChromeDriverManager
-                
-                service = Service(ChromeDriverManager().install())
-                driver = webdriver.Chrome(service=service, options=chrome_options)
-        else:
-            # Windows environment - proceed with version detection
-            browser_version = OperationSystemManager().get_browser_version_from_os(ChromeType.GOOGLE)
-            if browser_version is None:
-                # If browser version can't be detected, use a default version or None
-                logger.warning('Unable to detect Chrome browser version. Using default settings.')
-                driver = uc.Chrome(options=chrome_options, desired_capabilities=capabilities)
-            else:
-                version_main = int(browser_version.split('.')[0])
-                driver = uc.Chrome(options=chrome_options, desired_capabilities=capabilities, version_main=version_main)
-        
-        logger.info('Browser successfully started')
+            # Alternative approach with regular selenium
+            from selenium.webdriver.chrome.service import Service
+            
+            service = Service(chrome['driver'])
+            driver = webdriver.Chrome(service=service, options=chrome_options)
+        
+        if data_only:
+            block_resources(driver, blocked_url_patterns())
+        
+        logger.info(f'Browser successfully started in {time.monotonic() - start:.1f}s '
+                    f'(Chrome resolved in {resolved - start:.2f}s)')
         return driver
         
     except Exception as e:
@@ -117,3 +345,218 @@ def stop_browser(driver):
             logger.info("Browser closed successfully")
     except Exception as e:
         logger.warning(f"Error closing browser: {e}")
+
+# How a leased browser is reset when it is returned to a BrowserPool
+RESET_POLICIES = ('keep', 'clear', 'restart')
+
+class BrowserPool:
+    """
+    Pool of started browsers that scrapers lease instead of starting their own.
+    
+    Browsers are started ahead of time by ``start()`` or on the first lease
+    and are health-checked before every lease. On ``release`` a browser is
+    reset according to its policy: 'keep' only leaves the page, 'clear'
+    also deletes cookies and web storage of every visited site (see
+    ``clear_browser_data``), 'restart' replaces the browser.
+    Browsers idle for longer than ``max_idle`` seconds or leased
+    ``max_uses`` times are replaced, so no browser runs long enough to leak.
+    
+    The pool is thread-safe; ``lease`` blocks while every browser is in use.
+    """
+    
+    def __init__(self, size=1, factory=None, reset='clear', max_idle=600.0, max_uses=50, **browser_options):
+        """
+        Initialize the pool.
+        
+        Args:
+            size (int): Maximum number of browsers
+            factory (callable): Starts a browser, defaults to ``start_browser``
+                with ``browser_options``
+            reset (str): Default reset policy, one of RESET_POLICIES
+            max_idle (float): Seconds a browser may stay unused
+            max_uses (int): Leases after which a browser is replaced
+            **browser_options: Keyword arguments for ``start_browser``
+        """
+        if reset not in RESET_POLICIES:
+            raise ValueError(f"Unknown reset policy {reset!r}, expected one of {RESET_POLICIES}")
+        self.size = size
+        self.factory = factory or (lambda: start_browser(**browser_options))
+        self.reset = reset
+        self.max_idle = max_idle
+        self.max_uses = max_uses
+        self.started = 0
+        self.leases = 0
+        
+        # Idle browsers as (driver, uses, idle since), most recently used last
+        self._idle = []
+        # Leased driver -> uses
+        self._leased = {}
+        # Browsers being started
+        self._starting = 0
+        # Leased browsers being reset on release
+        self._releasing = set()
+        self._cond = threading.Condition()
+        self._closed = False
+    
+    def _start(self):
+        start = time.monotonic()
+        driver = self.factory()
+        self.started += 1
+        logger.info(f'Started pooled browser in {time.monotonic() - start:.1f}s')
+        return driver
+    
+    def start(self):
+        """
+        Start browsers until the pool is full.
+        
+        Returns:
+            BrowserPool: The started pool
+        """
+        while True:
+            with self._cond:
+                if self._count() >= self.size:
+                    return self
+                self._starting += 1
+            try:
+                driver = self._start()
+            except Exception:
+                with self._cond:
+                    self._starting -= 1
+                    self._cond.notify()
+                raise
+            with self._cond:
+                self._starting -= 1
+                self._idle.append((driver, 0, time.monotonic()))
+                self._cond.notify()
+    
+    def _count(self):
+        return len(self._idle) + len(self._leased) + self._starting
+    
+    def _healthy(self, driver):
+        try:
+            return driver.execute_script('return 1') == 1 and bool(driver.window_handles)
+        except Exception as e:
+            logger.warning(f'Pooled browser failed its health check: {e}')
+            return False
+    
+    def lease(self, timeout=None):
+        """
+        Get a healthy browser from the pool, starting one if needed.
+        
+        Args:
+            timeout (float): Seconds to wait for a browser to be released
+        
+        Returns:
+            WebDriver: Leased browser, to be passed back to ``release``
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            stale = []
+            with self._cond:
+                if self._closed:
+                    raise RuntimeError('Browser pool is closed')
+                now = time.monotonic()
+                while self._idle and now - self._idle[0][2] > self.max_idle:
+                    stale.append(self._idle.pop(0)[0])
+                if self._idle:
+                    driver, uses, _ = self._idle.pop()
+                    self._leased[driver] = uses
+                elif self._count() < self.size:
+                    driver, uses = None, 0
+                    self._starting += 1
+                else:
+                    remaining = None if deadline is None else deadline - time.monotonic()
+                    if remaining is not None and remaining <= 0:
+                        raise TimeoutError(f'No browser released within {timeout}s')
+                    self._cond.wait(remaining)
+                    continue
+            for old in stale:
+                logger.info('Recycling idle pooled browser')
+                stop_browser(old)
+            
+            if driver is not None and not self._healthy(driver):
+                self._discard(driver)
+                continue
+            started = driver is None
+            if started:
+                try:
+                    driver = self._start()
+                except Exception:
+                    with self._cond:
+                        self._starting -= 1
+                        self._cond.notify()
+                    raise
+            with self._cond:
+                if started:
+                    self._starting -= 1
+                self._leased[driver] = uses + 1
+                self.leases += 1
+            return driver
+    
+    def _discard(self, driver):
+        with self._cond:
+            self._leased.pop(driver, None)
+            self._releasing.discard(driver)
+            self._cond.notify()
+        stop_browser(driver)
+    
+    def release(self, driver, reset=None):
+        """
+        Return a leased browser to the pool.
+        
+        Args:
+            driver (WebDriver): Browser returned by ``lease``
+            reset (str): Reset policy for this browser, defaults to the pool's
+        """
+        reset = reset or self.reset
+        with self._cond:
+            if driver not in self._leased or driver in self._releasing:
+                # Already released
+                return
+            self._releasing.add(driver)
+            uses = self._leased[driver]
+            closed = self._closed
+        if closed or reset == 'restart' or uses >= self.max_uses:
+            self._discard(driver)
+            return
+        try:
+            if reset == 'clear':
+                clear_browser_data(driver)
+            driver.get('about:blank')
+        except Exception as e:
+            logger.warning(f'Could not reset pooled browser: {e}')
+            self._discard(driver)
+            return
+        with self._cond:
+            self._leased.pop(driver, None)
+            self._releasing.discard(driver)
+            self._idle.append((driver, uses, time.monotonic()))
+            self._cond.notify()
+    
+    @contextmanager
+    def leased(self, reset=None, timeout=None):
+        """
+        Lease a browser for the duration of a ``with`` block.
+        
+        Args:
+            reset (str): Reset policy on release, defaults to the pool's
+            timeout (float): Seconds to wait for a browser
+        
+        Yields:
+            WebDriver: Leased browser
+        """
+        driver = self.lease(timeout)
+        try:
+            yield driver
+        finally:
+            self.release(driver, reset)
+    
+    def close(self):
+        """Quit every idle browser; leased ones are quit when released."""
+        with self._cond:
+            self._closed = True
+            idle, self._idle = self._idle, []
+            self._cond.notify_all()
+        for driver, _, _ in idle:
+            stop_browser(driver)
+        logger.info(f'Browser pool closed after {self.leases} leases, {self.started} browsers started')
@@ -0,0 +1,122 @@
+"""
+Capture channel between a proxy addon and a scraper.
+An append-only file of sequenced frames: the addon appends every captured
+response body, the scraper tails the file from its last offset, so no
+response is overwritten and bodies are delivered in capture order.
+"""
+import os
+import threading
+
+from src.scrapers.core.logger import get_logger
+
+logger = get_logger(__name__)
+
+class ChannelWriter:
+    """
+    Append response bodies to a capture channel.
+    
+    Each frame is a ``<seq> <length>\\n`` header followed by the raw body and
+    a newline. A frame is appended with a single ``write`` on a file opened
+    with ``O_APPEND``, under a lock, so frames from concurrent callers never
+    interleave.
+    """
+    
+    def __init__(self, path):
+        """
+        Open the channel for appending.
+        
+        Args:
+            path (str): Path to the channel file
+        """
+        self.path = path
+        self.seq = 0
+        self._lock = threading.Lock()
+        self._fd = os.open(path, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+    
+    def send(self, body):
+        """
+        Append one body to the channel.
+        
+        Args:
+            body (bytes or str): Response body
+        
+        Returns:
+            int: Sequence number of the frame
+        """
+        if isinstance(body, str):
+            body = body.encode('utf-8')
+        with self._lock:
+            seq = self.seq
+            self.seq += 1
+            os.write(self._fd, b'%d %d\n' % (seq, len(body)) + body + b'\n')
+        return seq
+    
+    def close(self):
+        """Close the channel file."""
+        os.close(self._fd)
+
+class ChannelReader:
+    """
+    Read response bodies from a capture channel as they are appended.
+    
+    Only complete frames are returned; a frame that is still being written
+    is picked up by the next ``read()``. Sequence numbers are checked, so
+    a gap is logged and counted in ``lost`` instead of going unnoticed.
+    """
+    
+    def __init__(self, path, reset=True):
+        """
+        Open the channel for reading.
+        
+        Args:
+            path (str): Path to the channel file
+            reset (bool): Start from an empty channel, discarding the frames
+                of an earlier run
+        """
+        self.path = path
+        self.offset = 0
+        self.received = 0
+        self.lost = 0
+        
+        self._expected = 0
+        if reset:
+            open(path, 'wb').close()
+    
+    def read(self):
+        """
+        Get the bodies appended since the last call.
+        
+        Returns:
+            list: Bodies (bytes) in capture order
+        """
+        try:
+            with open(self.path, 'rb') as f:
+                f.seek(self.offset)
+                data = f.read()
+        except FileNotFoundError:
+            return []
+        
+        bodies = []
+        pos = 0
+        while True:
+            header_end = data.find(b'\n', pos)
+            if header_end < 0:
+                break
+            seq, length = (int(x) for x in data[pos:header_end].split())
+            frame_end = header_end + 1 + length + 1
+            if frame_end > len(data):
+                break
+            
+            if seq < self._expected:
+                logger.info('Capture channel writer restarted')
+            elif seq > self._expected:
+                logger.warning(f'Capture channel lost {seq - self._expected} frames')
+                self.lost += seq - self._expected
+            self._expected = seq + 1
+            
+            bodies.append(data[header_end + 1:frame_end - 1])
+            pos = frame_end
+        
+        self.offset += pos
+        self.received += len(bodies)
+        return bodies
@@ -0,0 +1,147 @@
+"""
+Network response capture for scrapers.
+Follows a page's requests through the Chrome DevTools performance log and
+returns matching response bodies as soon as they have finished loading.
+"""
+import time
+from collections import OrderedDict
+
+from src.scrapers.core.logger import get_logger
+from src.scrapers.core.json_backend import loads
+
+logger = get_logger(__name__)
+
+# Record only Network events in the performance log, no Page or tracing events
+PERF_LOGGING_PREFS = {'enableNetwork': True, 'enablePage': False}
+# Events the capture decodes, matched against the raw log message
+RESPONSE_RECEIVED = '"Network.responseReceived"'
+LOADING_DONE = ('"Network.loadingFinished"', '"Network.loadingFailed"')
+
+def enable_performance_log(chrome_options, capabilities=None):
+    """
+    Turn on the performance log with only the events ``ResponseCapture`` needs.
+    
+    Args:
+        chrome_options: Chrome options of the browser to start
+        capabilities (dict): Desired capabilities of the browser (optional)
+    """
+    chrome_options.set_capability('goog:loggingPrefs', {'performance': 'ALL'})
+    chrome_options.add_experimental_option('perfLoggingPrefs', PERF_LOGGING_PREFS)
+    if capabilities is not None:
+        capabilities['goog:loggingPrefs'] = {'performance': 'ALL'}
+
+class ResponseCapture:
+    """
+    Capture response bodies of requests whose URL contains a pattern.
+    
+    Selenium cannot push DevTools events to Python, so the performance log
+    is drained every ``poll_interval`` seconds instead. A response is
+    tracked from ``Network.responseReceived`` and its body is fetched on
+    ``Network.loadingFinished``, which is the earliest point it is
+    complete. ``wait`` returns once every tracked response has finished, so
+    the time spent per page follows the network rather than a fixed sleep.
+    
+    Log messages are matched as raw strings before they are decoded, so
+    only events of matching URLs, and completions while a response is
+    tracked, cost a JSON decode. ``seen`` and ``kept`` count the log
+    entries drained and decoded; at most ``max_pending`` responses are
+    tracked at once, older ones are dropped and counted in ``dropped``.
+    """
+    
+    def __init__(self, driver, url_pattern, poll_interval=0.1, max_pending=256):
+        """
+        Initialize the capture.
+        
+        Args:
+            driver: WebDriver instance with performance logging and the
+                ``Network`` domain enabled
+            url_pattern (str): Substring of the URLs to capture
+            poll_interval (float): Seconds between performance log drains
+            max_pending (int): Maximum responses tracked at once
+        """
+        self.driver = driver
+        self.url_pattern = url_pattern
+        self.poll_interval = poll_interval
+        self.max_pending = max_pending
+        self.seen = 0
+        self.kept = 0
+        self.dropped = 0
+        
+        # requestId -> URL of matching responses that are still loading, oldest first
+        self._pending = OrderedDict()
+    
+    def _drain(self):
+        """Process new log entries and return the bodies that finished."""
+        finished = []
+        for entry in self.driver.get_log('performance'):
+            self.seen += 1
+            raw = entry['message']
+            if RESPONSE_RECEIVED in raw:
+                if self.url_pattern not in raw:
+                    continue
+            elif not self._pending or not any(method in raw for method in LOADING_DONE):
+                continue
+            self.kept += 1
+            message = loads(raw)['message']
+            method = message.get('method')
+            params = message.get('params', {})
+            
+            if method == 'Network.responseReceived':
+                url = params['response']['url']
+                if self.url_pattern in url:
+                    self._pending[params['requestId']] = url
+                    if len(self._pending) > self.max_pending:
+                        _, dropped_url = self._pending.popitem(last=False)
+                        self.dropped += 1
+                        logger.warning(f'Tracking too many responses, dropped {dropped_url}')
+            elif method == 'Network.loadingFinished':
+                url = self._pending.pop(params['requestId'], None)
+                if url is None:
+                    continue
+                try:
+                    response_body = self.driver.execute_cdp_cmd(
+                        "Network.getResponseBody", {"requestId": params['requestId']}
+                    )
+                    finished.append((url, response_body.get("body", "")))
+                except Exception as e:
+                    logger.error(f'Could not get response body of {url}: {e}')
+            elif method == 'Network.loadingFailed':
+                url = self._pending.pop(params['requestId'], None)
+                if url is not None:
+                    logger.warning(f'Request to {url} failed: {params.get("errorText", "")}')
+        return finished
+    
+    def wait(self, timeout=10.0):
+        """
+        Wait for matching responses to finish loading.
+        
+        Returns as soon as at least one matching response has finished and
+        none is still loading, or when ``timeout`` expires.
+        
+        Args:
+            timeout (float): Maximum seconds to wait
+        
+        Returns:
+            list: (url, body) tuples in completion order, empty on timeout
+        """
+        deadline = time.monotonic() + timeout
+        responses = []
+        while True:
+            responses.extend(self._drain())
+            if responses and not self._pending:
+                return responses
+            if time.monotonic() >= deadline:
+                if self._pending:
+                    logger.warning(f'{len(self._pending)} responses still loading after {timeout}s')
+                return responses
+            time.sleep(self.poll_interval)
+    
+    def stats(self):
+        """
+        Describe how much of the performance log was decoded.
+        
+        Returns:
+            str: Events seen, kept and dropped
+        """
+        share = self.kept / self.seen if self.seen else 0.0
+        return f'kept {self.kept} of {self.seen} performance log events ({share:.1%}), dropped {self.dropped} responses'
@@ -3,13 +3,65 @@ Data handling utility for scrapers.
 Provides functions to save data to Excel and other formats.
 """
 import os
+import re
+import sys
+import json
+import time
+import uuid
 import pandas as pd
 from datetime import datetime
+from openpyxl import Workbook
 
 from src.scrapers.core.logger import get_logger
+from src.scrapers.core.json_backend import loads
+from src.scrapers.core.records import JobRecord, JobRightRecord, WellfoundRecord, records_to_columns
+
+# pyarrow is only needed for Parquet output
+try:
+    import pyarrow as pa
+    import pyarrow.dataset as ds
+    import pyarrow.parquet as pq
+    PYARROW_AVAILABLE = True
+except ImportError:
+    PYARROW_AVAILABLE = False
+
+# Advisory file locks, the spool of a sink is locked for as long as it is open
+if sys.platform == 'win32':
+    import msvcrt
+else:
+    import fcntl
 
 logger = get_logger(__name__)
 
+# Columns emitted by each scraper, in output order
+JOBRIGHT_COLUMNS = JobRightRecord.columns()
+WELLFOUND_COLUMNS = WellfoundRecord.columns()
+SOURCE_COLUMNS = {
+    'jobright': JOBRIGHT_COLUMNS,
+    'wellfound': WELLFOUND_COLUMNS,
+}
+
+def _default_output_file(output_dir=None, prefix='results', extension='xlsx'):
+    """
+    Build a timestamped output file path, creating the directory if needed.
+    
+    Args:
+        output_dir (str): Output directory (optional)
+        prefix (str): Prefix for output filename
+        extension (str): File extension without the leading dot
+        
+    Returns:
+        str: Output file path
+    """
+    if output_dir is None:
+        output_dir = os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(__file__)))), 'output')
+        
+    if not os.path.exists(output_dir):
+        os.makedirs(output_dir)
+        
+    timestamp = datetime.now().strftime("%Y-%m-%d-%H-%M")
+    return os.path.join(output_dir, f'{prefix}_{timestamp}.{extension}')
+
 def save_to_excel(data, output_file=None, output_dir=None, prefix='results', sheet_name='Sheet1'):
     """
     Save data to Excel file.
@@ -34,14 +86,7 @@ def save_to_excel(data, output_file=None, output_dir=None, prefix='results', she
         
         # Create output file path if not provided
         if output_file is None:
-            if output_dir is None:
-                output_dir = os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(__file__)))), 'output')
-                
-            if not os.path.exists(output_dir):
-                os.makedirs(output_dir)
-                
-            timestamp = datetime.now().strftime("%Y-%m-%d-%H-%M")
-            output_file = os.path.join(output_dir, f'{prefix}_{timestamp}.xlsx')
+            output_file = _default_output_file(output_dir, prefix, 'xlsx')
         
         # Check if file exists and append if it does
         if os.path.exists(output_file):
@@ -79,14 +124,7 @@ def save_to_json(data, output_file=None, output_dir=None, prefix='results'):
     try:
         # Create output file path if not provided
         if output_file is None:
-            if output_dir is None:
-                output_dir = os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(__file__)))), 'output')
-                
-            if not os.path.exists(output_dir):
-                os.makedirs(output_dir)
-                
-            timestamp = datetime.now().strftime("%Y-%m-%d-%H-%M")
-            output_file = os.path.join(output_dir, f'{prefix}_{timestamp}.json')
+            output_file = _default_output_file(output_dir, prefix, 'json')
         
         # Convert DataFrame to dict if needed
         if isinstance(data, pd.DataFrame):
@@ -101,3 +139,755 @@ def save_to_json(data, output_file=None, output_dir=None, prefix='results'):
     except Exception as e:
         logger.error(f"Error saving data to JSON: {e}")
         return None
+
+def to_rows(data):
+    """
+    Normalize scraped data into a list of row dictionaries.
+    
+    Accepts a ``JobRecord``, column-oriented dictionaries
+    (``{'Title': ['...'], ...}``, scalars are broadcast), a DataFrame,
+    or an iterable of records or row dictionaries.
+    
+    Args:
+        data: Data to normalize
+        
+    Returns:
+        list: List of row dictionaries
+    """
+    if isinstance(data, JobRecord):
+        return [data.to_row()]
+    
+    if isinstance(data, pd.DataFrame):
+        return data.to_dict(orient='records')
+    
+    if isinstance(data, dict):
+        lengths = [len(v) for v in data.values() if isinstance(v, (list, tuple))]
+        if not lengths:
+            return [dict(data)]
+        return [
+            {k: (v[i] if isinstance(v, (list, tuple)) else v) for k, v in data.items()}
+            for i in range(max(lengths))
+        ]
+    
+    return [row.to_row() if isinstance(row, JobRecord) else dict(row) for row in data]
+
+def to_batch(data):
+    """
+    Normalize scraped data into a list of items for a sink buffer.
+    
+    Records are kept as they are, so they are only converted when the
+    buffer is written out; anything else goes through ``to_rows``.
+    
+    Args:
+        data: Data to normalize
+        
+    Returns:
+        list: List of records or row dictionaries
+    """
+    if isinstance(data, JobRecord):
+        return [data]
+    if isinstance(data, list) and all(isinstance(item, JobRecord) for item in data):
+        return data
+    return to_rows(data)
+
+FSYNC_POLICIES = ('always', 'every_n', 'close')
+
+def iter_ndjson(input_file):
+    """
+    Iterate over records in a line-delimited JSON file.
+    
+    A truncated last line, as left behind by an interrupted writer, is
+    skipped.
+    
+    Args:
+        input_file (str): Input file path
+        
+    Yields:
+        dict: One record per line
+    """
+    with open(input_file, encoding='utf-8') as f:
+        for line in f:
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                yield loads(line)
+            except ValueError:
+                logger.warning(f"Skipping incomplete line in {input_file}")
+
+def read_ndjson(input_file):
+    """
+    Read records from a line-delimited JSON file.
+    
+    Args:
+        input_file (str): Input file path
+        
+    Returns:
+        list: List of records
+    """
+    return list(iter_ndjson(input_file))
+
+class NDJSONSink:
+    """
+    Streaming line-delimited JSON writer.
+    
+    Each record is appended as one line and pushed to the OS right away,
+    so other processes can tail the file while the scraper is running.
+    How often the file is fsynced is set by the ``fsync`` policy:
+    
+    - ``always``: after every record
+    - ``every_n``: after every ``fsync_every`` records
+    - ``close``: only when the sink is closed
+    """
+    
+    def __init__(self, output_file=None, output_dir=None, prefix='results', fsync='close', fsync_every=100):
+        """
+        Initialize the sink.
+        
+        Args:
+            output_file (str): Output file path (optional)
+            output_dir (str): Output directory (optional)
+            prefix (str): Prefix for output filename
+            fsync (str): Durability policy, one of ``FSYNC_POLICIES``
+            fsync_every (int): Records between fsyncs for the ``every_n`` policy
+        """
+        if fsync not in FSYNC_POLICIES:
+            raise ValueError(f"Unknown fsync policy '{fsync}', expected one of {FSYNC_POLICIES}")
+        
+        if output_file is None:
+            output_file = _default_output_file(output_dir, prefix, 'ndjson')
+        
+        self.output_file = output_file
+        self.fsync = fsync
+        self.fsync_every = fsync_every
+        self.rows_written = 0
+        
+        self._unsynced = 0
+        self._file = open(output_file, 'a', encoding='utf-8')
+    
+    def write(self, data):
+        """
+        Append one or more records to the file.
+        
+        Args:
+            data: Row data, in any form accepted by ``to_rows``
+        """
+        for row in to_rows(data):
+            self._file.write(json.dumps(row, ensure_ascii=False, default=str) + '\n')
+            self.rows_written += 1
+            self._unsynced += 1
+            
+            if self.fsync == 'always' or (self.fsync == 'every_n' and self._unsynced >= self.fsync_every):
+                self.sync()
+        
+        # Make complete lines visible to readers tailing the file
+        self._file.flush()
+    
+    def flush(self):
+        """Push written records to the OS without forcing them to disk."""
+        self._file.flush()
+    
+    def sync(self):
+        """Force written records to disk."""
+        self._file.flush()
+        os.fsync(self._file.fileno())
+        self._unsynced = 0
+    
+    def close(self):
+        """
+        Sync and close the file.
+        
+        Returns:
+            str: Path to the saved file
+        """
+        if not self._file.closed:
+            self.sync()
+            self._file.close()
+            logger.info(f"Data saved to {self.output_file}")
+        return self.output_file
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+def _lock_file(path):
+    """
+    Take an exclusive lock on a file without waiting.
+    
+    The lock is released when the returned file is closed, or by the
+    operating system when the process dies.
+    
+    Args:
+        path (str): Path to the lock file, created if missing
+        
+    Returns:
+        file: Open lock file, or None if another sink holds the lock
+    """
+    f = open(path, 'a+b')
+    try:
+        if sys.platform == 'win32':
+            msvcrt.locking(f.fileno(), msvcrt.LK_NBLCK, 1)
+        else:
+            fcntl.flock(f.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+        return f
+    except OSError:
+        f.close()
+        return None
+
+def _unlock_file(f, path):
+    """Release a lock taken with ``_lock_file`` and remove the lock file."""
+    try:
+        os.remove(path)
+    except OSError:
+        # Windows cannot remove a file that is still open
+        pass
+    f.close()
+    if os.path.exists(path):
+        try:
+            os.remove(path)
+        except OSError:
+            pass
+
+class JobSink:
+    """
+    Buffered batch writer for scraped jobs.
+    
+    Rows are kept in memory and appended to a spool file next to the
+    output file every ``flush_rows`` rows or ``flush_interval`` seconds.
+    The Excel workbook is written once, when the sink is closed. If the
+    process dies, at most one flush window of rows is lost and the spool is
+    left on disk. Output names are timestamped, so the next run does not
+    reopen the same file: a new sink recovers every spool of an earlier run
+    with the same prefix into the workbook that run was writing, and a
+    spool of its own output file is included in its workbook on close.
+    
+    An open sink holds an exclusive lock on ``<spool>.lock``, which the
+    operating system releases if the process dies. Spools whose lock is
+    still held belong to a run that is still going and are left alone.
+    """
+    
+    def __init__(self, output_file=None, output_dir=None, prefix='results', sheet_name='Sheet1',
+                 flush_rows=100, flush_interval=30.0, recover=True):
+        """
+        Initialize the sink.
+        
+        Args:
+            output_file (str): Output file path (optional)
+            output_dir (str): Output directory (optional)
+            prefix (str): Prefix for output filename
+            sheet_name (str): Sheet name
+            flush_rows (int): Flush to the spool after this many buffered rows
+            flush_interval (float): Flush to the spool after this many seconds
+            recover (bool): Recover spools left by interrupted runs
+        """
+        if output_file is None:
+            output_file = _default_output_file(output_dir, prefix, 'xlsx')
+        
+        self.output_file = output_file
+        self.spool_file = f'{output_file}.spool'
+        self.lock_file = f'{self.spool_file}.lock'
+        self.sheet_name = sheet_name
+        self.flush_rows = flush_rows
+        self.flush_interval = flush_interval
+        self.rows_written = 0
+        self.closed = False
+        
+        self._buffer = []
+        self._spool = None
+        self._last_flush = time.monotonic()
+        self._lock = _lock_file(self.lock_file)
+        
+        if self._lock is None:
+            logger.warning(f"{output_file} is being written by another run")
+        elif os.path.exists(self.spool_file):
+            logger.warning(f"Found spool from an interrupted run, it will be included in {output_file}")
+        if recover:
+            self._recover_spools()
+    
+    def _recover_spools(self):
+        """Write spools of interrupted runs with the same prefix to their workbooks."""
+        directory, name = os.path.split(self.output_file)
+        # Only default '{prefix}_{timestamp}.xlsx' names have runs to recover from
+        match = re.fullmatch(r'(.+)_\d{4}-\d{2}-\d{2}-\d{2}-\d{2}(\.\w+)', name)
+        if not match:
+            return
+        
+        pattern = re.compile(re.escape(match.group(1)) + r'_\d{4}-\d{2}-\d{2}-\d{2}-\d{2}' + re.escape(match.group(2)) + r'\.spool')
+        for spool in sorted(os.listdir(directory or '.')):
+            spool_file = os.path.join(directory, spool)
+            if not pattern.fullmatch(spool) or spool_file == self.spool_file:
+                continue
+            
+            lock_file = f'{spool_file}.lock'
+            lock = _lock_file(lock_file)
+            if lock is None:
+                logger.info(f"Skipping spool {spool_file} of a run that is still going")
+                continue
+            try:
+                output_file = spool_file[:-len('.spool')]
+                if not os.path.exists(spool_file):
+                    # The run finished while the directory was listed
+                    continue
+                if _write_spool(spool_file, output_file, self.sheet_name):
+                    logger.warning(f"Recovered spool from an interrupted run into {output_file}")
+                else:
+                    logger.error(f"Cannot recover spool {spool_file}, it is kept for the next run")
+            finally:
+                _unlock_file(lock, lock_file)
+    
+    def write(self, data):
+        """
+        Add one or more rows to the sink.
+        
+        Args:
+            data: Row data, in any form accepted by ``to_rows``
+        """
+        items = to_batch(data)
+        self._buffer.extend(items)
+        self.rows_written += len(items)
+        
+        if len(self._buffer) >= self.flush_rows or time.monotonic() - self._last_flush >= self.flush_interval:
+            self.flush()
+    
+    def flush(self):
+        """Append buffered rows to the spool file."""
+        if self._buffer:
+            if self._spool is None:
+                self._spool = NDJSONSink(self.spool_file, fsync='close')
+            self._spool.write(self._buffer)
+            self._spool.sync()
+            self._buffer = []
+        self._last_flush = time.monotonic()
+    
+    def close(self):
+        """
+        Flush remaining rows and write the workbook.
+        
+        Returns:
+            str: Path to the saved file, or None if nothing was written
+        """
+        if self.closed:
+            return self.output_file if os.path.exists(self.output_file) else None
+        
+        self.flush()
+        if self._spool is not None:
+            self._spool.close()
+            self._spool = None
+        
+        if not os.path.exists(self.spool_file):
+            result = None
+        else:
+            result = _write_spool(self.spool_file, self.output_file, self.sheet_name)
+            if not result:
+                # Keep the spool and its lock for a retry
+                return None
+        
+        self.closed = True
+        if self._lock is not None:
+            _unlock_file(self._lock, self.lock_file)
+            self._lock = None
+        return result
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+def _write_spool(spool_file, output_file, sheet_name='Sheet1'):
+    """
+    Write a JobSink spool to its workbook and remove the spool.
+    
+    Args:
+        spool_file (str): Path to the spool file
+        output_file (str): Path to the workbook
+        sheet_name (str): Sheet name
+        
+    Returns:
+        str: Path to the saved file, or None if it could not be written, in
+            which case the spool is kept
+    """
+    if os.path.exists(output_file):
+        result = save_to_excel(read_ndjson(spool_file), output_file=output_file, sheet_name=sheet_name)
+    else:
+        result = _stream_spool(spool_file, output_file, sheet_name)
+    if result:
+        os.remove(spool_file)
+    return result
+
+def _stream_spool(spool_file, output_file, sheet_name):
+    """Stream a spool into a new workbook without loading it in memory."""
+    try:
+        # First pass collects the header, rows may not all share the same keys
+        columns = {}
+        for row in iter_ndjson(spool_file):
+            columns.update(dict.fromkeys(row))
+        
+        if not columns:
+            return None
+        
+        with StreamingExcelSink(output_file, columns=list(columns), sheet_name=sheet_name) as sink:
+            for row in iter_ndjson(spool_file):
+                sink.write(row)
+        return output_file
+    except Exception as e:
+        logger.error(f"Error saving data to Excel: {e}")
+        return None
+
+class StreamingExcelSink:
+    """
+    Constant-memory Excel writer.
+    
+    Uses openpyxl's write-only mode: each row is serialized as soon as it
+    is written, so memory stays flat regardless of row count. The header
+    is fixed when the sink is created (or by the first row), later keys
+    that are not in it are dropped. The sink can only create new files.
+    """
+    
+    def __init__(self, output_file=None, output_dir=None, prefix='results', columns=None, sheet_name='Sheet1'):
+        """
+        Initialize the sink.
+        
+        Args:
+            output_file (str): Output file path (optional, must not exist)
+            output_dir (str): Output directory (optional)
+            prefix (str): Prefix for output filename
+            columns (list): Header, defaults to the keys of the first row
+            sheet_name (str): Sheet name
+        """
+        if output_file is None:
+            output_file = _default_output_file(output_dir, prefix, 'xlsx')
+        if os.path.exists(output_file):
+            raise ValueError(f"{output_file} already exists, streaming export cannot append to it")
+        
+        self.output_file = output_file
+        self.columns = list(columns) if columns else None
+        self.rows_written = 0
+        
+        self._workbook = Workbook(write_only=True)
+        self._sheet = self._workbook.create_sheet(sheet_name)
+        self._dropped = set()
+        if self.columns:
+            self._sheet.append(self.columns)
+    
+    def write(self, data):
+        """
+        Append one or more rows to the sheet.
+        
+        Args:
+            data: Row data, in any form accepted by ``to_rows``
+        """
+        for row in to_rows(data):
+            if self.columns is None:
+                self.columns = list(row)
+                self._sheet.append(self.columns)
+            
+            extra = set(row).difference(self.columns).difference(self._dropped)
+            if extra:
+                logger.warning(f"Dropping columns not in the header: {sorted(extra)}")
+                self._dropped.update(extra)
+            
+            self._sheet.append([_excel_value(row.get(column)) for column in self.columns])
+            self.rows_written += 1
+    
+    def flush(self):
+        """Rows are already streamed out as they are written."""
+    
+    def close(self):
+        """
+        Finish and save the workbook.
+        
+        Returns:
+            str: Path to the saved file
+        """
+        if self._workbook is not None:
+            self._workbook.save(self.output_file)
+            self._workbook = None
+            logger.info(f"Data saved to {self.output_file}")
+        return self.output_file
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+def _excel_value(value):
+    """Convert a value to something openpyxl can write to a cell."""
+    if value is None or isinstance(value, (str, int, float, bool, datetime)):
+        return value
+    return str(value)
+
+def parquet_schema(source):
+    """
+    Get the explicit Parquet schema for a source.
+    
+    Every column is stored as a nullable string, matching what the
+    scrapers emit. The ``source`` and ``scrape_date`` partition columns
+    are encoded in the directory layout, not in the files.
+    
+    Args:
+        source (str): Source name, one of ``SOURCE_COLUMNS``
+        
+    Returns:
+        pyarrow.Schema: Schema for the source
+    """
+    if not PYARROW_AVAILABLE:
+        raise ImportError("pyarrow is required for Parquet output. Install it using 'pip install pyarrow'")
+    return pa.schema([pa.field(column, pa.string()) for column in SOURCE_COLUMNS[source]])
+
+class ParquetSink:
+    """
+    Columnar writer for scraped jobs, partitioned by source and scrape date.
+    
+    Rows are buffered and written as one Parquet file per flush under
+    ``<output_dir>/source=<source>/scrape_date=<YYYY-MM-DD>/``, a
+    hive-style layout that ``load_parquet_jobs`` and other Arrow-based
+    readers can prune by partition.
+    """
+    
+    def __init__(self, output_dir, source, scrape_date=None, flush_rows=1000):
+        """
+        Initialize the sink.
+        
+        Args:
+            output_dir (str): Root directory of the Parquet dataset
+            source (str): Source name, one of ``SOURCE_COLUMNS``
+            scrape_date (str): Partition date, defaults to today (YYYY-MM-DD)
+            flush_rows (int): Rows per Parquet file
+        """
+        if source not in SOURCE_COLUMNS:
+            raise ValueError(f"Unknown source '{source}', expected one of {list(SOURCE_COLUMNS)}")
+        
+        self.schema = parquet_schema(source)
+        self.output_dir = output_dir
+        self.source = source
+        self.scrape_date = scrape_date or datetime.now().strftime("%Y-%m-%d")
+        self.partition_dir = os.path.join(output_dir, f'source={source}', f'scrape_date={self.scrape_date}')
+        self.flush_rows = flush_rows
+        self.rows_written = 0
+        self.files_written = []
+        
+        self._buffer = []
+        # Unique per sink, so runs started in the same second do not overwrite each other's files
+        self._run_id = f'{datetime.now().strftime("%H%M%S")}-{uuid.uuid4().hex}'
+    
+    def write(self, data):
+        """
+        Add one or more rows to the sink.
+        
+        Args:
+            data: Row data, in any form accepted by ``to_rows``
+        """
+        items = to_batch(data)
+        self._buffer.extend(items)
+        self.rows_written += len(items)
+        
+        if len(self._buffer) >= self.flush_rows:
+            self.flush()
+    
+    def flush(self):
+        """Write buffered rows to a new Parquet file."""
+        if not self._buffer:
+            return
+        
+        if len({type(item) for item in self._buffer}) == 1 and isinstance(self._buffer[0], JobRecord):
+            # Records of one type convert straight to columns
+            batch = records_to_columns(self._buffer)
+        else:
+            rows = to_rows(self._buffer)
+            batch = {name: [row.get(name) for row in rows] for name in self.schema.names}
+        
+        columns = {
+            name: [None if value is None else str(value) for value in batch.get(name, [None] * len(self._buffer))]
+            for name in self.schema.names
+        }
+        table = pa.Table.from_pydict(columns, schema=self.schema)
+        
+        if not os.path.exists(self.partition_dir):
+            os.makedirs(self.partition_dir)
+        path = os.path.join(self.partition_dir, f'part-{self._run_id}-{len(self.files_written):05d}.parquet')
+        pq.write_table(table, path)
+        
+        self.files_written.append(path)
+        self._buffer = []
+    
+    def close(self):
+        """
+        Write remaining rows.
+        
+        Returns:
+            str: Root directory of the dataset, or None if nothing was written
+        """
+        self.flush()
+        if not self.files_written:
+            return None
+        logger.info(f"Data saved to {self.partition_dir}")
+        return self.output_dir
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+def load_parquet_jobs(dataset_dir, source=None, start_date=None, end_date=None, columns=None):
+    """
+    Load scraped jobs from a partitioned Parquet dataset.
+    
+    Filters on source and date are applied to the partition directories,
+    so files outside the range are never opened; only the requested
+    columns are read from the remaining files.
+    
+    Args:
+        dataset_dir (str): Root directory of the Parquet dataset
+        source (str): Only load this source (optional)
+        start_date (str): First scrape date to load, YYYY-MM-DD (optional)
+        end_date (str): Last scrape date to load, YYYY-MM-DD (optional)
+        columns (list): Columns to load (optional, defaults to all)
+        
+    Returns:
+        pd.DataFrame: Loaded jobs
+    """
+    if not PYARROW_AVAILABLE:
+        raise ImportError("pyarrow is required for Parquet output. Install it using 'pip install pyarrow'")
+    
+    # Sources have different column sets, so read with their union
+    partition_schema = pa.schema([('source', pa.string()), ('scrape_date', pa.string())])
+    names = list(dict.fromkeys(c for cols in SOURCE_COLUMNS.values() for c in cols))
+    schema = pa.schema([pa.field(name, pa.string()) for name in names] + list(partition_schema))
+    
+    partitioning = ds.partitioning(partition_schema, flavor='hive')
+    dataset = ds.dataset(dataset_dir, format='parquet', partitioning=partitioning, schema=schema)
+    
+    expression = None
+    for condition in (
+        ds.field('source') == source if source else None,
+        ds.field('scrape_date') >= start_date if start_date else None,
+        ds.field('scrape_date') <= end_date if end_date else None,
+    ):
+        if condition is not None:
+            expression = condition if expression is None else expression & condition
+    
+    return dataset.to_table(columns=columns, filter=expression).to_pandas()
+
+class MultiSink:
+    """Fan rows out to several sinks at once."""
+    
+    def __init__(self, sinks):
+        """
+        Initialize the sink.
+        
+        Args:
+            sinks (list): Sinks to write to
+        """
+        self.sinks = list(sinks)
+    
+    def write(self, data):
+        """
+        Write rows to every sink.
+        
+        Args:
+            data: Row data, in any form accepted by ``to_rows``
+        """
+        items = to_batch(data)
+        for sink in self.sinks:
+            sink.write(items)
+    
+    def flush(self):
+        """Flush every sink."""
+        for sink in self.sinks:
+            sink.flush()
+    
+    def close(self):
+        """
+        Close every sink.
+        
+        Returns:
+            list: Paths to the saved files
+        """
+        results = []
+        for sink in self.sinks:
+            try:
+                result = sink.close()
+                if result:
+                    results.append(result)
+            except Exception as e:
+                logger.error(f"Error closing {type(sink).__name__}: {e}")
+        return results
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+# Output formats supported by create_job_sink, mapped to file extensions.
+# Parquet output is a partitioned directory rather than a single file, and
+# SQLite output is a job store shared by every run in the output directory.
+SINK_FORMATS = {
+    'xlsx': 'xlsx',
+    'ndjson': 'ndjson',
+    'parquet': None,
+    'sqlite': 'db',
+}
+
+def output_file_for_format(output_file, output_format):
+    """
+    Get the output path for a format, next to the main output file.
+    
+    Args:
+        output_file (str): Main output file path
+        output_format (str): Output format, one of ``SINK_FORMATS``
+        
+    Returns:
+        str: Output file path for the format
+    """
+    if output_format == 'parquet':
+        return os.path.join(os.path.dirname(output_file), 'parquet')
+    if output_format == 'sqlite':
+        return os.path.join(os.path.dirname(output_file), 'jobs.db')
+    return f'{os.path.splitext(output_file)[0]}.{SINK_FORMATS[output_format]}'
+
+def create_job_sink(output_file=None, output_dir=None, prefix='results', formats=None,
+                    fsync='every_n', fsync_every=100, source=None):
+    """
+    Create a sink writing scraped jobs in one or more formats.
+    
+    Args:
+        output_file (str): Main output file path (optional)
+        output_dir (str): Output directory (optional)
+        prefix (str): Prefix for output filename
+        formats (list): Output formats, defaults to ``['xlsx']``
+        fsync (str): Durability policy for NDJSON output
+        fsync_every (int): Records between fsyncs for the ``every_n`` policy
+        source (str): Source name, required for Parquet and SQLite output
+        
+    Returns:
+        Sink writing to every requested format
+    """
+    formats = formats or ['xlsx']
+    unknown = [f for f in formats if f not in SINK_FORMATS]
+    if unknown:
+        raise ValueError(f"Unknown output formats {unknown}, expected some of {list(SINK_FORMATS)}")
+    
+    if output_file is None:
+        output_file = _default_output_file(output_dir, prefix, 'xlsx')
+    
+    sinks = []
+    for output_format in formats:
+        path = output_file_for_format(output_file, output_format)
+        if output_format == 'xlsx':
+            sinks.append(JobSink(output_file=path))
+        elif output_format == 'ndjson':
+            sinks.append(NDJSONSink(output_file=path, fsync=fsync, fsync_every=fsync_every))
+        elif output_format == 'parquet':
+            sinks.append(ParquetSink(path, source))
+        elif output_format == 'sqlite':
+            # Imported here, the job store module depends on this one
+            from src.scrapers.core.job_store import JobStoreSink
+            sinks.append(JobStoreSink(path, source))
+    
+    return sinks[0] if len(sinks) == 1 else MultiSink(sinks)
@@ -0,0 +1,226 @@
+"""
+Cross-run deduplication for scrapers.
+Remembers which jobs were already scraped so they can be skipped before any
+record is built or written.
+"""
+import os
+import math
+import hashlib
+from array import array
+from bisect import bisect_left
+
+from src.scrapers.core.logger import get_logger
+
+logger = get_logger(__name__)
+
+def normalize_key(key):
+    """
+    Normalize a job key before hashing.
+    
+    Args:
+        key (str): Job key, see ``job_store.job_key``
+    
+    Returns:
+        str: Lower-cased key with collapsed whitespace
+    """
+    return ' '.join((key or '').lower().split())
+
+def fingerprint(key):
+    """
+    Get the compact 64-bit fingerprint of a job key.
+    
+    Args:
+        key (str): Job key
+    
+    Returns:
+        int: Unsigned 64-bit fingerprint
+    """
+    digest = hashlib.blake2b(normalize_key(key).encode('utf-8'), digest_size=8).digest()
+    return int.from_bytes(digest, 'little')
+
+class BloomFilter:
+    """Bloom filter over 64-bit fingerprints, using double hashing."""
+    
+    def __init__(self, capacity, error_rate=0.01):
+        """
+        Initialize the filter.
+        
+        Args:
+            capacity (int): Expected number of items
+            error_rate (float): Target false positive rate
+        """
+        # Standard sizing: m = -n ln(p) / ln(2)^2 bits, k = m/n ln(2) hashes
+        capacity = max(capacity, 1)
+        self.size = max(int(-capacity * math.log(error_rate) / (math.log(2) ** 2)), 64)
+        self.hashes = max(int(round(self.size / capacity * math.log(2))), 1)
+        self.bits = bytearray((self.size + 7) // 8)
+    
+    def _positions(self, fp):
+        h1 = fp & 0xFFFFFFFF
+        h2 = (fp >> 32) | 1
+        return [(h1 + i * h2) % self.size for i in range(self.hashes)]
+    
+    def add(self, fp):
+        """Add a fingerprint to the filter."""
+        for pos in self._positions(fp):
+            self.bits[pos >> 3] |= 1 << (pos & 7)
+    
+    def __contains__(self, fp):
+        return all(self.bits[pos >> 3] & (1 << (pos & 7)) for pos in self._positions(fp))
+
+class SeenIndex:
+    """
+    Persistent set of already-scraped jobs for one source.
+    
+    Fingerprints are stored as an append-only file of unsigned 64-bit
+    integers under ``<output_dir>/.seen/<source>.idx`` and kept in memory
+    as a sorted array, 8 bytes per job. With ``use_bloom`` a Bloom filter
+    answers most lookups for unseen jobs without touching the array.
+    
+    New jobs only become persistent on ``save()``, so callers should save
+    after the output they were written to has been closed successfully.
+    """
+    
+    def __init__(self, output_dir, source, use_bloom=False):
+        """
+        Load the index for a source.
+        
+        Args:
+            output_dir (str): Output directory the index is kept under
+            source (str): Source name
+            use_bloom (bool): Put a Bloom filter in front of the lookups
+        """
+        self.index_file = os.path.join(output_dir, '.seen', f'{source}.idx')
+        self.source = source
+        self.hits = 0
+        
+        self._sorted = array('Q')
+        if os.path.exists(self.index_file):
+            with open(self.index_file, 'rb') as f:
+                data = f.read()
+            # Ignore a partial trailing entry from an interrupted write
+            data = data[:len(data) - len(data) % self._sorted.itemsize]
+            self._sorted.frombytes(data)
+            self._sorted = array('Q', sorted(set(self._sorted)))
+        
+        self._pending = set()
+        self._bloom = None
+        if use_bloom:
+            self._bloom = BloomFilter(len(self._sorted) * 2)
+            for fp in self._sorted:
+                self._bloom.add(fp)
+        
+        logger.info(f"Loaded {len(self._sorted)} seen {source} jobs")
+    
+    def __len__(self):
+        return len(self._sorted) + len(self._pending)
+    
+    def __contains__(self, key):
+        return self._contains_fp(fingerprint(key))
+    
+    def _contains_fp(self, fp):
+        if fp in self._pending:
+            return True
+        if self._bloom is not None and fp not in self._bloom:
+            return False
+        i = bisect_left(self._sorted, fp)
+        return i < len(self._sorted) and self._sorted[i] == fp
+    
+    def seen(self, key):
+        """
+        Check whether a job was already scraped.
+        
+        Args:
+            key (str): Job key
+        
+        Returns:
+            bool: True if the job is in the index
+        """
+        if self._contains_fp(fingerprint(key)):
+            self.hits += 1
+            return True
+        return False
+    
+    def add(self, key):
+        """
+        Mark a job as scraped.
+        
+        Args:
+            key (str): Job key
+        """
+        fp = fingerprint(key)
+        if not self._contains_fp(fp):
+            self._pending.add(fp)
+    
+    def save(self):
+        """
+        Persist jobs added since the last save.
+        
+        Returns:
+            int: Number of fingerprints written
+        """
+        if not self._pending:
+            return 0
+        
+        index_dir = os.path.dirname(self.index_file)
+        if not os.path.exists(index_dir):
+            os.makedirs(index_dir)
+        
+        new = array('Q', sorted(self._pending))
+        with open(self.index_file, 'ab') as f:
+            f.write(new.tobytes())
+            f.flush()
+            os.fsync(f.fileno())
+        
+        self._sorted = array('Q', sorted(list(self._sorted) + list(new)))
+        if self._bloom is not None:
+            for fp in new:
+                self._bloom.add(fp)
+        self._pending = set()
+        
+        logger.info(f"Saved {len(new)} new seen {self.source} jobs")
+        return len(new)
+
+class IncrementalStop:
+    """
+    Stop condition for incremental scrapes.
+    
+    Feeds are newest first, so once pages consist mostly of jobs that are
+    already in the seen index, the rest of the feed was scraped by an
+    earlier run. Each page's overlap ratio is observed, and the scrape is
+    done after ``patience`` consecutive pages at or above ``threshold``.
+    """
+    
+    def __init__(self, threshold=0.8, patience=2):
+        """
+        Initialize the stop condition.
+        
+        Args:
+            threshold (float): Fraction of known jobs that makes a page "known"
+            patience (int): Consecutive known pages before stopping
+        """
+        self.threshold = threshold
+        self.patience = patience
+        self.pages = 0
+        self.known_pages = 0
+    
+    def observe(self, total, known):
+        """
+        Record the overlap of one page.
+        
+        Args:
+            total (int): Jobs on the page
+            known (int): Jobs on the page that were already seen
+        """
+        if not total:
+            return
+        self.pages += 1
+        if known / total >= self.threshold:
+            self.known_pages += 1
+        else:
+            self.known_pages = 0
+    
+    @property
+    def done(self):
+        """True once enough consecutive pages were already known."""
+        return self.known_pages >= self.patience
@@ -0,0 +1,74 @@
+"""
+HTTP session utility for scrapers.
+Carries an authenticated browser session over to a pooled requests session,
+so JSON endpoints can be called without driving the page.
+"""
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from src.scrapers.core.logger import get_logger
+
+logger = get_logger(__name__)
+
+# Statuses retried by sessions that are not paced by a RateController
+RETRY_STATUSES = (429, 500, 502, 503, 504)
+
+def create_session(pool_size=10, retries=3, user_agent=None, paced=False):
+    """
+    Create a session with a keep-alive connection pool and retries.
+    
+    Args:
+        pool_size (int): Connections kept open per host
+        retries (int): Retries for connection errors and 429/5xx responses
+        user_agent (str): User-Agent header to send (optional)
+        paced (bool): Requests go through a RateController, which backs off
+            and retries on 429/5xx itself, so only connection errors are
+            retried by the session
+    
+    Returns:
+        requests.Session: Configured session
+    """
+    session = requests.Session()
+    retry = Retry(
+        total=retries,
+        backoff_factor=1,
+        status_forcelist=() if paced else RETRY_STATUSES,
+        allowed_methods=('GET', 'POST'),
+        respect_retry_after_header=True,
+    )
+    adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size, max_retries=retry)
+    session.mount('https://', adapter)
+    session.mount('http://', adapter)
+    session.headers.update({'Accept': 'application/json, text/plain, */*'})
+    if user_agent:
+        session.headers['User-Agent'] = user_agent
+    return session
+
+def session_from_driver(driver, pool_size=10, retries=3, paced=False):
+    """
+    Create a session that is authenticated like the browser.
+    
+    Copies the driver's cookies for the current site and its User-Agent, so
+    requests look like they come from the logged in page.
+    
+    Args:
+        driver: WebDriver instance of a logged in browser
+        pool_size (int): Connections kept open per host
+        retries (int): Retries for connection errors and 429/5xx responses
+        paced (bool): Requests go through a RateController, see ``create_session``
+    
+    Returns:
+        requests.Session: Authenticated session
+    """
+    session = create_session(pool_size, retries, user_agent=driver.execute_script('return navigator.userAgent'), paced=paced)
+    cookies = driver.get_cookies()
+    for cookie in cookies:
+        session.cookies.set(
+            cookie['name'],
+            cookie['value'],
+            domain=cookie.get('domain', ''),
+            path=cookie.get('path', '/'),
+        )
+    logger.info(f'Copied {len(cookies)} cookies from the browser session')
+    return session
@@ -0,0 +1,244 @@
+"""
+Persistent job store for scrapers.
+Keeps every scraped job in a local SQLite database, one row per job identity.
+"""
+import json
+import os
+import sqlite3
+from datetime import datetime
+
+from src.scrapers.core.logger import get_logger
+from src.scrapers.core.data_handler import to_rows
+
+logger = get_logger(__name__)
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS jobs (
+    id INTEGER PRIMARY KEY,
+    source TEXT NOT NULL,
+    job_key TEXT NOT NULL,
+    data TEXT NOT NULL,
+    first_seen TEXT NOT NULL,
+    last_seen TEXT NOT NULL
+);
+CREATE UNIQUE INDEX IF NOT EXISTS idx_jobs_source_key ON jobs (source, job_key);
+CREATE INDEX IF NOT EXISTS idx_jobs_source_first_seen ON jobs (source, first_seen);
+"""
+
+UPSERT = """
+INSERT INTO jobs (source, job_key, data, first_seen, last_seen)
+VALUES (?, ?, ?, ?, ?)
+ON CONFLICT (source, job_key) DO UPDATE SET
+    data = excluded.data,
+    last_seen = excluded.last_seen
+"""
+
+def jobright_job_key(apply_link):
+    """
+    Get the identity of a JobRight job.
+    
+    Args:
+        apply_link (str): The job's ``applyLink``
+    
+    Returns:
+        str: Job key, empty if the job cannot be identified
+    """
+    return (apply_link or '').strip()
+
+def wellfound_job_key(startup_id, title):
+    """
+    Get the identity of a Wellfound job listing.
+    
+    Args:
+        startup_id (str): The startup's ``startupId``
+        title (str): The listing title
+    
+    Returns:
+        str: Job key, empty if the job cannot be identified
+    """
+    if not startup_id:
+        return ''
+    return f"{startup_id}:{(title or '').strip()}"
+
+def job_key(source, row):
+    """
+    Get the identity of a scraped row.
+    
+    Args:
+        source (str): Source name ('jobright' or 'wellfound')
+        row (dict): Row as emitted by the scraper
+    
+    Returns:
+        str: Job key, empty if the job cannot be identified
+    """
+    if source == 'jobright':
+        return jobright_job_key(row.get('Apply now'))
+    if source == 'wellfound':
+        return wellfound_job_key(row.get('Startup id'), row.get('Title'))
+    raise ValueError(f"Unknown source '{source}'")
+
+class JobStore:
+    """
+    SQLite-backed store of scraped jobs.
+    
+    Jobs are unique per (source, job key). Writing a job that is already
+    stored updates its data and ``last_seen`` but keeps ``first_seen``,
+    which is what "what's new" queries are based on.
+    """
+    
+    def __init__(self, db_path):
+        """
+        Open or create the store.
+        
+        Args:
+            db_path (str): Path to the SQLite database file
+        """
+        db_dir = os.path.dirname(db_path)
+        if db_dir and not os.path.exists(db_dir):
+            os.makedirs(db_dir)
+        
+        self.db_path = db_path
+        self.conn = sqlite3.connect(db_path)
+        self.conn.row_factory = sqlite3.Row
+        self.conn.execute('PRAGMA journal_mode=WAL')
+        self.conn.execute('PRAGMA synchronous=NORMAL')
+        self.conn.executescript(SCHEMA)
+    
+    def upsert_many(self, source, rows, seen_at=None):
+        """
+        Insert or update a batch of jobs in one transaction.
+        
+        Args:
+            source (str): Source name
+            rows: Row data, in any form accepted by ``to_rows``
+            seen_at (str): Timestamp to record, defaults to now
+        
+        Returns:
+            int: Number of rows written
+        """
+        seen_at = seen_at or datetime.now().isoformat(timespec='seconds')
+        params = []
+        skipped = 0
+        for row in to_rows(rows):
+            key = job_key(source, row)
+            if not key:
+                skipped += 1
+                continue
+            params.append((source, key, json.dumps(row, ensure_ascii=False, default=str), seen_at, seen_at))
+        
+        if skipped:
+            logger.warning(f"Skipped {skipped} {source} rows without a job key")
+        
+        with self.conn:
+            self.conn.executemany(UPSERT, params)
+        return len(params)
+    
+    def has_job(self, source, key):
+        """
+        Check whether a job is already stored.
+        
+        Args:
+            source (str): Source name
+            key (str): Job key
+        
+        Returns:
+            bool: True if the job is stored
+        """
+        cursor = self.conn.execute('SELECT 1 FROM jobs WHERE source = ? AND job_key = ?', (source, key))
+        return cursor.fetchone() is not None
+    
+    def new_since(self, source, since):
+        """
+        Get jobs first seen at or after a point in time.
+        
+        Args:
+            source (str): Source name
+            since (str): ISO timestamp
+        
+        Returns:
+            list: Rows of the new jobs, oldest first
+        """
+        cursor = self.conn.execute(
+            'SELECT data FROM jobs WHERE source = ? AND first_seen >= ? ORDER BY first_seen, id',
+            (source, since),
+        )
+        return [json.loads(row['data']) for row in cursor]
+    
+    def count(self, source=None):
+        """
+        Count stored jobs.
+        
+        Args:
+            source (str): Only count this source (optional)
+        
+        Returns:
+            int: Number of jobs
+        """
+        if source is None:
+            cursor = self.conn.execute('SELECT COUNT(*) FROM jobs')
+        else:
+            cursor = self.conn.execute('SELECT COUNT(*) FROM jobs WHERE source = ?', (source,))
+        return cursor.fetchone()[0]
+    
+    def close(self):
+        """Close the database connection."""
+        self.conn.close()
+
+class JobStoreSink:
+    """Sink that upserts scraped rows into a JobStore in batches."""
+    
+    def __init__(self, db_path, source, flush_rows=100):
+        """
+        Initialize the sink.
+        
+        Args:
+            db_path (str): Path to the SQLite database file
+            source (str): Source name
+            flush_rows (int): Rows per transaction
+        """
+        if source not in ('jobright', 'wellfound'):
+            raise ValueError(f"Unknown source '{source}'")
+        
+        self.store = JobStore(db_path)
+        self.source = source
+        self.flush_rows = flush_rows
+        self.rows_written = 0
+        
+        self._buffer = []
+    
+    def write(self, data):
+        """
+        Add one or more rows to the sink.
+        
+        Args:
+            data: Row data, in any form accepted by ``to_rows``
+        """
+        self._buffer.extend(to_rows(data))
+        if len(self._buffer) >= self.flush_rows:
+            self.flush()
+    
+    def flush(self):
+        """Upsert buffered rows."""
+        if self._buffer:
+            self.rows_written += self.store.upsert_many(self.source, self._buffer)
+            self._buffer = []
+    
+    def close(self):
+        """
+        Upsert remaining rows and close the store.
+        
+        Returns:
+            str: Path to the database, or None if nothing was written
+        """
+        self.flush()
+        self.store.close()
+        if not self.rows_written:
+            return None
+        logger.info(f"Data saved to {self.store.db_path}")
+        return self.store.db_path
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
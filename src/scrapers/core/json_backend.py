@@ -0,0 +1,69 @@
+"""
+JSON decoding backend for scrapers.
+Uses orjson or msgspec when installed and falls back to the standard library.
+"""
+import json
+
+from src.scrapers.core.logger import get_logger
+
+logger = get_logger(__name__)
+
+def _stdlib_loads(data):
+    return json.loads(data)
+
+def _load_backends():
+    """Find the available decoders, fastest first."""
+    backends = {}
+    try:
+        import orjson
+        backends['orjson'] = orjson.loads
+    except ImportError:
+        pass
+    try:
+        import msgspec
+        
+        def _msgspec_loads(data):
+            # msgspec.DecodeError is not a ValueError, unlike the other backends' errors
+            try:
+                return msgspec.json.decode(data)
+            except msgspec.DecodeError as e:
+                raise ValueError(str(e)) from e
+        
+        backends['msgspec'] = _msgspec_loads
+    except ImportError:
+        pass
+    backends['json'] = _stdlib_loads
+    return backends
+
+BACKENDS = _load_backends()
+BACKEND = next(iter(BACKENDS))
+_loads = BACKENDS[BACKEND]
+
+def set_backend(name):
+    """
+    Select the JSON decoder.
+    
+    Args:
+        name (str): Backend name, one of ``BACKENDS``
+    """
+    global BACKEND, _loads
+    
+    if name not in BACKENDS:
+        raise ValueError(f"JSON backend '{name}' is not available, expected one of {list(BACKENDS)}")
+    BACKEND = name
+    _loads = BACKENDS[name]
+    logger.info(f"Using {name} for JSON decoding")
+
+def loads(data):
+    """
+    Decode a JSON document with the selected backend.
+    
+    Every backend raises a ``ValueError`` subclass on invalid input.
+    
+    Args:
+        data (str or bytes): JSON document
+    
+    Returns:
+        Decoded object
+    """
+    return _loads(data)
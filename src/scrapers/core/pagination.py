@@ -0,0 +1,128 @@
+"""
+Concurrent pagination engine for scrapers.
+Fetches numbered pages of an API with several requests in flight and hands
+them to a consumer in page order.
+"""
+import asyncio
+
+from src.scrapers.core.logger import get_logger
+
+logger = get_logger(__name__)
+
+class PageFetcher:
+    """
+    Fetch pages ``start, start + 1, ...`` until the source runs out.
+    
+    ``fetch(page)`` does the request for one page number and returns a
+    ``(result, more)`` tuple, where ``more`` is False once there are no
+    pages after this one. It is a blocking function, typically a GET or
+    POST on a shared ``requests`` session whose connection pool keeps the
+    connections alive, and runs in worker threads, at most ``concurrency``
+    at a time.
+    
+    Results are passed to ``consume(page, result)`` strictly in page order,
+    in the event loop thread, so a sink can be written from it directly.
+    Consumption is the back-pressure: at most ``window`` pages are fetched
+    ahead of the last consumed page, so a slow sink pauses fetching instead
+    of buffering. ``consume`` returns False to stop early, e.g. on an
+    incremental stop.
+    """
+    
+    def __init__(self, fetch, consume, concurrency=4, max_requests=None, window=None):
+        """
+        Initialize the fetcher.
+        
+        Args:
+            fetch (callable): Function fetching one page, see above
+            consume (callable): Function receiving results in page order
+            concurrency (int): Maximum requests in flight for the source
+            max_requests (int): Request budget for the run (optional)
+            window (int): Maximum pages fetched ahead of the consumer,
+                defaults to twice the concurrency
+        """
+        self.fetch = fetch
+        self.consume = consume
+        self.concurrency = max(int(concurrency), 1)
+        self.max_requests = max_requests
+        self.window = max(window or self.concurrency * 2, self.concurrency)
+        
+        self.requests = 0
+        self.pages = 0
+        self.errors = 0
+    
+    def run(self, start=0):
+        """
+        Fetch and consume pages until the source or the budget runs out.
+        
+        Args:
+            start (int): First page number
+        
+        Returns:
+            int: Number of pages consumed
+        """
+        return asyncio.run(self._run(start))
+    
+    async def _run(self, start):
+        results = asyncio.Queue()
+        window = asyncio.Semaphore(self.window)
+        # First page after which nothing is consumed, set once it is known
+        self._last = None
+        self._next = start
+        
+        def issue():
+            if self._last is not None and self._next > self._last:
+                return None
+            if self.max_requests is not None and self.requests >= self.max_requests:
+                if self._last is None:
+                    logger.warning(f'Request budget of {self.max_requests} exhausted')
+                    self._last = self._next - 1
+                return None
+            page = self._next
+            self._next += 1
+            self.requests += 1
+            return page
+        
+        async def worker():
+            while True:
+                await window.acquire()
+                page = issue()
+                if page is None:
+                    window.release()
+                    return
+                try:
+                    result, more = await asyncio.to_thread(self.fetch, page)
+                except Exception as e:
+                    logger.error(f'Fetching page {page} failed, error: {e}')
+                    self.errors += 1
+                    result, more = None, False
+                if not more and (self._last is None or page < self._last):
+                    self._last = page
+                await results.put((page, result))
+        
+        workers = [asyncio.create_task(worker()) for _ in range(self.concurrency)]
+        done = asyncio.gather(*workers)
+        done.add_done_callback(lambda _: results.put_nowait(None))
+        
+        # Reorder completed pages and consume them in sequence
+        pending = {}
+        expected = start
+        while True:
+            item = await results.get()
+            if item is None:
+                break
+            pending[item[0]] = item[1]
+            while expected in pending:
+                result = pending.pop(expected)
+                window.release()
+                if self._last is not None and expected > self._last:
+                    expected += 1
+                    continue
+                if result is not None:
+                    self.pages += 1
+                    if self.consume(expected, result) is False:
+                        self._last = expected
+                expected += 1
+        
+        await done
+        logger.info(f'Fetched {self.pages} pages with {self.requests} requests ({self.errors} failed)')
+        return self.pages
@@ -0,0 +1,177 @@
+"""
+Adaptive request pacing for scrapers.
+Tunes the delay between requests to a source from how the source responds:
+backs off multiplicatively when it pushes back and recovers additively while
+it is healthy.
+"""
+import time
+import random
+import threading
+
+from src.scrapers.core.logger import get_logger
+
+logger = get_logger(__name__)
+
+# Statuses that mean the source wants us to slow down
+THROTTLE_STATUSES = (429, 503)
+
+class RateController:
+    """
+    AIMD controller of the delay between requests to one source.
+    
+    Every request outcome is passed to ``record``. Errors, throttling
+    statuses and responses much slower than usual multiply the delay by
+    ``backoff``; every healthy response takes ``recovery`` seconds off it.
+    The delay always stays between ``min_delay`` and ``max_delay``.
+    
+    Requests made through ``call`` must not be retried underneath, e.g. by
+    a urllib3 ``Retry`` on the session, or throttling never reaches the
+    controller; ``call`` retries throttled and failed responses itself,
+    after backing off.
+    
+    The controller is thread-safe, so concurrent fetchers of one source can
+    share it.
+    """
+    
+    def __init__(self, source, min_delay=1.0, max_delay=30.0, initial_delay=None, backoff=2.0, recovery=0.25,
+                 slow_factor=3.0, retries=0):
+        """
+        Initialize the controller.
+        
+        Args:
+            source (str): Source name, used in log messages
+            min_delay (float): Floor of the delay in seconds
+            max_delay (float): Ceiling of the delay in seconds
+            initial_delay (float): Starting delay, defaults to the floor
+            backoff (float): Factor the delay is multiplied by on pushback
+            recovery (float): Seconds taken off the delay per healthy response
+            slow_factor (float): Latency, relative to the running average,
+                that counts as pushback
+            retries (int): Times ``call`` repeats a request answered with a
+                throttling or 5xx status
+        """
+        self.source = source
+        self.min_delay = min_delay
+        self.max_delay = max_delay
+        self.backoff = backoff
+        self.recovery = recovery
+        self.slow_factor = slow_factor
+        self.retries = retries
+        self.delay = min(max(initial_delay if initial_delay is not None else min_delay, min_delay), max_delay)
+        # Running average of healthy response latencies
+        self.latency = None
+        self.backoffs = 0
+        
+        self._lock = threading.Lock()
+    
+    @classmethod
+    def from_config(cls, source):
+        """
+        Create the controller of a source from ``config.ini``.
+        
+        Reads ``rate_min_delay``, ``rate_max_delay``, ``rate_initial_delay``,
+        ``rate_backoff``, ``rate_recovery`` and ``rate_retries`` from the
+        source's section.
+        
+        Args:
+            source (str): Source name, also the config section
+        
+        Returns:
+            RateController: Configured controller
+        """
+        from src.config.config import config
+        
+        def setting(key, default):
+            return float(config.get_setting(source, f'rate_{key}', default))
+        
+        return cls(
+            source,
+            min_delay=setting('min_delay', '1.0'),
+            max_delay=setting('max_delay', '30.0'),
+            initial_delay=setting('initial_delay', '5.0'),
+            backoff=setting('backoff', '2.0'),
+            recovery=setting('recovery', '0.25'),
+            retries=int(setting('retries', '3')),
+        )
+    
+    def next_delay(self, scale=1.0):
+        """
+        Get the delay to wait before the next request, with some jitter.
+        
+        Args:
+            scale (float): Multiple of the current delay to wait, for steps
+                that need longer than a single request
+        
+        Returns:
+            float: Delay in seconds
+        """
+        return self.delay * scale * random.uniform(0.8, 1.2)
+    
+    def pause(self, scale=1.0):
+        """
+        Wait before the next request.
+        
+        Args:
+            scale (float): Multiple of the current delay to wait
+        """
+        time.sleep(self.next_delay(scale))
+    
+    def record(self, latency=None, status=None, error=False):
+        """
+        Record the outcome of a request and adjust the delay.
+        
+        Args:
+            latency (float): Seconds the request took (optional)
+            status (int): HTTP status of the response (optional)
+            error (bool): The request failed
+        """
+        with self._lock:
+            throttled = error or status in THROTTLE_STATUSES
+            slow = latency is not None and self.latency is not None and latency > self.latency * self.slow_factor
+            if latency is not None and not throttled:
+                self.latency = latency if self.latency is None else 0.8 * self.latency + 0.2 * latency
+            
+            if throttled or slow:
+                previous = self.delay
+                self.delay = min(self.delay * self.backoff, self.max_delay)
+                self.backoffs += 1
+                reason = f'status {status}' if status in THROTTLE_STATUSES else 'an error' if error else 'a slow response'
+                logger.info(f'{self.source}: backing off after {reason}, delay {previous:.2f}s -> {self.delay:.2f}s')
+                return
+            
+            self.delay = max(self.delay - self.recovery, self.min_delay)
+    
+    def call(self, request, *args, **kwargs):
+        """
+        Make a paced request and record its outcome.
+        
+        A response with a throttling or 5xx status is retried up to
+        ``retries`` times, each time after the backed off delay and any
+        ``Retry-After`` the source asked for.
+        
+        Args:
+            request (callable): Request function, e.g. ``session.get``,
+                returning a response with a ``status_code``
+            *args: Positional arguments for the request
+            **kwargs: Keyword arguments for the request
+        
+        Returns:
+            Response returned by the last attempt
+        """
+        for attempt in range(self.retries + 1):
+            self.pause()
+            start = time.monotonic()
+            try:
+                response = request(*args, **kwargs)
+            except Exception:
+                self.record(error=True)
+                raise
+            status = response.status_code
+            self.record(latency=time.monotonic() - start, status=status, error=status >= 500)
+            if attempt == self.retries or (status not in THROTTLE_STATUSES and status < 500):
+                return response
+            
+            retry_after = getattr(response, 'headers', {}).get('Retry-After', '')
+            if retry_after.isdigit():
+                time.sleep(min(float(retry_after), self.max_delay))
+            logger.info(f'{self.source}: retrying after status {status} ({attempt + 1}/{self.retries})')
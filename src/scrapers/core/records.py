@@ -0,0 +1,130 @@
+"""
+Typed job records for scrapers.
+Each source has a compact record type; sinks convert batches of records to
+rows or columns when they write them out.
+"""
+from dataclasses import dataclass
+from typing import ClassVar
+
+class JobRecord:
+    """
+    Base class for job records.
+    
+    Subclasses are slotted dataclasses that map each field to its output
+    column through ``COLUMNS``, in output order.
+    """
+    __slots__ = ()
+    
+    COLUMNS: ClassVar[dict] = {}
+    
+    @classmethod
+    def columns(cls):
+        """
+        Get the output columns of the record type.
+        
+        Returns:
+            list: Column names, in output order
+        """
+        return list(cls.COLUMNS.values())
+    
+    def to_row(self):
+        """
+        Convert the record to a row dictionary keyed by output column.
+        
+        Returns:
+            dict: Row
+        """
+        return {column: getattr(self, name) for name, column in self.COLUMNS.items()}
+
+@dataclass(slots=True)
+class JobRightRecord(JobRecord):
+    """A job from the JobRight feed."""
+    apply_link: str = ''
+    company_name: str = ''
+    published_time: str = ''
+    title: str = ''
+    employment_type: str = ''
+    remote: str = ''
+    seniority: str = ''
+    salary: str = ''
+    description: str = ''
+    industry: str = ''
+    tags: str = ''
+    responsibilities: str = ''
+    connection_name: str = ''
+    connection_company_name: str = ''
+    connection_job_title: str = ''
+    connection_linkedin_url: str = ''
+    
+    COLUMNS: ClassVar[dict] = {
+        'apply_link': 'Apply now',
+        'company_name': 'Company name',
+        'published_time': 'Published time',
+        'title': 'Title',
+        'employment_type': 'Type',
+        'remote': 'Remote',
+        'seniority': 'Seniority',
+        'salary': 'Salary',
+        'description': 'Description',
+        'industry': 'Inustry',
+        'tags': 'Tags',
+        'responsibilities': 'Responsibilities',
+        'connection_name': 'Connection name',
+        'connection_company_name': 'Connection company name',
+        'connection_job_title': 'Connection job title',
+        'connection_linkedin_url': 'Connection linkedin url',
+    }
+
+@dataclass(slots=True)
+class WellfoundRecord(JobRecord):
+    """A highlighted job listing of a Wellfound startup."""
+    company_name: str = ''
+    actively_hiring: str = ''
+    description: str = ''
+    company_size: str = ''
+    badges: str = ''
+    title: str = ''
+    location: str = ''
+    remote_options: str = ''
+    remote: str = ''
+    salary: str = ''
+    published_time: str = ''
+    website: str = ''
+    linkedin: str = ''
+    company_type: str = ''
+    company_markets: str = ''
+    startup_id: str = ''
+    
+    COLUMNS: ClassVar[dict] = {
+        'company_name': 'Company name',
+        'actively_hiring': 'Actively hiring',
+        'description': 'Description',
+        'company_size': 'Company size',
+        'badges': 'Badges',
+        'title': 'Title',
+        'location': 'Location',
+        'remote_options': 'Remote options',
+        'remote': 'Remote',
+        'salary': 'Salary',
+        'published_time': 'Published time',
+        'website': 'Website',
+        'linkedin': 'Linkedin',
+        'company_type': 'Company type',
+        'company_markets': 'Company markets',
+        'startup_id': 'Startup id',
+    }
+
+def records_to_columns(records):
+    """
+    Convert a batch of records of one type to columnar form.
+    
+    Args:
+        records (list): Records of the same type
+    
+    Returns:
+        dict: Mapping of output column to list of values
+    """
+    if not records:
+        return {}
+    fields = type(records[0]).COLUMNS
+    return {column: [getattr(record, name) for record in records] for name, column in fields.items()}
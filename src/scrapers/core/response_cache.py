@@ -0,0 +1,157 @@
+"""
+Response cache for scrapers.
+Keeps decoded API responses on disk between runs, so slowly changing data is
+only fetched again once it has expired.
+"""
+import os
+import json
+import time
+import hashlib
+import sqlite3
+import threading
+
+from src.scrapers.core.logger import get_logger
+
+logger = get_logger(__name__)
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS responses (
+    key TEXT PRIMARY KEY,
+    kind TEXT NOT NULL,
+    body BLOB NOT NULL,
+    size INTEGER NOT NULL,
+    stored_at REAL NOT NULL,
+    accessed_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_responses_accessed_at ON responses (accessed_at);
+"""
+
+def cache_key(operation, variables=None):
+    """
+    Get the content address of a request.
+    
+    Args:
+        operation (str): GraphQL operation or URL
+        variables (dict): Request variables (optional)
+    
+    Returns:
+        str: Hex digest identifying the request
+    """
+    identity = json.dumps([operation, variables or {}], sort_keys=True, separators=(',', ':'), default=str)
+    return hashlib.sha256(identity.encode('utf-8')).hexdigest()
+
+class ResponseCache:
+    """
+    Size-bounded, least recently used cache of responses in SQLite.
+    
+    Entries have a kind, e.g. 'overview', and expire after the TTL of their
+    kind. When the cache grows past ``max_bytes`` the least recently read
+    entries are evicted. ``hits`` and ``misses`` count lookups.
+    
+    The cache can be shared between threads.
+    """
+    
+    def __init__(self, db_path, ttls=None, max_bytes=256 * 1024 * 1024):
+        """
+        Open or create the cache.
+        
+        Args:
+            db_path (str): Path to the SQLite database file
+            ttls (dict): Seconds entries of each kind stay valid, kinds
+                without a TTL never expire
+            max_bytes (int): Maximum total size of the cached bodies
+        """
+        db_dir = os.path.dirname(db_path)
+        if db_dir and not os.path.exists(db_dir):
+            os.makedirs(db_dir)
+        
+        self.db_path = db_path
+        self.ttls = ttls or {}
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        
+        self._lock = threading.Lock()
+        self.conn = sqlite3.connect(db_path, check_same_thread=False)
+        self.conn.execute('PRAGMA journal_mode=WAL')
+        self.conn.execute('PRAGMA synchronous=NORMAL')
+        self.conn.executescript(SCHEMA)
+    
+    def get(self, kind, key):
+        """
+        Look up a response.
+        
+        Args:
+            kind (str): Kind of response
+            key (str): Content address, see ``cache_key``
+        
+        Returns:
+            Decoded response, or None if it is not cached or has expired
+        """
+        now = time.time()
+        with self._lock:
+            row = self.conn.execute('SELECT body, stored_at FROM responses WHERE key = ?', (key,)).fetchone()
+            ttl = self.ttls.get(kind)
+            if row is None or (ttl is not None and now - row[1] > ttl):
+                self.misses += 1
+                return None
+            with self.conn:
+                self.conn.execute('UPDATE responses SET accessed_at = ? WHERE key = ?', (now, key))
+            self.hits += 1
+        return json.loads(row[0])
+    
+    def put(self, kind, key, response):
+        """
+        Store a response, evicting old entries if the cache is full.
+        
+        Args:
+            kind (str): Kind of response
+            key (str): Content address, see ``cache_key``
+            response: JSON-serializable response
+        """
+        body = json.dumps(response, ensure_ascii=False).encode('utf-8')
+        now = time.time()
+        with self._lock, self.conn:
+            self.conn.execute(
+                'INSERT OR REPLACE INTO responses (key, kind, body, size, stored_at, accessed_at) VALUES (?, ?, ?, ?, ?, ?)',
+                (key, kind, body, len(body), now, now),
+            )
+            self._evict()
+    
+    def _evict(self):
+        total = self.conn.execute('SELECT COALESCE(SUM(size), 0) FROM responses').fetchone()[0]
+        if total <= self.max_bytes:
+            return
+        evicted = 0
+        for key, size in self.conn.execute('SELECT key, size FROM responses ORDER BY accessed_at').fetchall():
+            if total <= self.max_bytes:
+                break
+            self.conn.execute('DELETE FROM responses WHERE key = ?', (key,))
+            total -= size
+            evicted += 1
+        logger.info(f'Evicted {evicted} cached responses')
+    
+    def purge_expired(self):
+        """
+        Delete expired entries.
+        
+        Returns:
+            int: Number of entries deleted
+        """
+        now = time.time()
+        deleted = 0
+        with self._lock, self.conn:
+            for kind, ttl in self.ttls.items():
+                cursor = self.conn.execute('DELETE FROM responses WHERE kind = ? AND stored_at < ?', (kind, now - ttl))
+                deleted += cursor.rowcount
+        return deleted
+    
+    def __len__(self):
+        with self._lock:
+            return self.conn.execute('SELECT COUNT(*) FROM responses').fetchone()[0]
+    
+    def close(self):
+        """Close the database connection."""
+        with self._lock:
+            self.conn.close()
+        logger.info(f'Response cache: {self.hits} hits, {self.misses} misses')
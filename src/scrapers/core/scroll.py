@@ -0,0 +1,110 @@
+"""
+Infinite scroll driver for scrapers.
+Advances a lazily loaded list from inside the page, so every step costs the
+same however many items the list has loaded.
+"""
+from src.scrapers.core.logger import get_logger
+
+logger = get_logger(__name__)
+
+# Installs the scroll state on the page; a MutationObserver counts the items
+# appended to the list, so nothing has to count them from Python
+INSTALL_SCRIPT = """
+const list = document.querySelector(arguments[0]);
+if (!list) return false;
+const state = {list: list, total: list.childElementCount, removed: 0};
+new MutationObserver(records => {
+    for (const record of records) {
+        for (const node of record.addedNodes) {
+            if (node.nodeType === Node.ELEMENT_NODE) state.total += 1;
+        }
+    }
+}).observe(list, {childList: true});
+window.__feedScroller = state;
+return true;
+"""
+
+# Scrolls the last item, the sentinel, into view after removing all but the
+# newest arguments[1] items if arguments[0] is set; null if the list was replaced
+ADVANCE_SCRIPT = """
+const state = window.__feedScroller;
+if (!state || !state.list.isConnected) return null;
+const list = state.list;
+if (arguments[0]) {
+    while (list.childElementCount > arguments[1]) {
+        list.firstElementChild.remove();
+        state.removed += 1;
+    }
+}
+const last = list.lastElementChild;
+if (last) last.scrollIntoView({behavior: 'smooth', block: 'center'});
+return {total: state.total, loaded: list.childElementCount, removed: state.removed};
+"""
+
+class FeedScroller:
+    """
+    Scroll an infinite list by its last item without reading the list into Python.
+    
+    Each ``advance`` runs one short script that scrolls the last item into
+    view and returns a few counters, instead of fetching every loaded item
+    to find the last one. ``total`` counts the items appended since the
+    list was found, ``loaded`` the items currently in the DOM.
+    
+    With ``prune`` the oldest items are removed from the DOM so at most
+    ``keep`` stay loaded, which keeps browser memory and layout cost flat;
+    only use it when the data comes from captured responses, not from the
+    page. Pruning is experimental: the removed nodes belong to the page's
+    framework (React renders JobRight's ``ul.ant-list-items``), which still
+    expects them, so a later re-render of the list can fail with a
+    ``NotFoundError`` from ``removeChild`` or ``insertBefore`` and break
+    the page.
+    """
+    
+    def __init__(self, driver, list_selector, prune=False, keep=100):
+        """
+        Initialize the scroller.
+        
+        Args:
+            driver: WebDriver instance
+            list_selector (str): CSS selector of the list element
+            prune (bool): Remove items that have scrolled out of view,
+                experimental, see above
+            keep (int): Newest items to keep when pruning
+        """
+        self.driver = driver
+        self.list_selector = list_selector
+        self.prune = prune
+        self.keep = keep
+        self.total = 0
+        self.loaded = 0
+        self.removed = 0
+    
+    def install(self):
+        """
+        Attach the scroll state to the list on the current page.
+        
+        Returns:
+            bool: True if the list was found
+        """
+        return bool(self.driver.execute_script(INSTALL_SCRIPT, self.list_selector))
+    
+    def advance(self):
+        """
+        Scroll to the last loaded item, pruning older ones if enabled.
+        
+        The state is installed again if the page replaced the list.
+        
+        Returns:
+            int: Items appended to the list since it was installed, None if
+                the list is not on the page
+        """
+        stats = self.driver.execute_script(ADVANCE_SCRIPT, self.prune, self.keep)
+        if stats is None:
+            if not self.install():
+                logger.warning(f'List {self.list_selector} not found, cannot scroll')
+                return None
+            stats = self.driver.execute_script(ADVANCE_SCRIPT, self.prune, self.keep)
+        self.total = stats['total']
+        self.loaded = stats['loaded']
+        self.removed = stats['removed']
+        return self.total
@@ -0,0 +1,144 @@
+"""
+Session store for scrapers.
+Keeps the cookies, local storage and Chrome profile of a logged in account
+between runs, so a scraper can restore its session instead of logging in.
+"""
+import os
+import json
+import time
+import shutil
+import hashlib
+
+from src.scrapers.core.logger import get_logger
+
+logger = get_logger(__name__)
+
+def cookie_expired(cookie, now=None):
+    """
+    Check whether a saved cookie has expired.
+    
+    Args:
+        cookie (dict): Cookie as returned by WebDriver (``expiry``) or
+            DevTools (``expires``, -1 for session cookies)
+        now (float): Current time (optional)
+    
+    Returns:
+        bool: True if the cookie has expired
+    """
+    expiry = cookie.get('expiry', cookie.get('expires'))
+    if expiry is None or expiry < 0:
+        return False
+    return expiry <= (now if now is not None else time.time())
+
+class SessionStore:
+    """
+    Saved login session of one account on one source.
+    
+    Sessions live in ``<root>/<source>/<account hash>/``: ``session.json``
+    holds the cookies and local storage, ``profile/`` can be used as the
+    browser's user data directory. The account name is hashed so it does
+    not appear in paths; the session file is only readable by its owner.
+    """
+    
+    def __init__(self, root, source, account, max_age=7 * 24 * 3600):
+        """
+        Initialize the store.
+        
+        Args:
+            root (str): Directory holding the sessions of every source
+            source (str): Source name, e.g. 'jobright'
+            account (str): Account the session belongs to, e.g. the username
+            max_age (float): Seconds after which a saved session is not restored
+        """
+        self.source = source
+        self.max_age = max_age
+        account_id = hashlib.sha256(account.encode('utf-8')).hexdigest()[:16]
+        self.path = os.path.join(root, source, account_id)
+        self.session_file = os.path.join(self.path, 'session.json')
+    
+    @property
+    def profile_dir(self):
+        """Chrome user data directory of the account, created on first use."""
+        profile_dir = os.path.join(self.path, 'profile')
+        os.makedirs(profile_dir, exist_ok=True)
+        return profile_dir
+    
+    def load(self):
+        """
+        Get the saved session if it is recent enough to restore.
+        
+        Cookies that have expired since the session was saved are left out.
+        
+        Returns:
+            dict: ``{'cookies': [...], 'local_storage': {...}, 'saved_at': ...}``
+                or None if there is no usable session
+        """
+        try:
+            with open(self.session_file, 'r', encoding='utf-8') as f:
+                session = json.load(f)
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError) as e:
+            logger.warning(f'Cannot read saved {self.source} session: {e}')
+            return None
+        
+        age = time.time() - session.get('saved_at', 0)
+        if age > self.max_age:
+            logger.info(f'Saved {self.source} session is {age / 3600:.0f}h old, logging in again')
+            return None
+        
+        session['cookies'] = [c for c in session.get('cookies', []) if not cookie_expired(c)]
+        if not session['cookies']:
+            logger.info(f'Saved {self.source} session has no unexpired cookies')
+            return None
+        session.setdefault('local_storage', {})
+        return session
+    
+    def save(self, cookies, local_storage=None):
+        """
+        Save the session after a successful login.
+        
+        Args:
+            cookies (list): Cookies of the logged in browser
+            local_storage (dict): Local storage of the logged in site (optional)
+        """
+        os.makedirs(self.path, exist_ok=True)
+        session = {'cookies': cookies, 'local_storage': local_storage or {}, 'saved_at': time.time()}
+        temp_file = self.session_file + '.tmp'
+        fd = os.open(temp_file, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        with os.fdopen(fd, 'w', encoding='utf-8') as f:
+            json.dump(session, f)
+        os.replace(temp_file, self.session_file)
+        logger.info(f'Saved {self.source} session with {len(cookies)} cookies')
+    
+    def clear(self, profile=False):
+        """
+        Forget the saved session, e.g. after it failed to restore.
+        
+        Args:
+            profile (bool): Also delete the Chrome profile
+        """
+        if os.path.exists(self.session_file):
+            os.remove(self.session_file)
+        if profile:
+            shutil.rmtree(os.path.join(self.path, 'profile'), ignore_errors=True)
+
+def session_store(source, account):
+    """
+    Create the session store of an account from ``config.ini``.
+    
+    Reads ``session_dir`` and ``session_max_age`` from the general section.
+    
+    Args:
+        source (str): Source name
+        account (str): Account the session belongs to
+    
+    Returns:
+        SessionStore: Store of the account's session
+    """
+    from src.config.config import config
+    
+    project_root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+    root = config.get_setting('general', 'session_dir', os.path.join(project_root, 'sessions'))
+    max_age = float(config.get_setting('general', 'session_max_age', '604800'))
+    return SessionStore(root, source, account, max_age=max_age)
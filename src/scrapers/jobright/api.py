@@ -0,0 +1,121 @@
+"""
+JobRight API pagination.
+Pages through the /list/jobs endpoint with an authenticated HTTP session
+instead of scrolling the feed in the browser.
+"""
+from urllib.parse import urlsplit, urlunsplit, parse_qsl, urlencode
+
+from src.scrapers.core.logger import get_logger
+from src.scrapers.core.json_backend import loads
+from src.scrapers.core.pagination import PageFetcher
+
+logger = get_logger(__name__)
+
+def page_url(url, param, position):
+    """
+    Set the pagination parameter of a /list/jobs URL.
+    
+    Args:
+        url (str): URL of a captured /list/jobs request
+        param (str): Name of the offset query parameter
+        position (int): Offset of the first job to return
+    
+    Returns:
+        str: URL of the requested page
+    """
+    parts = urlsplit(url)
+    query = dict(parse_qsl(parts.query, keep_blank_values=True))
+    query[param] = str(position)
+    return urlunsplit(parts._replace(query=urlencode(query)))
+
+def job_count(body):
+    """
+    Count the jobs of a decoded /list/jobs response.
+    
+    Args:
+        body (dict): Decoded response
+    
+    Returns:
+        int: Number of jobs on the page
+    """
+    return len((body.get('result') or {}).get('jobList') or [])
+
+def iter_job_pages(session, first_url, first_body, param='position', rate=None, max_pages=1000, timeout=30):
+    """
+    Fetch the pages following a captured /list/jobs response.
+    
+    The offset of each page is the previous offset plus the number of jobs
+    the previous page returned. Paging stops at the first empty page.
+    
+    Args:
+        session (requests.Session): Authenticated session
+        first_url (str): URL of the captured first page
+        first_body (str or dict): Body of the captured first page
+        param (str): Name of the offset query parameter
+        rate (RateController): Paces the requests (optional)
+        max_pages (int): Maximum number of pages to fetch
+        timeout (float): Request timeout in seconds
+    
+    Yields:
+        tuple: (url, decoded body) of each non-empty page
+    """
+    if isinstance(first_body, (str, bytes)):
+        first_body = loads(first_body)
+    query = dict(parse_qsl(urlsplit(first_url).query))
+    position = int(query.get(param) or 0) + job_count(first_body)
+    
+    for _ in range(max_pages):
+        url = page_url(first_url, param, position)
+        response = rate.call(session.get, url, timeout=timeout) if rate else session.get(url, timeout=timeout)
+        if response.status_code != 200:
+            logger.error(f'Request to {url} returned status {response.status_code}, stopping.')
+            return
+        
+        body = loads(response.content)
+        count = job_count(body)
+        if not count:
+            logger.info(f'No more jobs after position {position}, extraction completed.')
+            return
+        yield url, body
+        position += count
+
+def job_page_fetcher(session, first_url, first_body, consume, param='position', concurrency=4, max_requests=None, timeout=30,
+                     rate=None):
+    """
+    Build a concurrent fetcher for the pages following a captured response.
+    
+    Pages are addressed by offset, so the page size is taken from the
+    captured first page and page ``n`` starts ``n + 1`` page sizes after it.
+    A page shorter than that is the last one.
+    
+    Args:
+        session (requests.Session): Authenticated session
+        first_url (str): URL of the captured first page
+        first_body (str or dict): Body of the captured first page
+        consume (callable): Called with (url, decoded body) of each non-empty
+            page in feed order, returns False to stop
+        param (str): Name of the offset query parameter
+        concurrency (int): Maximum requests in flight
+        max_requests (int): Request budget (optional)
+        timeout (float): Request timeout in seconds
+        rate (RateController): Paces the requests of each worker (optional)
+    
+    Returns:
+        PageFetcher: Fetcher to ``run()``, or None if the first page is empty
+    """
+    if isinstance(first_body, (str, bytes)):
+        first_body = loads(first_body)
+    page_size = job_count(first_body)
+    if not page_size:
+        return None
+    first_position = int(dict(parse_qsl(urlsplit(first_url).query)).get(param) or 0)
+    
+    def fetch(page):
+        url = page_url(first_url, param, first_position + (page + 1) * page_size)
+        response = rate.call(session.get, url, timeout=timeout) if rate else session.get(url, timeout=timeout)
+        response.raise_for_status()
+        body = loads(response.content)
+        count = job_count(body)
+        return ((url, body) if count else None), count >= page_size
+    
+    return PageFetcher(fetch, lambda page, result: consume(*result), concurrency=concurrency, max_requests=max_requests)
@@ -0,0 +1,94 @@
+"""
+JobRight response parsing.
+Turns /list/jobs response bodies into columnar batches of jobs.
+"""
+from src.scrapers.core.json_backend import loads
+from src.scrapers.core.records import JobRightRecord
+
+# Scalar output columns and the jobResult fields they come from
+JOB_FIELDS = {
+    'Apply now': 'applyLink',
+    'Published time': 'publishTimeDesc',
+    'Title': 'jobTitle',
+    'Type': 'employmentType',
+    'Remote': 'workModel',
+    'Seniority': 'jobSeniority',
+    'Salary': 'salaryDesc',
+    'Description': 'jobSummary',
+}
+
+# Fields of the first social connection and their output columns
+CONNECTION_FIELDS = {
+    'Connection name': 'fullName',
+    'Connection company name': 'companyName',
+    'Connection job title': 'jobTitle',
+    'Connection linkedin url': 'linkedinUrl',
+}
+
+def parse_job_list(body):
+    """
+    Parse a whole /list/jobs response into a columnar batch.
+    
+    Each output column is built in one pass over the page, including the
+    joins of the list fields, so no per-job dict or record is created.
+    The result can be passed to any sink as-is.
+    
+    Args:
+        body: Response body, as a JSON string or an already decoded dict
+        
+    Returns:
+        dict: Mapping of JobRight output column to list of values
+    """
+    if isinstance(body, (str, bytes)):
+        body = loads(body)
+    
+    job_list = (body.get('result') or {}).get('jobList') or []
+    jobs = [item.get('jobResult') or {} for item in job_list]
+    connections = [(job.get('socialConnections') or [{}])[0] for job in jobs]
+    
+    batch = {column: [job.get(field) or '' for job in jobs] for column, field in JOB_FIELDS.items()}
+    batch['Company name'] = [(item.get('companyResult') or {}).get('companyName') or '' for item in job_list]
+    batch['Inustry'] = [
+        ';'.join([x.get('displayName', '') for x in (job.get('industryMatchingScores') or [])[:2]])
+        for job in jobs
+    ]
+    batch['Tags'] = [';'.join(job.get('recommendationTags') or []) for job in jobs]
+    batch['Responsibilities'] = [';'.join(job.get('coreResponsibilities') or []) for job in jobs]
+    for column, field in CONNECTION_FIELDS.items():
+        batch[column] = [connection.get(field) or '' for connection in connections]
+    
+    return {column: batch[column] for column in JobRightRecord.columns()}
+
+def job_to_record(item):
+    """
+    Parse a single jobList entry into a record.
+    
+    This is the row-at-a-time equivalent of ``parse_job_list``.
+    
+    Args:
+        item (dict): Entry of ``result.jobList``
+        
+    Returns:
+        JobRightRecord: Parsed job
+    """
+    job_set = item['jobResult']
+    connections = job_set.get('socialConnections') or []
+    connection = connections[0] if connections else {}
+    return JobRightRecord(
+        apply_link=job_set.get('applyLink', ''),
+        company_name=item['companyResult'].get('companyName', ''),
+        published_time=job_set.get('publishTimeDesc', ''),
+        title=job_set.get('jobTitle', ''),
+        employment_type=job_set.get('employmentType', ''),
+        remote=job_set.get('workModel', ''),
+        seniority=job_set.get('jobSeniority', ''),
+        salary=job_set.get('salaryDesc', ''),
+        description=job_set.get('jobSummary', ''),
+        industry=';'.join([x.get('displayName', '') for x in (job_set.get('industryMatchingScores') or [])[:2]]),
+        tags=';'.join(job_set.get('recommendationTags') or []),
+        responsibilities=';'.join(job_set.get('coreResponsibilities') or []),
+        connection_name=connection.get('fullName', ''),
+        connection_company_name=connection.get('companyName', ''),
+        connection_job_title=connection.get('jobTitle', ''),
+        connection_linkedin_url=connection.get('linkedinUrl', ''),
+    )
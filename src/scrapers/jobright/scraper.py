@@ -1,27 +1,18 @@
 """
 JobRight scraper implementation.
 """
-import json
 import logging
 import os
 import sys
 import time
 import pandas as pd
-import undetected_chromedriver as uc
 
 from datetime import datetime
-from selenium import webdriver
-from selenium.webdriver.chrome.service import Service
-from selenium.webdriver.common.desired_capabilities import DesiredCapabilities
-from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.common.by import By
 from selenium.webdriver.common.action_chains import ActionChains
 from selenium.webdriver.common.keys import Keys
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
-from selenium.webdriver.chrome.service import Service
-from webdriver_manager.chrome import ChromeDriverManager
-from webdriver_manager.core.os_manager import OperationSystemManager,ChromeType
 
 # Setup path for importing project modules
 project_root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
@@ -29,17 +20,60 @@ sys.path.append(project_root)
 
 # Import core utilities
 from src.scrapers.core.logger import get_logger
-from src.scrapers.core.data_handler import save_to_excel
+from src.scrapers.core.data_handler import create_job_sink
+from src.scrapers.core.dedup import SeenIndex, IncrementalStop
+from src.scrapers.core.job_store import jobright_job_key
+from src.scrapers.core.cdp_capture import ResponseCapture
+from src.scrapers.core.http_session import session_from_driver
+from src.scrapers.core.rate_control import RateController
+from src.scrapers.core.session_store import session_store
+from src.scrapers.core.scroll import FeedScroller
+from src.scrapers.core.browser import start_browser, stop_browser, block_resources, blocked_url_patterns
+from src.scrapers.jobright.parser import parse_job_list
+from src.scrapers.jobright.api import iter_job_pages, job_page_fetcher
 from src.config.config import config
 
 # Paths and constants
 BASE_DIR = os.path.dirname(os.path.realpath(__file__))
 LOG_FILE = os.path.join(BASE_DIR, 'jobright_logs.log')
 OUTPUT_FILE = os.path.join(project_root, 'output', f'jobright_results_{datetime.now().strftime("%Y-%m-%d-%H-%M")}.xlsx')
+# Extra keyword arguments for create_job_sink (formats, fsync policy, ...)
+OUTPUT_OPTIONS = {}
+# Skip jobs already scraped by a previous run
+SKIP_SEEN = False
+# Stop scrolling once the feed reaches jobs scraped by a previous run
+INCREMENTAL = False
+# Page through the /list/jobs API after login instead of scrolling the feed
+API_MODE = False
+# Pool to lease the browser from instead of starting one (optional)
+BROWSER_POOL = None
+# Restore the session of the last login instead of logging in again
+REUSE_SESSION = False
+# Block images, fonts, media and analytics scripts
+DATA_ONLY = False
+# Remove job cards from the page once they have scrolled out of view
+PRUNE_FEED = False
+
+# Feed entries, visible once logged in
+JOB_LIST = (By.XPATH, '//ul[@class="ant-list-items"]/div')
+# Sign in button, visible while logged out
+SIGN_IN = (By.XPATH, '//*[text()="SIGN IN"]')
+
+# Extra Chrome arguments for better compatibility, --dns-prefetch-disable
+# works around DNS issues
+CHROME_ARGUMENTS = ['--disable-dev-shm-usage', '--no-sandbox', '--disable-gpu', '--dns-prefetch-disable']
 
 # Get logger with core utility
 logger = get_logger(__name__, log_dir=os.path.join(project_root, 'logs'))
 
+# Batch writer, seen-job index and incremental stop condition for the
+# current run, opened in collect_data()
+job_sink = None
+seen_index = None
+incremental_stop = None
+# Pacing of page loads and API requests, opened in collect_data()
+rate = None
+
 def get_creds():
     """
     Get credentials from credentials file.
@@ -69,98 +103,6 @@ def get_creds():
         logger.error(f'Cannot get credentials, error: {e}')
         sys.exit()
 
-def start_browser():
-    """
-    Start and configure Chrome browser.
-    
-    Returns:
-        WebDriver: Configured Chrome browser instance
-    """
-    try:
-        chrome_options = uc.ChromeOptions()
-        #chrome_options.add_argument(f"--user-data-dir=/Users/max/wk/jobright/tst_profile")
-        chrome_options.set_capability('goog:loggingPrefs', {'performance': 'ALL'})
-        capabilities = DesiredCapabilities.CHROME
-        capabilities['goog:loggingPrefs'] = {'performance': 'ALL'}
-        
-        # Add common options for better compatibility
-        chrome_options.add_argument('--disable-dev-shm-usage')
-        chrome_options.add_argument('--no-sandbox')
-        chrome_options.add_argument('--disable-gpu')
-        # Attempt to fix DNS issues
-        chrome_options.add_argument('--dns-prefetch-disable')
-        
-        # Check if we're running in WSL or Linux
-        is_wsl = 'WSL' in os.uname().release if hasattr(os, 'uname') else False
-        is_linux = sys.platform.startswith('linux')
-        
-        # For cloud deployment, you might want to run in headless mode
-        # Uncomment the line below for headless mode on cloud deployment
-        # chrome_options.add_argument('--headless')
-        
-        if is_wsl or is_linux:
-            logger.info('Running in WSL/Linux environment - setting up Chrome accordingly')
-            # For Linux/WSL environments, we need to specify the Chrome binary location
-            # Check if Chrome is installed and use the appropriate path
-            chrome_paths = [
-                '/usr/bin/google-chrome-stable',  # Ubuntu/Debian
-                '/usr/bin/google-chrome',        # Alternative
-                '/usr/bin/chromium-browser',     # Chromium alternative
-            ]
-            
-            chrome_binary = None
-            for path in chrome_paths:
-                if os.path.exists(path):
-                    chrome_binary = path
-                    break
-                    
-            if chrome_binary:
-                logger.info(f'Found Chrome binary at: {chrome_binary}')
-                chrome_options.binary_location = chrome_binary
-            else:
-                logger.warning('Chrome binary not found in common locations. You may need to install Chrome.')
-                
-            try:
-                # Try with undetected_chromedriver
-                driver = uc.Chrome(options=chrome_options, desired_capabilities=capabilities)
-            except Exception as inner_e:
-                logger.warning(f'Failed to initialize undetected_chromedriver: {inner_e}')
-                logger.info('Trying alternative approach with regular selenium...')
-                
-                # Alternative approach with regular selenium
-                from selenium.webdriver.chrome.service import Service
-                from webdriver_manager.chrome import ChromeDriverManager
-                
-                service = Service(ChromeDriverManager().install())
-                driver = webdriver.Chrome(service=service, options=chrome_options)
-        else:
-            # Windows environment - proceed with version detection
-            browser_version = OperationSystemManager().get_browser_version_from_os(ChromeType.GOOGLE)
-            if browser_version is None:
-                # If browser version can't be detected, use a default version or None
-                logger.warning('Unable to detect Chrome browser version. Using default settings.')
-                driver = uc.Chrome(options=chrome_options, desired_capabilities=capabilities)
-            else:
-                version_main = int(browser_version.split('.')[0])
-                driver = uc.Chrome(options=chrome_options, desired_capabilities=capabilities, version_main=version_main)
-        logger.info('Browser sucessfully started')
-        return driver
-    except Exception as e:
-        logger.error(f'Cannot start browser, error: {e}')
-        sys.exit()
-
-def stop_browser(driver):
-    """
-    Stop the browser.
-    
-    Args:
-        driver: WebDriver instance to stop
-    """
-    try:
-        driver.quit()
-    except Exception as e:
-        pass
-    
 def check_popups(driver):
     """
     Check for popups and close them.
@@ -168,7 +110,7 @@ def check_popups(driver):
     Args:
         driver: WebDriver instance
     """
-    time.sleep(5)
+    rate.pause()
     popup_close_buttons = driver.find_elements(By.XPATH, '//button[@aria-label="Close"]')
     if popup_close_buttons:
         logger.info('Popup was found, trying to cloae it...')
@@ -183,74 +125,69 @@ def check_popups(driver):
 
 def save_result(data):
     """
-    Save data to Excel file.
+    Queue job data for writing to the output file(s).
     
     Args:
-        data: Dictionary of job data to save
+        data: Columnar batch (or record) of job data to save
     """
     try:
-        # Use core data handler utility to save data
-        save_to_excel(data, output_file=OUTPUT_FILE, prefix='jobright_results')
+        # Rows are buffered by the sink and written out on close
+        job_sink.write(data)
     except Exception as e:
         logger.error(f'Something went wrong during writing to file, error: {e}')
 
-def capture_responses(driver):
+def save_page(body, url):
+    """
+    Parse one /list/jobs response and queue its jobs for writing.
+    
+    Args:
+        body (str): Response body
+        url (str): Response URL, used in log messages
+    """
+    try:
+        batch = parse_job_list(body)
+        keys = [jobright_job_key(link) for link in batch['Apply now']]
+        
+        # Drop jobs scraped by a previous run before anything is written
+        if seen_index is not None:
+            keep = [not (key and seen_index.seen(key)) for key in keys]
+            if incremental_stop is not None:
+                incremental_stop.observe(len(keep), keep.count(False))
+            batch = {column: [v for v, k in zip(values, keep) if k] for column, values in batch.items()}
+            keys = [key for key, k in zip(keys, keep) if k]
+        
+        if keys:
+            save_result(batch)
+            if seen_index is not None:
+                for key in filter(None, keys):
+                    seen_index.add(key)
+    except Exception as e:
+        logger.error(f'Something went wrong during collecting of data from {url}, error: {e}')
+
+def capture_responses(capture):
     """
     Capture job data from network responses.
     
+    Waits only until the /list/jobs responses triggered by the last action
+    have finished loading, up to the configured capture timeout.
+    
     Args:
-        driver: WebDriver instance
+        capture (ResponseCapture): Capture attached to the browser
+        
+    Returns:
+        list: (url, body) tuples of the captured responses, empty if none arrived
     """
+    timeout = float(config.get_setting('jobright', 'capture_timeout', '10'))
+    responses = []
     for n in range(1,6):
         try:
-            time.sleep(5)
-            responses = {}
-            for entry in driver.get_log('performance'):
-                message = json.loads(entry['message'])['message']
-                if message['method'] == 'Network.responseReceived':
-                    request_id = message['params']['requestId']
-                    url = message['params']['response']['url']
-                    if '/list/jobs' in url:
-                        logger.info(f'Collecting data from {url} ...')
-                        responses[request_id] = {"url": url}
-
-                        response_body = driver.execute_cdp_cmd(
-                            "Network.getResponseBody", {"requestId": request_id}
-                        )
-                        responses[request_id]["body"] = response_body.get("body", "")
-                        #print(len(json.loads(responses[request_id]['body'])['result']['jobList']))
-                        #print(json.loads(responses[request_id]['body'])['result'].keys())
-
-                        for ii in json.loads(responses[request_id]['body'])['result']['jobList']:
-                            #print(ii)
-                            #print(ii.keys())
-                            
-                            job_set = ii['jobResult']
-                            
-                            #print(job_set)
-                            #print(job_set.keys())
-                            try:
-                                data = {
-                                    'Apply now': [job_set.get('applyLink', '')],
-                                    'Company name': [ii['companyResult'].get('companyName', '')],
-                                    'Published time': [job_set.get('publishTimeDesc', '')],
-                                    'Title': [job_set.get('jobTitle', '')],
-                                    'Type': [job_set.get('employmentType', '')],
-                                    'Remote': [job_set.get('workModel', '')],
-                                    'Seniority': [job_set.get('jobSeniority', '')],
-                                    'Salary': [job_set.get('salaryDesc', '')],
-                                    'Description': [job_set.get('jobSummary', '')],
-                                    'Inustry': [';'.join([x.get('displayName', '') for x in job_set['industryMatchingScores'][:2]])],
-                                    'Tags': [';'.join(job_set.get('recommendationTags', ''))],
-                                    'Responsibilities': [';'.join(job_set.get('coreResponsibilities', ''))],
-                                    'Connection name': [job_set['socialConnections'][0].get('fullName', '') if job_set['socialConnections'] else ''],
-                                    'Connection company name': [job_set['socialConnections'][0].get('companyName', '') if job_set['socialConnections'] else ''],
-                                    'Connection job title': [job_set['socialConnections'][0].get('jobTitle', '') if job_set['socialConnections'] else ''],
-                                    'Connection linkedin url': [job_set['socialConnections'][0].get('linkedinUrl', '') if job_set['socialConnections'] else ''],
-                                    }
-                                save_result(data)
-                            except Exception as e:
-                                logger.error(f'Something went wrong during collecting of data from {url}, error: {e}')
+            start = time.monotonic()
+            responses = capture.wait(timeout=timeout)
+            if responses:
+                rate.record(latency=time.monotonic() - start)
+            for url, body in responses:
+                logger.info(f'Collecting data from {url} ...')
+                save_page(body, url)
             break
         except Exception as e:
             logger.error(f'Something went wrong during collecting of data, error: {e}')
@@ -258,61 +195,229 @@ def capture_responses(driver):
     
     if responses:
         logger.info(f'Some results found, trying to move to next page ...')
-        return True            
     else:
         logger.info(f'No new results detected after attempt to move to next page, extraction completed.')
+    return responses
+
+def open_browser(user_data_dir=None):
+    """
+    Lease a browser from BROWSER_POOL, or start one if there is no pool.
+    
+    Args:
+        user_data_dir (str): Chrome profile for a started browser (optional),
+            pooled browsers keep their own
+    
+    Returns:
+        WebDriver: Browser instance
+    """
+    if BROWSER_POOL is None:
+        return start_browser(user_data_dir=user_data_dir, data_only=DATA_ONLY, arguments=CHROME_ARGUMENTS)
+    driver = BROWSER_POOL.lease()
+    if DATA_ONLY:
+        block_resources(driver, blocked_url_patterns())
+    # Drop performance log entries of the previous lease
+    driver.get_log('performance')
+    return driver
+
+def close_browser(driver):
+    """
+    Return a leased browser to BROWSER_POOL, or stop it if there is no pool.
+    
+    The session is always cleared, the scraper logs in on every run.
+    
+    Args:
+        driver: Browser returned by open_browser
+    """
+    if BROWSER_POOL is None:
+        stop_browser(driver)
+    else:
+        BROWSER_POOL.release(driver, reset='clear')
+
+def restore_session(driver, store):
+    """
+    Restore the saved session of the account and check that it is still logged in.
+    
+    The check only waits for either the jobs feed or the sign in button on
+    the current page, so a stale session costs a few seconds at most
+    before the full login runs.
+    
+    Args:
+        driver: WebDriver instance on https://jobright.ai/
+        store (SessionStore): Session store of the account (optional)
+    
+    Returns:
+        bool: True if the browser is logged in
+    """
+    session = store.load() if store is not None else None
+    if session is None:
         return False
     
+    logger.info(f'Restoring the session saved at {datetime.fromtimestamp(session["saved_at"]):%Y-%m-%d %H:%M} ...')
+    for cookie in session['cookies']:
+        try:
+            driver.add_cookie(cookie)
+        except Exception as e:
+            logger.warning(f'Cannot restore cookie {cookie.get("name")}: {e}')
+    driver.execute_script(
+        'for (const [k, v] of Object.entries(arguments[0])) window.localStorage.setItem(k, v);',
+        session['local_storage'],
+    )
+    driver.refresh()
+    
+    timeout = float(config.get_setting('jobright', 'session_check_timeout', '10'))
+    try:
+        WebDriverWait(driver, timeout).until(EC.any_of(
+            EC.visibility_of_element_located(JOB_LIST), EC.visibility_of_element_located(SIGN_IN)
+        ))
+        if driver.find_elements(*JOB_LIST):
+            logger.info('Restored session is logged in, skipping login')
+            return True
+    except Exception as e:
+        logger.warning(f'Cannot check restored session: {e}')
+    
+    logger.info('Restored session is logged out, logging in again')
+    store.clear()
+    driver.delete_all_cookies()
+    driver.get('https://jobright.ai/')
+    return False
+
+def save_session(driver, store):
+    """
+    Save the session of the logged in browser for the next run.
+    
+    Args:
+        driver: WebDriver instance of the logged in browser
+        store (SessionStore): Session store of the account
+    """
+    try:
+        local_storage = driver.execute_script('return Object.assign({}, window.localStorage);')
+        store.save(driver.get_cookies(), local_storage)
+    except Exception as e:
+        logger.warning(f'Cannot save session: {e}')
+
+def collect_from_api(driver, first_url, first_body):
+    """
+    Page through the /list/jobs API with the browser's session.
+    
+    The browser is closed as soon as its cookies have been copied, also if
+    copying them fails.
+    
+    Args:
+        driver: WebDriver instance of the logged in browser
+        first_url (str): URL of the captured first page
+        first_body (str): Body of the captured first page
+    """
+    param = config.get_setting('jobright', 'api_page_param', 'position')
+    concurrency = int(config.get_setting('jobright', 'api_concurrency', '4'))
+    max_requests = int(config.get_setting('jobright', 'api_max_requests', '500'))
+    
+    try:
+        session = session_from_driver(driver, pool_size=concurrency, paced=True)
+    finally:
+        logger.info(f'Closing the browser, paging through the API ...')
+        close_browser(driver)
+    
+    def consume(url, body):
+        logger.info(f'Collecting data from {url} ...')
+        save_page(body, url)
+        if incremental_stop is not None and incremental_stop.done:
+            logger.info(f'Reached jobs scraped by a previous run after {incremental_stop.pages} pages, stopping.')
+            return False
+        return True
+    
+    try:
+        if concurrency > 1:
+            fetcher = job_page_fetcher(session, first_url, first_body, consume, param=param,
+                                       concurrency=concurrency, max_requests=max_requests, rate=rate)
+            if fetcher is not None:
+                fetcher.run()
+        else:
+            pages = iter_job_pages(session, first_url, first_body, param=param, max_pages=max_requests, rate=rate)
+            for url, body in pages:
+                if not consume(url, body):
+                    break
+    finally:
+        session.close()
+    
 def collect_data():
     """
     Main function to execute the scraping process.
     """
+    global job_sink, seen_index, incremental_stop, rate
+    
+    job_sink = create_job_sink(output_file=OUTPUT_FILE, prefix='jobright_results', source='jobright', **OUTPUT_OPTIONS)
+    seen_index = SeenIndex(os.path.dirname(OUTPUT_FILE), 'jobright', use_bloom=True) if SKIP_SEEN or INCREMENTAL else None
+    incremental_stop = IncrementalStop(
+        threshold=float(config.get_setting('general', 'incremental_overlap', '0.8')),
+        patience=int(config.get_setting('general', 'incremental_patience', '2')),
+    ) if INCREMENTAL else None
+    rate = RateController.from_config('jobright')
+    driver = None
+    capture = None
     try:
         logger.info(f'Getting login/password from file ...')
         credentials = get_creds()
+        username = credentials.get('username', credentials.get('login', ''))
+        store = session_store('jobright', username) if REUSE_SESSION else None
         
         logger.info(f'Starting browser ...')
-        driver = start_browser()
+        driver = open_browser(store.profile_dir if store is not None else None)
         driver.execute_cdp_cmd("Network.enable", {})
+        capture = ResponseCapture(driver, '/list/jobs')
         wait = WebDriverWait(driver, 30)
         
         logger.info(f'Moving to https://jobright.ai/...')
         driver.get('https://jobright.ai/')
 
-        logger.info(f'Trying to login ...')
-        wait.until(EC.visibility_of_element_located((By.XPATH, '//*[text()="SIGN IN"]'))).click()
-        time.sleep(3)    
-        driver.find_element(By.XPATH, '//input[@id="basic_email"]').send_keys(credentials.get('username', credentials.get('login', '')))
-        time.sleep(1)
-        driver.find_element(By.XPATH, '//input[@id="basic_password"]').send_keys(credentials.get('password', credentials.get('pass', '')))
-        time.sleep(1)
-        wait.until(EC.visibility_of_element_located((By.XPATH, '//button[@type="submit" and .//*[contains(text(), "SIGN")]]'))).click()
+        logged_in = restore_session(driver, store)
+        if not logged_in:
+            logger.info(f'Trying to login ...')
+            wait.until(EC.visibility_of_element_located(SIGN_IN)).click()
+            rate.pause()
+            driver.find_element(By.XPATH, '//input[@id="basic_email"]').send_keys(username)
+            rate.pause(0.5)
+            driver.find_element(By.XPATH, '//input[@id="basic_password"]').send_keys(credentials.get('password', credentials.get('pass', '')))
+            rate.pause(0.5)
+            wait.until(EC.visibility_of_element_located((By.XPATH, '//button[@type="submit" and .//*[contains(text(), "SIGN")]]'))).click()
 
         logger.info(f'Checking if any popups appear ...')
         check_popups(driver)
 
-        last_height = driver.execute_script("return document.body.scrollHeight")
-        
         # Wait for job listings to appear
-        wait.until(EC.visibility_of_element_located((By.XPATH, '//ul[@class="ant-list-items"]/div')))
+        wait.until(EC.visibility_of_element_located(JOB_LIST))
+        if store is not None and not logged_in:
+            save_session(driver, store)
         logger.info(f'Collecting data from jobs feed ...')
-        capture_responses(driver)
+        responses = capture_responses(capture)
+        
+        if API_MODE:
+            if not responses:
+                logger.error('No /list/jobs response captured, cannot page through the API.')
+                return False
+            # collect_from_api closes the browser, the finally below must not close it again
+            api_driver, driver = driver, None
+            collect_from_api(api_driver, *responses[-1])
+            logger.info('Scraping completed successfully')
+            return True
 
         # Implement infinite scrolling to get more jobs
+        scroller = FeedScroller(driver, 'ul.ant-list-items', prune=PRUNE_FEED,
+                                keep=int(config.get_setting('jobright', 'feed_keep', '100')))
         for i in range(1000):
             try:
-                element = driver.find_elements(By.XPATH, '//ul[@class="ant-list-items"]/div')
-                driver.execute_script("arguments[0].scrollIntoView({ behavior: 'smooth', block: 'center' });", element[-1])
-                wait.until(EC.visibility_of_element_located((By.XPATH, '//ul[@class="ant-list-items"]/div')))
-                if not capture_responses(driver):
+                rate.pause()
+                if scroller.advance() is None:
+                    break
+                if not capture_responses(capture):
+                    break
+                if incremental_stop is not None and incremental_stop.done:
+                    logger.info(f'Reached jobs scraped by a previous run after {incremental_stop.pages} pages, stopping.')
                     break
             except Exception as e:
                 logger.error(f'Error during scrolling: {e}')
                 pass
 
-        if os.path.isfile(OUTPUT_FILE):
-            logger.info(f"Collected data saved to {OUTPUT_FILE}")
-        
+        logger.info(f'Scrolled through {scroller.total} jobs, {scroller.removed} removed from the page')
         logger.info('Scraping completed successfully')
         return True
             
@@ -322,26 +427,60 @@ def collect_data():
     finally:
         # Close the browser
         try:
-            stop_browser(driver)
+            close_browser(driver)
         except:
             pass
+        if capture is not None:
+            logger.info(f'Response capture {capture.stats()}')
+        
+        # Write everything collected so far to the workbook
+        if job_sink.close():
+            logger.info(f"Collected data saved to {OUTPUT_FILE}")
+            # Only remember jobs once they are safely written
+            if seen_index is not None:
+                seen_index.save()
+        if seen_index is not None:
+            logger.info(f"Skipped {seen_index.hits} jobs already scraped by a previous run")
 
 
-def run_jobright_scraper(headless=False, output_file=None):
+def run_jobright_scraper(headless=False, output_file=None, output_options=None, skip_seen=False, incremental=False, api=False,
+                         browser_pool=None, reuse_session=False, data_only=False, prune_feed=False):
     """
     Run the JobRight scraper.
     
     Args:
         headless (bool): Run in headless mode (ignored in original implementation)
         output_file (str): Custom output file path
+        output_options (dict): Extra keyword arguments for create_job_sink
+        skip_seen (bool): Skip jobs already scraped by a previous run
+        incremental (bool): Stop once the feed reaches already-scraped jobs,
+            implies skip_seen
+        api (bool): Page through the JobRight API after login instead of
+            scrolling the feed
+        browser_pool (BrowserPool): Pool to lease the browser from, so
+            repeated runs in one process reuse started browsers (optional)
+        reuse_session (bool): Restore the session of the last login instead
+            of logging in again
+        data_only (bool): Block images, fonts, media and analytics scripts
+        prune_feed (bool): Remove job cards from the page once they have
+            scrolled out of view
         
     Returns:
         bool: True if successful, False otherwise
     """
-    global OUTPUT_FILE
+    global OUTPUT_FILE, OUTPUT_OPTIONS, SKIP_SEEN, INCREMENTAL, API_MODE, BROWSER_POOL, REUSE_SESSION, DATA_ONLY, PRUNE_FEED
     
     if output_file:
         OUTPUT_FILE = output_file
+    if output_options:
+        OUTPUT_OPTIONS = output_options
+    SKIP_SEEN = skip_seen
+    INCREMENTAL = incremental
+    API_MODE = api
+    BROWSER_POOL = browser_pool
+    REUSE_SESSION = reuse_session
+    DATA_ONLY = data_only
+    PRUNE_FEED = prune_feed
         
     logger.info("Starting JobRight scraper...")
     
@@ -46,10 +46,38 @@ def setup_argparse():
     common_group = parser.add_argument_group('Common Options')
     common_group.add_argument('--headless', action='store_true', help='Run in headless mode')
     common_group.add_argument('--output-dir', type=str, help='Output directory for results')
+    common_group.add_argument('--formats', type=str, default='xlsx',
+                              help='Comma-separated output formats: xlsx, ndjson, parquet, sqlite (default: xlsx)')
+    common_group.add_argument('--fsync', choices=['always', 'every_n', 'close'], default='every_n',
+                              help='How often NDJSON output is forced to disk (default: every_n)')
+    common_group.add_argument('--fsync-every', type=int, default=100,
+                              help='Records between fsyncs for --fsync every_n (default: 100)')
+    common_group.add_argument('--skip-seen', action='store_true',
+                              help='Skip jobs already scraped by a previous run into the same output directory')
+    common_group.add_argument('--incremental', action='store_true',
+                              help='Stop scrolling once pages consist of already-scraped jobs (implies --skip-seen)')
+    common_group.add_argument('--reuse-session', action='store_true',
+                              help='Restore the session of the last login instead of logging in again')
+    common_group.add_argument('--data-only', action='store_true',
+                              help='Block images, fonts, media and analytics scripts the scrapers do not need')
     
     # Scraper-specific options
+    jobright_group = parser.add_argument_group('JobRight Options')
+    jobright_group.add_argument('--api', action='store_true',
+                                help='Page through the JobRight API after login instead of scrolling the feed')
+    jobright_group.add_argument('--prune-feed', action='store_true',
+                                help='Experimental: remove JobRight job cards from the page once they have scrolled out of view')
+    
     wellfound_group = parser.add_argument_group('Wellfound Options')
     wellfound_group.add_argument('--no-proxy', action='store_true', help='Disable MITM proxy for Wellfound scraper')
+    wellfound_group.add_argument('--proxy-mode', choices=['subprocess', 'inprocess'], default='subprocess',
+                                 help='Run the MITM proxy as a mitmdump subprocess or inside the scraper process (default: subprocess)')
+    wellfound_group.add_argument('--graphql-replay', action='store_true',
+                                 help='Replay the captured Wellfound search with cursor pagination instead of scrolling')
+    wellfound_group.add_argument('--fetch-overviews', action='store_true',
+                                 help='Fetch Wellfound startup overviews concurrently instead of clicking every startup')
+    wellfound_group.add_argument('--cache', action='store_true',
+                                 help='Reuse Wellfound startup overviews cached by earlier runs until they expire')
     
     return parser
 
@@ -96,6 +124,16 @@ def main():
     
     logger.info(f"Output directory: {output_dir}")
     
+    # Output formats and durability settings shared by all scrapers
+    from src.scrapers.core.data_handler import SINK_FORMATS, output_file_for_format
+    formats = [f.strip() for f in args.formats.split(',') if f.strip()]
+    unknown = [f for f in formats if f not in SINK_FORMATS]
+    if not formats or unknown:
+        parser.print_help()
+        print(f"\nError: Unknown output formats {unknown}, expected some of {', '.join(SINK_FORMATS)}")
+        return 1
+    output_options = {'formats': formats, 'fsync': args.fsync, 'fsync_every': args.fsync_every}
+    
     # Set up configuration directory
     config_dir = os.path.join(project_root, 'config')
     if not os.path.exists(config_dir):
@@ -116,7 +154,17 @@ def main():
             from src.scrapers.jobright.scraper import run_jobright_scraper
             
             output_file = os.path.join(output_dir, f'jobright_results_{timestamp}.xlsx')
-            success = run_jobright_scraper(headless=args.headless, output_file=output_file)
+            success = run_jobright_scraper(
+                headless=args.headless,
+                output_file=output_file,
+                output_options=output_options,
+                skip_seen=args.skip_seen,
+                incremental=args.incremental,
+                api=args.api,
+                reuse_session=args.reuse_session,
+                data_only=args.data_only,
+                prune_feed=args.prune_feed
+            )
             results.append(("JobRight", success, output_file if success else None))
         except Exception as e:
             logger.error(f"Error running JobRight scraper: {e}")
@@ -132,7 +180,16 @@ def main():
             success = run_wellfound_scraper(
                 headless=args.headless, 
                 output_file=output_file,
-                use_proxy=not args.no_proxy
+                use_proxy=not args.no_proxy,
+                output_options=output_options,
+                skip_seen=args.skip_seen,
+                incremental=args.incremental,
+                proxy_mode=args.proxy_mode,
+                graphql_replay=args.graphql_replay,
+                fetch_overviews=args.fetch_overviews,
+                use_cache=args.cache,
+                reuse_session=args.reuse_session,
+                data_only=args.data_only
             )
             results.append(("Wellfound", success, output_file if success else None))
         except Exception as e:
@@ -143,7 +200,9 @@ def main():
     logger.info("\nScraper Summary:")
     for name, success, output_file in results:
         status = "✓ Success" if success else "✗ Failed"
-        output_info = f"Results saved to: {output_file}" if output_file and os.path.exists(output_file) else "No results saved"
+        saved_files = [output_file_for_format(output_file, f) for f in formats] if output_file else []
+        saved_files = [f for f in saved_files if os.path.exists(f)]
+        output_info = f"Results saved to: {', '.join(saved_files)}" if saved_files else "No results saved"
         logger.info(f"{name}: {status} - {output_info if success else ''}")
     
     # Return exit code based on success
@@ -0,0 +1,195 @@
+"""
+Wellfound GraphQL replay.
+Replays captured GraphQL requests over an HTTP session: the search with its
+cursor moved forward until the results are exhausted, and the startup
+overview for many startups at once.
+"""
+import copy
+import json
+
+from src.scrapers.core.logger import get_logger
+from src.scrapers.core.json_backend import loads
+from src.scrapers.core.pagination import PageFetcher
+
+logger = get_logger(__name__)
+
+# Headers of the captured request that must not be replayed as-is
+SKIPPED_HEADERS = {'host', 'content-length', 'connection', 'accept-encoding'}
+
+def search_results(body):
+    """
+    Get the search results of a decoded ``searchStartups`` response.
+    
+    Args:
+        body (dict): Decoded GraphQL response
+    
+    Returns:
+        tuple: (edges, pageInfo), either empty if missing
+    """
+    search = (((body or {}).get('data') or {}).get('talent') or {}).get('searchStartups') or {}
+    return search.get('edges') or [], search.get('pageInfo') or {}
+
+class GraphQLReplay:
+    """
+    A captured GraphQL request that can be sent again with other variables.
+    
+    The operation, query (or persisted query hash) and variables are taken
+    from the captured request body, and its headers, including the cookies
+    of the logged in browser, are reused for every request.
+    """
+    
+    def __init__(self, url, headers, payload, cursor_variable='after'):
+        """
+        Initialize the replay.
+        
+        Args:
+            url (str): GraphQL endpoint
+            headers (dict): Headers of the captured request
+            payload (dict): Decoded body of the captured request
+            cursor_variable (str): Name of the variable holding the cursor
+        """
+        self.url = url
+        self.headers = {k: v for k, v in headers.items() if k.lower() not in SKIPPED_HEADERS}
+        self.payload = payload
+        self.cursor_variable = cursor_variable
+    
+    @classmethod
+    def from_capture(cls, request, operation='searchStartups', cursor_variable='after'):
+        """
+        Build a replay from a captured request.
+        
+        Args:
+            request (dict): Captured request with 'url', 'headers' and 'body'
+            operation (str): Field the replayed operation queries, used to
+                pick it out of batched requests
+            cursor_variable (str): Name of the variable holding the cursor
+        
+        Returns:
+            GraphQLReplay: Replay of the operation
+        """
+        payload = loads(request['body'])
+        if isinstance(payload, list):
+            # Batched operations, keep the one we need
+            payload = next((p for p in payload if operation in json.dumps(p)), payload[0])
+        return cls(request['url'], request['headers'], payload, cursor_variable)
+    
+    @property
+    def operation(self):
+        """Name of the replayed operation."""
+        return self.payload.get('operationName', '')
+    
+    @property
+    def variables(self):
+        """Variables of the captured request."""
+        return self.payload.get('variables') or {}
+    
+    def post(self, session, variables, timeout=30, rate=None):
+        """
+        Send the request with some variables replaced.
+        
+        Args:
+            session (requests.Session): HTTP session
+            variables (dict): Variables to set
+            timeout (float): Request timeout in seconds
+            rate (RateController): Paces the request (optional)
+        
+        Returns:
+            dict: Decoded GraphQL response
+        """
+        payload = copy.deepcopy(self.payload)
+        payload.setdefault('variables', {}).update(variables)
+        data = json.dumps(payload)
+        if rate is not None:
+            response = rate.call(session.post, self.url, headers=self.headers, data=data, timeout=timeout)
+        else:
+            response = session.post(self.url, headers=self.headers, data=data, timeout=timeout)
+        response.raise_for_status()
+        body = loads(response.content)
+        if body.get('errors'):
+            raise ValueError(f"GraphQL errors: {body['errors']}")
+        return body
+    
+    def fetch(self, session, cursor, timeout=30, rate=None):
+        """
+        Fetch the page after a cursor.
+        
+        Args:
+            session (requests.Session): HTTP session
+            cursor (str): ``endCursor`` of the previous page
+            timeout (float): Request timeout in seconds
+            rate (RateController): Paces the request (optional)
+        
+        Returns:
+            dict: Decoded GraphQL response
+        """
+        return self.post(session, {self.cursor_variable: cursor}, timeout, rate)
+
+def iter_search_pages(session, replay, page_info, rate=None, max_pages=1000):
+    """
+    Fetch the search pages following a captured one.
+    
+    Args:
+        session (requests.Session): HTTP session
+        replay (GraphQLReplay): Replay of the captured search request
+        page_info (dict): ``pageInfo`` of the captured page
+        rate (RateController): Paces the requests (optional)
+        max_pages (int): Maximum number of pages to fetch
+    
+    Yields:
+        list: Edges of each page
+    """
+    for _ in range(max_pages):
+        if not page_info.get('hasNextPage') or not page_info.get('endCursor'):
+            logger.info('Search results exhausted, extraction completed.')
+            return
+        edges, page_info = search_results(replay.fetch(session, page_info['endCursor'], rate=rate))
+        yield edges
+
+def overview_variable(variables, startup):
+    """
+    Find which variable of a captured overview request identifies the startup.
+    
+    Args:
+        variables (dict): Variables of the captured ``startupOverview`` request
+        startup (dict): Search result of the startup it was made for
+    
+    Returns:
+        tuple: (variable name, startup field) or None if no variable matches
+    """
+    for name, value in variables.items():
+        if not isinstance(value, str):
+            continue
+        for field, field_value in startup.items():
+            if field_value == value:
+                return name, field
+    return None
+
+def overview_fetcher(session, replay, startups, variable, field, consume, concurrency=4, max_requests=None, rate=None):
+    """
+    Build a concurrent fetcher for the overviews of many startups.
+    
+    Args:
+        session (requests.Session): HTTP session, pooled for ``concurrency``
+        replay (GraphQLReplay): Replay of a captured ``startupOverview`` request
+        startups (list): Search results of the startups to fetch
+        variable (str): Variable identifying the startup, see ``overview_variable``
+        field (str): Field of the search result holding its value
+        consume (callable): Called with each ``startupOverview`` result
+        concurrency (int): Maximum requests in flight
+        max_requests (int): Request budget (optional)
+        rate (RateController): Paces the requests of each worker (optional)
+    
+    Returns:
+        PageFetcher: Fetcher to ``run()``
+    """
+    def fetch(i):
+        more = i < len(startups) - 1
+        try:
+            body = replay.post(session, {variable: startups[i][field]}, rate=rate)
+        except Exception as e:
+            # One missing overview does not end the run
+            logger.error(f"Fetching overview of {startups[i].get(field)} failed, error: {e}")
+            return None, more
+        return (body.get('data') or {}).get('startupOverview'), more
+    
+    return PageFetcher(fetch, lambda i, overview: consume(overview), concurrency=concurrency, max_requests=max_requests)
@@ -2,9 +2,10 @@ from mitmproxy import http
 import json
 import logging
 import os
+import sys
 
 BASE_DIR = os.path.dirname(os.path.realpath(__file__))
-DATA_FILE = os.path.join(BASE_DIR, 'data.json')
+CHANNEL_FILE = os.path.join(BASE_DIR, 'capture.channel')
 LOG_FILE = os.path.join(BASE_DIR, 'network.log')
 
 logging.basicConfig(
@@ -19,22 +20,25 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 logger.setLevel(logging.ERROR)
 
-# Keyword to filter URLs
-KEYWORD = "graph"
+# mitmdump loads this file as a script, so make the project importable
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(BASE_DIR))))
+from src.scrapers.core.capture_channel import ChannelWriter
+from src.scrapers.wellfound.proxy_engine import is_capture, request_envelope
+
+# Every matching response is appended, none overwrites another
+channel = ChannelWriter(CHANNEL_FILE)
 
 def response(flow: http.HTTPFlow):
     """
     This function is triggered whenever Mitmproxy captures a response.
     """
-    # Check if the request URL contains the keyword
-    if KEYWORD in flow.request.url:
-        # Log the response body (ensure it's decoded)
-        if flow.response.content:
-            
-            response_body = flow.response.text
-            if 'talent' in response_body or 'startupOverview' in response_body or 'StartupPageMeta' in response_body:
-                try:
-                    with open(DATA_FILE, 'w') as f:
-                        json.dump(response_body, f)
-                except:
-                    pass
+    if is_capture(flow):
+        try:
+            # Replayable requests go first, so the scraper can replay them
+            envelope = request_envelope(flow)
+            if envelope is not None:
+                channel.send(json.dumps(envelope))
+            # Pass the body on as-is, so the scraper decodes it only once
+            channel.send(flow.response.content)
+        except Exception as e:
+            logger.error(f"Could not write response to the capture channel: {e}")
@@ -0,0 +1,206 @@
+"""
+In-process Mitmproxy engine for the Wellfound scraper.
+Runs the proxy master on its own event loop thread and hands captured
+GraphQL responses to the scraper through an in-memory queue.
+"""
+import asyncio
+import queue
+import socket
+import threading
+
+from src.scrapers.core.logger import get_logger
+from src.scrapers.core.json_backend import loads
+
+logger = get_logger(__name__)
+
+# Keyword to filter URLs
+KEYWORD = "graph"
+# Response bodies worth capturing contain one of these
+MARKERS = (b'talent', b'startupOverview', b'StartupPageMeta')
+# Key of the captured request that precedes a replayable response
+REQUEST_KEY = '__request__'
+# Operations whose requests are captured, by response marker
+REPLAYED_OPERATIONS = {b'searchStartups': 'search', b'startupOverview': 'overview'}
+
+def is_capture(flow):
+    """
+    Check whether a flow carries a GraphQL response the scraper needs.
+    
+    Args:
+        flow (mitmproxy.http.HTTPFlow): Completed flow
+    
+    Returns:
+        bool: True if the response should be captured
+    """
+    if KEYWORD not in flow.request.url or not flow.response.content:
+        return False
+    return any(marker in flow.response.content for marker in MARKERS)
+
+def request_envelope(flow):
+    """
+    Get the request of a replayable response, for replaying it later.
+    
+    Args:
+        flow (mitmproxy.http.HTTPFlow): Completed flow
+    
+    Returns:
+        dict: ``{REQUEST_KEY: {kind, url, headers, body}}`` for
+            ``searchStartups`` and ``startupOverview`` responses, None for
+            other responses
+    """
+    kind = next((kind for marker, kind in REPLAYED_OPERATIONS.items() if marker in flow.response.content), None)
+    if kind is None:
+        return None
+    return {REQUEST_KEY: {
+        'kind': kind,
+        'url': flow.request.url,
+        'headers': dict(flow.request.headers),
+        'body': flow.request.get_text(),
+    }}
+
+class QueueAddon:
+    """Mitmproxy addon that decodes captured responses into a queue."""
+    
+    def __init__(self, captures):
+        """
+        Initialize the addon.
+        
+        Args:
+            captures (queue.Queue): Queue receiving decoded response bodies
+        """
+        self.captures = captures
+    
+    def response(self, flow):
+        if is_capture(flow):
+            envelope = request_envelope(flow)
+            if envelope is not None:
+                self.captures.put(envelope)
+            try:
+                self.captures.put(loads(flow.response.content))
+            except ValueError as e:
+                logger.error(f"Could not decode captured response: {e}")
+
+class ReadyAddon:
+    """Mitmproxy addon that reports when the proxy is up and running."""
+    
+    def __init__(self, on_running):
+        """
+        Initialize the addon.
+        
+        Args:
+            on_running (callable): Called once the proxy servers have started
+        """
+        self.on_running = on_running
+    
+    def running(self):
+        self.on_running()
+
+class ProxyEngine:
+    """
+    Mitmproxy master running inside the scraper process.
+    
+    Replaces the ``mitmdump`` subprocess: there is no process boundary, no
+    output pipe that can fill up, and captured responses go straight to
+    ``captures`` instead of through the filesystem.
+    """
+    
+    def __init__(self, host='127.0.0.1', port=8080):
+        """
+        Initialize the engine.
+        
+        Args:
+            host (str): Address to listen on
+            port (int): Port to listen on
+        """
+        self.host = host
+        self.port = port
+        self.captures = queue.Queue()
+        
+        self._master = None
+        self._loop = None
+        self._error = None
+        self._ready = threading.Event()
+        self._thread = None
+    
+    def start(self, timeout=10):
+        """
+        Start the proxy on a background thread.
+        
+        Args:
+            timeout (float): Seconds to wait for the proxy to start
+        
+        Returns:
+            ProxyEngine: The started engine
+        
+        Raises:
+            RuntimeError: If the proxy is not listening within ``timeout``,
+                e.g. because the port is already in use
+        """
+        self._thread = threading.Thread(target=self._run, name='mitmproxy', daemon=True)
+        self._thread.start()
+        if not self._ready.wait(timeout):
+            self.stop()
+            raise RuntimeError(f"Mitmproxy did not start within {timeout}s")
+        if self._error is not None:
+            self.stop()
+            raise RuntimeError(f"Mitmproxy failed to start: {self._error!r}") from self._error
+        logger.info(f"Mitmproxy listening on {self.host}:{self.port}")
+        return self
+    
+    def _run(self):
+        try:
+            asyncio.run(self._serve())
+        except BaseException as e:
+            # Mitmproxy exits with SystemExit when it cannot bind its port
+            if not self._ready.is_set():
+                self._error = e
+            logger.error(f"Mitmproxy stopped with an error: {e!r}")
+        finally:
+            self._ready.set()
+    
+    def _running(self):
+        # Called on the proxy loop once the servers have started. A server
+        # that failed to bind only logs its error, so check every server
+        proxyserver = self._master.addons.get('proxyserver') if self._master is not None else None
+        servers = list(getattr(proxyserver, 'servers', None) or [])
+        errors = [server.last_exception for server in servers if getattr(server, 'last_exception', None)]
+        if servers:
+            if errors or not all(server.is_running for server in servers):
+                self._error = errors[0] if errors else OSError(f"Proxy server on {self.host}:{self.port} is not running")
+        else:
+            # Server state is not exposed, check the port instead
+            try:
+                socket.create_connection((self.host, self.port), timeout=1).close()
+            except OSError as e:
+                self._error = e
+        if self._error is not None and self._master is not None:
+            self._master.shutdown()
+        self._ready.set()
+    
+    async def _serve(self):
+        # Only needed in in-process mode
+        from mitmproxy import options
+        from mitmproxy.tools.dump import DumpMaster
+        
+        opts = options.Options(listen_host=self.host, listen_port=self.port)
+        self._master = DumpMaster(opts, with_termlog=False, with_dumper=False)
+        self._master.addons.add(QueueAddon(self.captures), ReadyAddon(self._running))
+        self._loop = asyncio.get_running_loop()
+        await self._master.run()
+    
+    def stop(self, timeout=5):
+        """
+        Shut the proxy down.
+        
+        Args:
+            timeout (float): Seconds to wait for the proxy thread to exit
+        """
+        if self._loop is not None and self._master is not None:
+            try:
+                self._loop.call_soon_threadsafe(self._master.shutdown)
+            except RuntimeError:
+                # The loop has already exited
+                pass
+        if self._thread is not None:
+            self._thread.join(timeout)
+        logger.info("Mitmproxy stopped.")
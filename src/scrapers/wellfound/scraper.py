@@ -10,6 +10,7 @@ import pandas as pd
 import undetected_chromedriver as uc
 import subprocess
 import threading
+import queue
 import random
 import signal
 from datetime import datetime
@@ -19,20 +20,36 @@ from selenium import webdriver
 from selenium.webdriver.chrome.service import Service
 from selenium.webdriver.common.desired_capabilities import DesiredCapabilities
 from selenium.webdriver.chrome.options import Options
-from selenium.webdriver.common.by import By
 from selenium.webdriver.common.action_chains import ActionChains
 from selenium.webdriver.common.keys import Keys
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
 from webdriver_manager.chrome import ChromeDriverManager
 from webdriver_manager.core.os_manager import OperationSystemManager,ChromeType
 
 # Setup path for importing project modules
 project_root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
 sys.path.append(project_root)
+
+from src.scrapers.core.data_handler import create_job_sink
+from src.scrapers.core.dedup import SeenIndex, IncrementalStop
+from src.scrapers.core.job_store import wellfound_job_key
+from src.scrapers.core.json_backend import loads
+from src.scrapers.core.records import WellfoundRecord
+from src.scrapers.core.capture_channel import ChannelReader
+from src.scrapers.core.http_session import create_session
+from src.scrapers.core.rate_control import RateController
+from src.scrapers.core.response_cache import ResponseCache, cache_key
+from src.scrapers.core.session_store import session_store
+from src.scrapers.core.browser import blocked_url_patterns
+from src.scrapers.wellfound.proxy_engine import ProxyEngine, REQUEST_KEY
+from src.scrapers.wellfound.graphql import GraphQLReplay, iter_search_pages, overview_variable, overview_fetcher
+from src.config.config import config
+
 # Paths and constants
 BASE_DIR = os.path.dirname(os.path.realpath(__file__))
-DATA_FILE = os.path.join(BASE_DIR, 'data.json')
+CHANNEL_FILE = os.path.join(BASE_DIR, 'capture.channel')
+MITMDUMP_LOG_FILE = os.path.join(BASE_DIR, 'mitmdump.log')
+# Seconds between reads of the capture channel
+CHANNEL_POLL_INTERVAL = 0.05
 PROXY = "localhost:8080"
 ADDON_SCRIPT = os.path.join(BASE_DIR, "mitmproxy_addon.py")
 LOG_FILE = os.path.join(BASE_DIR, 'wellfound_logs.log')
@@ -109,16 +126,107 @@ except:
 
 CREDENTIALS_FILE = os.path.join(BASE_DIR, 'wellfound_credentials.txt')
 
+# Extra keyword arguments for create_job_sink (formats, fsync policy, ...)
+OUTPUT_OPTIONS = {}
+
 
 
 # Global data containers
 all_statups = {}
 all_statups_pages = {}
 all_extended_statups_pages = {}
+# Overviews captured so far, also counting ones that replace a cached overview
+overview_arrivals = 0
+
+# Batch writer, seen-job index and incremental stop condition for the
+# current run, opened in run_wellfound_scraper()
+job_sink = None
+seen_index = None
+incremental_stop = None
+
+# Replay the search over HTTP instead of scrolling, see replay_search()
+GRAPHQL_REPLAY = False
+# Fetch startup overviews over HTTP instead of clicking, see fetch_overviews()
+FETCH_OVERVIEWS = False
+# Restore the session of the last login instead of logging in again
+REUSE_SESSION = False
+# Block images, fonts, media and analytics scripts
+DATA_ONLY = False
+# First captured search request and the pageInfo of its response
+search_request = None
+search_page_info = None
+# First captured startupOverview request
+overview_request = None
+
+# Pacing of browser actions and replayed requests, opened in run_wellfound_scraper()
+rate = None
+# Startup overviews of earlier runs, opened in run_wellfound_scraper() if enabled
+response_cache = None
 
 def delay_range():
-    """Return a random delay in seconds."""
-    return random.randint(5, 7)
+    """Return the delay before the next action in seconds."""
+    if rate is None:
+        return random.randint(5, 7)
+    return rate.next_delay()
+
+def wait_for_growth(container, size, timeout):
+    """
+    Wait until the proxy has added entries to a data container.
+    
+    Args:
+        container (dict): Container filled by the capture thread
+        size (int): Size of the container before the action
+        timeout (float): Maximum seconds to wait
+        
+    Returns:
+        float: Seconds until the first new entry arrived, None on timeout
+    """
+    start = time.monotonic()
+    while time.monotonic() - start < timeout:
+        if len(container) > size:
+            return time.monotonic() - start
+        time.sleep(0.1)
+    return None
+
+def wait_for_overview(arrivals, timeout):
+    """
+    Wait until the proxy has captured another startup overview.
+    
+    Counts arrivals rather than distinct startups, so opening a startup
+    whose overview was loaded from the response cache does not time out.
+    
+    Args:
+        arrivals (int): overview_arrivals before the click
+        timeout (float): Maximum seconds to wait
+        
+    Returns:
+        float: Seconds until the overview arrived, None on timeout
+    """
+    start = time.monotonic()
+    while time.monotonic() - start < timeout:
+        if overview_arrivals > arrivals:
+            return time.monotonic() - start
+        time.sleep(0.1)
+    return None
+
+def arrows_to_click(arrows, startup_ids):
+    """
+    Get the detail arrows of startups whose overview is still missing.
+    
+    Arrows are listed in search result order, the order startups were
+    captured in. If the counts differ the arrows cannot be matched to
+    startups and all of them are returned.
+    
+    Args:
+        arrows (list): Detail arrows on the page
+        startup_ids (list): Captured startup IDs in capture order
+        
+    Returns:
+        list: Arrows to click
+    """
+    if len(arrows) != len(startup_ids):
+        return list(arrows)
+    return [arrow for arrow, k in zip(arrows, startup_ids) if k not in all_extended_statups_pages]
 
 def random_click(image_path, confidence=0.8):
     """Perform a random click near the center of an image match."""
@@ -157,70 +265,103 @@ def scrape_heading_task(driver: Driver, data):
     Main scraping function using botasaurus browser.
     """
     try:        
-        driver.get("https://wellfound.com/login")
-        time.sleep(10)
-        try:
-            driver.save_screenshot('check_1111.png')
-        except:
-            driver.save_screenshot()
-            pass
-        
-        image_path = "11zon_cropped.png"
-        try:
-            random_click(image_path, confidence=0.8)
-        except Exception as e:
-            logger.info(e)
-        time.sleep(15)
-        
-        # Login sequence
-        driver.type("input[id='user_email']", username)
-        time.sleep(delay_range())
-        driver.type("input[id='user_password']", password)
-        time.sleep(delay_range())
-        driver.click("input[type='submit']")
-        time.sleep(delay_range())
+        if DATA_ONLY:
+            try:
+                driver.block_urls(blocked_url_patterns())
+            except Exception as e:
+                logger.warning(f'Cannot block resources: {e}')
+        store = session_store('wellfound', username) if REUSE_SESSION else None
+        if not restore_session(driver, store):
+            driver.get("https://wellfound.com/login")
+            rate.pause(2)
+            try:
+                driver.save_screenshot('check_1111.png')
+            except:
+                driver.save_screenshot()
+                pass
+            
+            image_path = "11zon_cropped.png"
+            try:
+                random_click(image_path, confidence=0.8)
+            except Exception as e:
+                logger.info(e)
+            rate.pause(3)
+            
+            # Login sequence
+            driver.type("input[id='user_email']", username)
+            time.sleep(delay_range())
+            driver.type("input[id='user_password']", password)
+            time.sleep(delay_range())
+            driver.click("input[type='submit']")
+            time.sleep(delay_range())
+            if store is not None:
+                save_session(driver, store)
         
-        # Scroll and collect data
-        counter = 0
-        for _ in range(105):
-            driver.scroll_to_bottom()
-            time.sleep(10)
-            if len(all_statups) == counter:
-                break
-            counter = len(all_statups)
+        # Scroll and collect data, unless the search can be replayed directly
+        if not (GRAPHQL_REPLAY and replay_search()):
+            counter = 0
+            for _ in range(105):
+                driver.scroll_to_bottom()
+                latency = wait_for_growth(all_statups, counter, rate.max_delay)
+                if latency is None:
+                    break
+                rate.record(latency=latency)
+                rate.pause()
+                if reached_known_jobs(list(all_statups)[counter:]):
+                    break
+                counter = len(all_statups)
             
-        # Click on detail arrows
-        details_arrows = driver.select_all('div[class="flex w-full"]')
+        # Click on detail arrows, unless every overview is already cached
+        load_cached_overviews()
+        details_arrows = arrows_to_click(driver.select_all('div[class="flex w-full"]'), list(all_statups))
         time.sleep(delay_range())
         for arrow in details_arrows:
+            if all(k in all_extended_statups_pages for k in all_statups):
+                break
+            arrivals = overview_arrivals
             arrow.click()
-            time.sleep(delay_range())
+            latency = wait_for_overview(arrivals, rate.max_delay)
+            rate.record(latency=latency, error=latency is None)
             driver.click("button[data-test='closeButton']")
             time.sleep(delay_range())
+            # One opened overview is enough to fetch the others directly
+            if FETCH_OVERVIEWS and overview_request is not None:
+                break
+        if FETCH_OVERVIEWS:
+            fetch_overviews()
 
         # Process collected data
         for k, v in all_statups.items():
             try:
                 for entry in all_statups[k]["highlightedJobListings"]:
+                    # Skip jobs scraped by a previous run before building the record
+                    key = wellfound_job_key(k, entry.get('title', ''))
+                    if seen_index is not None and seen_index.seen(key):
+                        continue
                     try:
-                        data = {
-                            'Company name': [all_statups[k]["name"]],
-                            'Actively hiring': [''.join([x["label"] for x in all_extended_statups_pages[k]["badges"] if x.get("name", '') == 'ACTIVELY_HIRING_BADGE'])],
-                            'Description': [all_statups[k]["highConcept"]],
-                            'Company size': [all_statups[k]["companySize"].split('SIZE_')[-1].replace('_', '-')],
-                            'Badges': [','.join([x["label"] for x in all_extended_statups_pages[k]["badges"]])],
-                            'Title': [entry['title']],
-                            'Location': [','.join(entry['locationNames'])],
-                            'Remote options': entry['remoteConfig']['kind'].lower(),
-                            'Remote': ['Yes' if entry['remote'] == True else ''],
-                            'Salary': [entry['compensation']],
-                            'Published time': [datetime.utcfromtimestamp(int(entry['liveStartAt'])).strftime('%Y-%m-%d %H:%M:%S')],
-                            'Website': [all_extended_statups_pages[k]['companyUrl']],
-                            'Linkedin': [all_extended_statups_pages[k]['linkedInUrl']],
-                            'Company type': [','.join(x['displayName'] for x in all_extended_statups_pages[k]['companyTypeTaggings'])],
-                            'Company markets': [','.join(x['displayName'] for x in all_extended_statups_pages[k]['marketTaggings'])],
-                        }
-                        save_result(data)
+                        # Startups without a captured detail page keep those columns empty
+                        extended = all_extended_statups_pages.get(k, {})
+                        record = WellfoundRecord(
+                            company_name=all_statups[k]["name"],
+                            actively_hiring=''.join([x["label"] for x in extended.get("badges", []) if x.get("name", '') == 'ACTIVELY_HIRING_BADGE']),
+                            description=all_statups[k]["highConcept"],
+                            company_size=all_statups[k]["companySize"].split('SIZE_')[-1].replace('_', '-'),
+                            badges=','.join([x["label"] for x in extended.get("badges", [])]),
+                            title=entry['title'],
+                            location=','.join(entry['locationNames']),
+                            remote_options=entry['remoteConfig']['kind'].lower(),
+                            remote='Yes' if entry['remote'] == True else '',
+                            salary=entry['compensation'],
+                            published_time=datetime.utcfromtimestamp(int(entry['liveStartAt'])).strftime('%Y-%m-%d %H:%M:%S'),
+                            website=extended.get('companyUrl', ''),
+                            linkedin=extended.get('linkedInUrl', ''),
+                            company_type=','.join(x['displayName'] for x in extended.get('companyTypeTaggings', [])),
+                            company_markets=','.join(x['displayName'] for x in extended.get('marketTaggings', [])),
+                            startup_id=k,
+                        )
+                        save_result(record)
+                        if seen_index is not None:
+                            seen_index.add(key)
                     except Exception as e:
                         logger.error(f'Something went wrong during collecting of data, error: {e}')
             except Exception as e:
@@ -230,15 +371,177 @@ def scrape_heading_task(driver: Driver, data):
         logger.info(f"Error during scraping: {e}")
         return None
 
+def restore_session(driver, store):
+    """
+    Restore the saved session of the account and check that it is still logged in.
+    
+    Wellfound sends logged out visitors of the jobs page to the login page,
+    so one page load tells whether the session is still valid.
+    
+    Args:
+        driver (Driver): Botasaurus driver
+        store (SessionStore): Session store of the account (optional)
+    
+    Returns:
+        bool: True if the browser is logged in on the jobs page
+    """
+    session = store.load() if store is not None else None
+    if session is None:
+        return False
+    
+    logger.info('Restoring the saved Wellfound session ...')
+    try:
+        driver.get("https://wellfound.com/")
+        driver.add_cookies_and_local_storage({'cookies': session['cookies'], 'local_storage': session['local_storage']})
+        driver.get("https://wellfound.com/jobs")
+        rate.pause()
+        if '/login' not in driver.current_url:
+            logger.info('Restored session is logged in, skipping login')
+            return True
+    except Exception as e:
+        logger.warning(f'Cannot restore session: {e}')
+    
+    logger.info('Restored session is logged out, logging in again')
+    store.clear()
+    return False
+
+def save_session(driver, store):
+    """
+    Save the session of the browser if the login succeeded.
+    
+    Args:
+        driver (Driver): Botasaurus driver after submitting the login form
+        store (SessionStore): Session store of the account
+    """
+    try:
+        if '/login' in driver.current_url:
+            logger.warning('Still on the login page, not saving the session')
+            return
+        session = driver.get_cookies_and_local_storage()
+        store.save(session.get('cookies', []), session.get('local_storage', {}))
+    except Exception as e:
+        logger.warning(f'Cannot save session: {e}')
+
+def reached_known_jobs(startup_ids):
+    """
+    Check newly loaded startups against the incremental stop condition.
+    
+    Args:
+        startup_ids (list): IDs of the startups loaded by the last page
+        
+    Returns:
+        bool: True once the feed has reached jobs scraped by a previous run
+    """
+    if incremental_stop is None:
+        return False
+    
+    # Compare the startups loaded by this page against the seen index
+    keys = [
+        wellfound_job_key(k, entry.get('title', ''))
+        for k in startup_ids
+        for entry in all_statups[k].get('highlightedJobListings') or []
+    ]
+    incremental_stop.observe(len(keys), sum(key in seen_index for key in keys))
+    if incremental_stop.done:
+        logger.info(f'Reached jobs scraped by a previous run after {incremental_stop.pages} pages, stopping.')
+        return True
+    return False
+
+def replay_search():
+    """
+    Page through the search results by replaying the captured GraphQL request.
+    
+    The first searchStartups request the browser makes is recorded by the
+    proxy. Its operation, variables and headers are sent again over an HTTP
+    session with the cursor moved to each page's endCursor, until pageInfo
+    reports no next page.
+    
+    Returns:
+        bool: True if the search was replayed, False if it could not be and
+            the feed has to be scrolled instead
+    """
+    deadline = time.monotonic() + float(config.get_setting('wellfound', 'graphql_capture_timeout', '30'))
+    while search_page_info is None and time.monotonic() < deadline:
+        time.sleep(0.1)
+    if search_request is None or search_page_info is None:
+        logger.warning('No search request captured, falling back to scrolling.')
+        return False
+    if 'hasNextPage' not in search_page_info:
+        logger.warning('Captured search does not select pageInfo, falling back to scrolling.')
+        return False
+    
+    replay = GraphQLReplay.from_capture(
+        search_request,
+        cursor_variable=config.get_setting('wellfound', 'graphql_cursor_variable', 'after'),
+    )
+    logger.info(f'Replaying {replay.operation or "search"} with cursor pagination ...')
+    session = create_session(paced=True)
+    try:
+        pages = iter_search_pages(session, replay, search_page_info, rate=rate)
+        for edges in pages:
+            counter = len(all_statups)
+            get_results(edges)
+            logger.info(f'Found {len(all_statups)} startups so far')
+            if reached_known_jobs(list(all_statups)[counter:]):
+                break
+    except Exception as e:
+        logger.error(f'Error replaying search, keeping the pages fetched so far: {e}')
+    finally:
+        session.close()
+    return True
+
+def fetch_overviews():
+    """
+    Fetch the overviews of all startups without one, several at a time.
+    
+    Replays the first startupOverview request captured from a detail click
+    with the variable that identifies the startup replaced, feeding
+    all_extended_statups_pages as the clicks do.
+    """
+    if overview_request is None:
+        logger.warning('No startup overview request captured, cannot fetch the remaining overviews.')
+        return
+    
+    replay = GraphQLReplay.from_capture(overview_request, operation='startupOverview')
+    # The captured request was made for one of the startups, find which variable holds its identity
+    identity = next(filter(None, (overview_variable(replay.variables, startup) for startup in all_statups.values())), None)
+    if identity is None:
+        logger.warning(f'Cannot tell which variable of {replay.operation or "startupOverview"} identifies the startup.')
+        return
+    variable, field = identity
+    missing = [all_statups[k] for k in all_statups if k not in all_extended_statups_pages and all_statups[k].get(field)]
+    if not missing:
+        return
+    
+    concurrency = int(config.get_setting('wellfound', 'overview_concurrency', '4'))
+    logger.info(f'Fetching {len(missing)} startup overviews, {concurrency} at a time ...')
+    session = create_session(pool_size=concurrency, paced=True)
+    try:
+        fetcher = overview_fetcher(
+            session,
+            replay,
+            missing,
+            variable,
+            field,
+            get_extended_page_results,
+            concurrency=concurrency,
+            rate=rate,
+        )
+        fetcher.run()
+    finally:
+        session.close()
+    logger.info(f'Have overviews of {len(all_extended_statups_pages)} of {len(all_statups)} startups')
+
 def start_mitmproxy():
     """Start Mitmproxy with the specified addon script."""
     try:
-        process = subprocess.Popen(
-            ["mitmdump", "-s", ADDON_SCRIPT],
-            stdout=subprocess.PIPE,
-            stderr=subprocess.PIPE,
-            text=True,
-        )
+        # Send output to a log file, unread pipes would stall mitmdump once full
+        with open(MITMDUMP_LOG_FILE, 'ab') as log:
+            process = subprocess.Popen(
+                ["mitmdump", "-s", ADDON_SCRIPT],
+                stdout=log,
+                stderr=subprocess.STDOUT,
+            )
         return process
     except Exception as e:
         logger.info(f"Error starting Mitmproxy: {e}")
@@ -266,14 +569,9 @@ def get_results(data):
             all_statups[entry['node']['startupId']] = entry['node']
 
 def save_result(data):
-    """Save data to Excel file."""
+    """Queue data for writing to the output file(s)."""
     try:
-        df = pd.DataFrame(data)
-        if os.path.exists(OUTPUT_FILE):
-            with pd.ExcelWriter(OUTPUT_FILE, mode='a', engine='openpyxl', if_sheet_exists='overlay') as writer:
-                df.to_excel(writer, index=False, header=False, sheet_name='Sheet1', startrow=writer.sheets['Sheet1'].max_row)
-        else:
-            df.to_excel(OUTPUT_FILE, index=False, sheet_name='Sheet1')
+        job_sink.write(data)
     except Exception as e:
         logger.error(f'Something went wrong during writing to file, error: {e}')
 
@@ -285,232 +583,125 @@ def get_page_results(data):
 
 def get_extended_page_results(data):
     """Process extended startup page data from GraphQL response."""
+    global overview_arrivals
     if "startupResult" in data:
         startup_id = data["startupResult"]["startupId"]
         all_extended_statups_pages[startup_id] = data["startupResult"]
+        overview_arrivals += 1
+        if response_cache is not None:
+            response_cache.put('overview', overview_cache_key(startup_id), data["startupResult"])
+
+def overview_cache_key(startup_id):
+    """Get the response cache key of a startup's overview."""
+    return cache_key('startupOverview', {'startupId': startup_id})
+
+def load_cached_overviews():
+    """Fill in the overviews of startups that are still fresh in the response cache."""
+    if response_cache is None:
+        return
+    loaded = 0
+    for k in all_statups:
+        if k in all_extended_statups_pages:
+            continue
+        cached = response_cache.get('overview', overview_cache_key(k))
+        if cached is not None:
+            all_extended_statups_pages[k] = cached
+            loaded += 1
+    logger.info(f'Loaded {loaded} of {len(all_statups)} startup overviews from the response cache')
+    
+def process_capture(body):
+    """
+    Process one GraphQL response captured by the proxy.
+    
+    Args:
+        body (bytes or dict): Raw or already decoded response body
+    """
+    global search_request, search_page_info, overview_request
+    
+    if isinstance(body, (bytes, str)):
+        body = loads(body)
+    
+    # Requests are only captured ahead of replayable responses, keep the first of each
+    if REQUEST_KEY in body:
+        request = body[REQUEST_KEY]
+        if request.get('kind') == 'search' and search_request is None:
+            search_request = request
+        elif request.get('kind') == 'overview' and overview_request is None:
+            overview_request = request
+        return
+    dt = body.get('data', {})
+    
+    # Process based on type of response
+    if 'talent' in dt and 'searchStartups' in dt['talent'] and 'edges' in dt['talent']['searchStartups']:
+        get_results(dt['talent']['searchStartups']['edges'])
+        if search_page_info is None:
+            search_page_info = dt['talent']['searchStartups'].get('pageInfo') or {}
+    elif 'startup' in dt and 'startupResult' in dt['startup']:
+        get_page_results(dt['startup'])
+    elif 'startupOverview' in dt and 'startupResult' in dt['startupOverview']:
+        get_extended_page_results(dt['startupOverview'])
+
+def monitor_mitmproxy(process, stop_event, reader):
+    """
+    Monitor Mitmproxy process and process captured data.
     
-def monitor_mitmproxy(process, stop_event):
-    """Monitor Mitmproxy process and process captured data."""
+    Args:
+        process: Mitmproxy process, stopped when monitoring ends
+        stop_event (threading.Event): Set to stop monitoring
+        reader (ChannelReader): Capture channel the addon appends to
+    """
     try:
-        last_modified = 0
-        while not stop_event.is_set():
+        while True:
+            stopping = stop_event.is_set()
             try:
-                # Check if file exists and has been modified
-                if os.path.exists(DATA_FILE):
-                    current_modified = os.path.getmtime(DATA_FILE)
-                    
-                    if current_modified > last_modified:
-                        last_modified = current_modified
-                        # Process the file
-                        try:
-                            with open(DATA_FILE) as f:
-                                d = json.load(f)
-                            dt = json.loads(d).get('data', {})
-                            
-                            # Process based on type of response
-                            if 'talent' in dt and 'searchStartups' in dt['talent'] and 'edges' in dt['talent']['searchStartups']:
-                                get_results(dt['talent']['searchStartups']['edges'])
-                            elif 'startup' in dt and 'startupResult' in dt['startup']:
-                                get_page_results(dt['startup'])
-                            elif 'startupOverview' in dt and 'startupResult' in dt['startupOverview']:
-                                get_extended_page_results(dt['startupOverview'])
-                                
-                        except Exception as e:
-                            pass
-                        try:
-                            os.remove(DATA_FILE)
-                        except Exception as e:
-                            pass
+                for body in reader.read():
+                    try:
+                        process_capture(body)
+                    except Exception as e:
+                        logger.error(f"Error processing captured response: {e}")
             except Exception as e:
-                logger.error(f"Error processing data file: {e}")
-                
-            # Sleep before checking again
-            time.sleep(1)
+                logger.error(f"Error reading capture channel: {e}")
+            
+            # The channel is drained once more after the stop request
+            if stopping:
+                break
+            stop_event.wait(CHANNEL_POLL_INTERVAL)
     except Exception as e:
         logger.info(f"Error monitoring Mitmproxy: {e}")
     finally:
         stop_mitmproxy(process)
+        logger.info(f"Processed {reader.received} captured responses ({reader.lost} lost)")
+
+def monitor_proxy_engine(engine, stop_event):
+    """
+    Process responses captured by the in-process proxy.
     
-    def login(self):
-        """
-        Login to Wellfound.
-        
-        Returns:
-            bool: True if login successful, False otherwise
-        """
-        if not self.driver:
-            logger.error("Browser not started. Call start() first.")
-            return False
-            
-        try:
-            username = self.credentials.get('username', '')
-            password = self.credentials.get('password', '')
-            
-            if not username or not password:
-                logger.error("Missing credentials. Please set username and password in config.")
-                return False
-                
-            logger.info(f"Logging in to {self.login_url}...")
-            self.driver.get(self.login_url)
-            
-            # Wait for login form to load
-            time.sleep(10)  # Initial wait to ensure page is loaded
-            
-            # Enter credentials
-            self.driver.find_element(By.CSS_SELECTOR, "input[id='user_email']").send_keys(username)
-            time.sleep(self.delay_range())
-            self.driver.find_element(By.CSS_SELECTOR, "input[id='user_password']").send_keys(password)
-            time.sleep(self.delay_range())
-            
-            # Click login button
-            self.driver.find_element(By.CSS_SELECTOR, "input[type='submit']").click()
-            time.sleep(10)  # Wait for login to complete
-            
-            # Check if login was successful by looking for a known element on the dashboard
+    Args:
+        engine (ProxyEngine): Running proxy engine, stopped when monitoring ends
+        stop_event (threading.Event): Set to stop monitoring
+    """
+    received = 0
+    try:
+        while True:
             try:
-                WebDriverWait(self.driver, 20).until(
-                    EC.presence_of_element_located((By.CSS_SELECTOR, "nav[aria-label='Main']"))
-                )
-                logger.info("Login successful")
-                return True
-            except Exception as e:
-                logger.error(f"Login verification failed: {e}")
-                return False
-                
-        except Exception as e:
-            logger.error(f"Login failed: {e}")
-            return False
-    
-    def scrape_jobs(self):
-        """
-        Scrape job listings.
-        
-        Returns:
-            int: Number of jobs processed
-        """
-        try:
-            # Navigate to job listings page
-            self.driver.get("https://wellfound.com/jobs")
-            time.sleep(10)
-            
-            # Scroll down to load more results
-            job_count = 0
-            counter = 0
-            for _ in range(105):  # Maximum number of scrolls
-                self.driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
-                time.sleep(10)
-                
-                # Check if we're still getting new results
-                if len(self.all_startups) == counter:
-                    logger.info(f"No new startups found after {_+1} scrolls. Stopping.")
+                body = engine.captures.get(timeout=CHANNEL_POLL_INTERVAL)
+            except queue.Empty:
+                # Everything captured before the stop request has been processed
+                if stop_event.is_set():
                     break
-                    
-                counter = len(self.all_startups)
-                logger.info(f"Found {counter} startups so far")
-            
-            # Click on job cards to load details
+                continue
+            received += 1
             try:
-                details_arrows = self.driver.find_elements(By.CSS_SELECTOR, 'div[class="flex w-full"]')
-                logger.info(f"Found {len(details_arrows)} detail arrows to click")
-                
-                for arrow in details_arrows:
-                    arrow.click()
-                    time.sleep(self.delay_range())
-                    
-                    # Close the detail panel
-                    close_buttons = self.driver.find_elements(By.CSS_SELECTOR, "button[data-test='closeButton']")
-                    if close_buttons:
-                        close_buttons[0].click()
-                    
-                    time.sleep(self.delay_range())
+                process_capture(body)
             except Exception as e:
-                logger.error(f"Error clicking on job details: {e}")
-            
-            # Process collected data
-            for startup_id, startup_data in self.all_startups.items():
-                try:
-                    # Skip if no extended data available
-                    if startup_id not in self.all_extended_startups_pages:
-                        continue
-                        
-                    # Process job listings for this startup
-                    if "highlightedJobListings" in startup_data:
-                        for job in startup_data["highlightedJobListings"]:
-                            try:
-                                data = {
-                                    'Company name': [startup_data.get("name", "")],
-                                    'Actively hiring': [''.join([x["label"] for x in self.all_extended_startups_pages[startup_id]["badges"] if x.get("name", '') == 'ACTIVELY_HIRING_BADGE'])],
-                                    'Description': [startup_data.get("highConcept", "")],
-                                    'Company size': [startup_data.get("companySize", "").split('SIZE_')[-1].replace('_', '-')],
-                                    'Badges': [','.join([x["label"] for x in self.all_extended_startups_pages[startup_id]["badges"]])],
-                                    'Title': [job.get('title', '')],
-                                    'Location': [','.join(job.get('locationNames', []))],
-                                    'Remote options': [job.get('remoteConfig', {}).get('kind', '').lower()],
-                                    'Remote': ['Yes' if job.get('remote', False) is True else ''],
-                                    'Salary': [job.get('compensation', '')],
-                                    'Published time': [datetime.utcfromtimestamp(int(job.get('liveStartAt', 0))).strftime('%Y-%m-%d %H:%M:%S')],
-                                    'Website': [self.all_extended_startups_pages[startup_id].get('companyUrl', '')],
-                                    'Linkedin': [self.all_extended_startups_pages[startup_id].get('linkedInUrl', '')],
-                                    'Company type': [','.join(x.get('displayName', '') for x in self.all_extended_startups_pages[startup_id].get('companyTypeTaggings', []))],
-                                    'Company markets': [','.join(x.get('displayName', '') for x in self.all_extended_startups_pages[startup_id].get('marketTaggings', []))],
-                                }
-                                
-                                # Save the data
-                                save_to_excel(
-                                    data,
-                                    output_file=self.custom_output_file, 
-                                    prefix='wellfound_results'
-                                )
-                                
-                                job_count += 1
-                            except Exception as e:
-                                logger.error(f"Error processing job data: {e}")
-                except Exception as e:
-                    logger.error(f"Error processing startup {startup_id}: {e}")
-            
-            return job_count
-            
-        except Exception as e:
-            logger.error(f"Error scraping jobs: {e}")
-            return 0
-    
-    def run(self):
-        """
-        Run the full scraping process.
-        
-        Returns:
-            bool: True if successful, False otherwise
-        """
-        try:
-            # Start browser and proxy
-            if not self.start():
-                return False
-                
-            # Login
-            if not self.login():
-                self.stop()
-                return False
-            
-            # Scrape jobs
-            job_count = self.scrape_jobs()
-            
-            # Clean up
-            self.stop()
-            
-            if job_count > 0:
-                logger.info(f"Successfully scraped {job_count} jobs")
-                return True
-            else:
-                logger.warning("No jobs found")
-                return False
-                
-        except Exception as e:
-            logger.error(f"Error running Wellfound scraper: {e}")
-            self.cleanup()
-            return False
-
+                logger.error(f"Error processing captured response: {e}")
+    finally:
+        engine.stop()
+        logger.info(f"Processed {received} captured responses")
 
-def run_wellfound_scraper(headless=False, output_file=None, use_proxy=True):
+def run_wellfound_scraper(headless=False, output_file=None, use_proxy=True, output_options=None, skip_seen=False, incremental=False,
+                          proxy_mode='subprocess', graphql_replay=False, fetch_overviews=False, use_cache=False,
+                          reuse_session=False, data_only=False):
     """
     Run the Wellfound scraper.
     
@@ -518,14 +709,40 @@ def run_wellfound_scraper(headless=False, output_file=None, use_proxy=True):
         headless (bool): Run in headless mode
         output_file (str): Custom output file path
         use_proxy (bool): Whether to use MITM proxy
+        output_options (dict): Extra keyword arguments for create_job_sink
+        skip_seen (bool): Skip jobs already scraped by a previous run
+        incremental (bool): Stop once the feed reaches already-scraped jobs,
+            implies skip_seen
+        proxy_mode (str): 'subprocess' to run mitmdump with the addon script,
+            'inprocess' to run the proxy inside this process
+        graphql_replay (bool): Replay the captured search request with cursor
+            pagination instead of scrolling, needs the proxy
+        fetch_overviews (bool): Fetch startup overviews concurrently over HTTP
+            after the first detail click, needs the proxy
+        use_cache (bool): Reuse startup overviews cached by earlier runs
+        reuse_session (bool): Restore the session of the last login instead
+            of logging in again
+        data_only (bool): Block images, fonts, media and analytics scripts
         
     Returns:
         bool: True if successful, False otherwise
     """
-    global OUTPUT_FILE
+    global OUTPUT_FILE, OUTPUT_OPTIONS, job_sink, seen_index, incremental_stop
+    global GRAPHQL_REPLAY, FETCH_OVERVIEWS, search_request, search_page_info, overview_request, rate, response_cache
+    global REUSE_SESSION, DATA_ONLY
     
     if output_file:
         OUTPUT_FILE = output_file
+    if output_options:
+        OUTPUT_OPTIONS = output_options
+    GRAPHQL_REPLAY = graphql_replay and use_proxy
+    FETCH_OVERVIEWS = fetch_overviews and use_proxy
+    REUSE_SESSION = reuse_session
+    DATA_ONLY = data_only
+    search_request = None
+    search_page_info = None
+    overview_request = None
+    rate = RateController.from_config('wellfound')
     
     logger.info("Starting Wellfound scraper...")
     
@@ -541,17 +758,36 @@ def run_wellfound_scraper(headless=False, output_file=None, use_proxy=True):
         if not os.path.exists(output_dir):
             os.makedirs(output_dir)
         
+        job_sink = create_job_sink(output_file=OUTPUT_FILE, prefix='wellfound_results', source='wellfound', **OUTPUT_OPTIONS)
+        seen_index = SeenIndex(output_dir, 'wellfound', use_bloom=True) if skip_seen or incremental else None
+        response_cache = ResponseCache(
+            os.path.join(output_dir, '.cache', 'responses.db'),
+            ttls={'overview': float(config.get_setting('wellfound', 'cache_ttl_overview', '604800'))},
+            max_bytes=int(config.get_setting('general', 'cache_max_mb', '256')) * 1024 * 1024,
+        ) if use_cache else None
+        incremental_stop = IncrementalStop(
+            threshold=float(config.get_setting('general', 'incremental_overlap', '0.8')),
+            patience=int(config.get_setting('general', 'incremental_patience', '2')),
+        ) if incremental else None
+        
         # Start mitmproxy
         if use_proxy:
             logger.info("Starting Mitmproxy...")
             try:
-                mitm_process = start_mitmproxy()
+                if proxy_mode == 'inprocess':
+                    host, port = PROXY.split(':')
+                    engine = ProxyEngine(host, int(port)).start()
+                    monitor_thread = threading.Thread(target=monitor_proxy_engine, args=(engine, stop_event))
+                else:
+                    # Start from an empty channel before the addon can append to it
+                    reader = ChannelReader(CHANNEL_FILE)
+                    mitm_process = start_mitmproxy()
+                    monitor_thread = threading.Thread(target=monitor_mitmproxy, args=(mitm_process, stop_event, reader))
                 
                 # Start Mitmproxy monitoring in a separate thread
-                monitor_thread = threading.Thread(target=monitor_mitmproxy, args=(mitm_process, stop_event))
                 monitor_thread.daemon = True
                 monitor_thread.start()
-            except FileNotFoundError:
+            except (FileNotFoundError, ImportError):
                 logger.error("Mitmproxy not found. Please install mitmproxy using 'pip install mitmproxy'")
                 return False
         
@@ -573,6 +809,17 @@ def run_wellfound_scraper(headless=False, output_file=None, use_proxy=True):
             if 'monitor_thread' in locals():
                 monitor_thread.join(timeout=5)
         
+        # Write everything collected so far to the workbook
+        if job_sink is not None and job_sink.close():
+            # Only remember jobs once they are safely written
+            if seen_index is not None:
+                seen_index.save()
+        if seen_index is not None:
+            logger.info(f"Skipped {seen_index.hits} jobs already scraped by a previous run")
+        if response_cache is not None:
+            response_cache.close()
+            response_cache = None
+        
         # Clean up display if it was started
         global display, DISPLAY_AVAILABLE
         if display is not None and DISPLAY_AVAILABLE:
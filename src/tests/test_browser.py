@@ -0,0 +1,231 @@
+"""
+Tests for the browser utilities.
+"""
+import os
+import json
+import shutil
+import tempfile
+import threading
+import unittest
+from unittest import mock
+
+# Add the project root to the path so we can import our modules
+import sys
+project_root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.append(project_root)
+
+from src.scrapers.core import browser
+from src.scrapers.core.browser import BrowserPool, blocked_url_patterns, clear_browser_data, resolve_chrome, RESOURCE_PATTERNS
+
+class FakeDriver:
+    """Driver that records how it was reset."""
+    
+    def __init__(self):
+        self.healthy = True
+        self.cookies_cleared = 0
+        self.quit_calls = 0
+        self.url = None
+        self.origin = 'https://jobright.ai'
+        self.cookies = [{'name': 'sid', 'domain': '.jobright.ai'}, {'name': 'sso', 'domain': 'accounts.google.com'}]
+        self.cleared_origins = []
+    
+    @property
+    def window_handles(self):
+        return ['main']
+    
+    def execute_script(self, script):
+        if not self.healthy:
+            raise RuntimeError('chrome not reachable')
+        return self.origin if 'origin' in script else 1
+    
+    def execute_cdp_cmd(self, cmd, params):
+        if cmd == 'Storage.getCookies':
+            return {'cookies': list(self.cookies)}
+        if cmd == 'Network.clearBrowserCookies':
+            self.cookies_cleared += 1
+            self.cookies = []
+        elif cmd == 'Storage.clearDataForOrigin':
+            self.cleared_origins.append(params['origin'])
+        return {}
+    
+    def get(self, url):
+        self.url = url
+    
+    def quit(self):
+        self.quit_calls += 1
+
+class TestBrowserPool(unittest.TestCase):
+    """Test cases for BrowserPool."""
+    
+    def setUp(self):
+        """Set up a pool of fake drivers."""
+        self.drivers = []
+        
+        def factory():
+            driver = FakeDriver()
+            self.drivers.append(driver)
+            return driver
+        
+        self.factory = factory
+    
+    def test_reuses_started_browsers(self):
+        """Test that released browsers are leased again instead of starting new ones."""
+        pool = BrowserPool(size=2, factory=self.factory).start()
+        self.assertEqual(len(self.drivers), 2)
+        
+        for _ in range(5):
+            with pool.leased() as driver:
+                self.assertIn(driver, self.drivers)
+        self.assertEqual(pool.started, 2)
+        self.assertEqual(pool.leases, 5)
+        self.assertEqual(sum(d.cookies_cleared for d in self.drivers), 5)
+        pool.close()
+        self.assertTrue(all(d.quit_calls == 1 for d in self.drivers))
+    
+    def test_reset_policies(self):
+        """Test that 'keep' leaves cookies and 'restart' replaces the browser."""
+        pool = BrowserPool(size=1, factory=self.factory, reset='keep')
+        driver = pool.lease()
+        pool.release(driver)
+        self.assertEqual((driver.cookies_cleared, driver.url), (0, 'about:blank'))
+        
+        self.assertIs(pool.lease(), driver)
+        pool.release(driver, reset='restart')
+        self.assertEqual(driver.quit_calls, 1)
+        self.assertIsNot(pool.lease(), driver)
+        self.assertEqual(pool.started, 2)
+        
+        with self.assertRaises(ValueError):
+            BrowserPool(reset='sometimes')
+    
+    def test_replaces_unhealthy_idle_and_worn_browsers(self):
+        """Test health checks, idle recycling and the use limit."""
+        pool = BrowserPool(size=1, factory=self.factory, max_uses=2)
+        driver = pool.lease()
+        pool.release(driver)
+        driver.healthy = False
+        replacement = pool.lease()
+        self.assertIsNot(replacement, driver)
+        self.assertEqual(driver.quit_calls, 1)
+        
+        pool.release(replacement)
+        self.assertIs(pool.lease(), replacement)
+        pool.release(replacement)
+        self.assertEqual(replacement.quit_calls, 1)
+        
+        pool.max_idle = 0
+        driver = pool.lease()
+        pool.release(driver)
+        self.assertIsNot(pool.lease(), driver)
+        self.assertEqual(driver.quit_calls, 1)
+    
+    def test_lease_waits_for_release(self):
+        """Test that leases block while every browser is in use."""
+        pool = BrowserPool(size=1, factory=self.factory)
+        driver = pool.lease()
+        with self.assertRaises(TimeoutError):
+            pool.lease(timeout=0.05)
+        
+        threading.Timer(0.05, pool.release, args=(driver,)).start()
+        self.assertIs(pool.lease(timeout=5), driver)
+        self.assertEqual(pool.started, 1)
+
+class TestClearBrowserData(unittest.TestCase):
+    """Test cases for clear_browser_data."""
+    
+    def test_clears_every_visited_site(self):
+        """Test that cookies are cleared browser-wide and storage of other origins too."""
+        driver = FakeDriver()
+        self.assertEqual(clear_browser_data(driver), 4)
+        self.assertEqual(driver.cookies, [])
+        self.assertEqual(sorted(driver.cleared_origins), [
+            'http://accounts.google.com', 'http://jobright.ai', 'https://accounts.google.com', 'https://jobright.ai',
+        ])
+        
+        # Nothing but cookies can be cleared from a blank page
+        driver = FakeDriver()
+        driver.origin, driver.cookies = 'null', []
+        self.assertEqual(clear_browser_data(driver), 0)
+        self.assertEqual(driver.cookies_cleared, 1)
+
+class TestBlockedUrlPatterns(unittest.TestCase):
+    """Test cases for the data-only URL patterns."""
+    
+    def test_patterns(self):
+        """Test that resource types expand to their patterns and unknown ones are skipped."""
+        patterns = blocked_url_patterns(['image', 'font', 'script'], ['*tracker.example*'])
+        self.assertEqual(patterns, RESOURCE_PATTERNS['image'] + RESOURCE_PATTERNS['font'] + ['*tracker.example*'])
+        self.assertNotIn('*.css', patterns)
+
+class TestResolveChrome(unittest.TestCase):
+    """Test cases for the cached Chrome resolver."""
+    
+    def setUp(self):
+        """Set up a fake Chrome binary and driver."""
+        self.test_dir = tempfile.mkdtemp()
+        self.binary = os.path.join(self.test_dir, 'chrome')
+        self.driver = os.path.join(self.test_dir, 'chromedriver')
+        for path in (self.binary, self.driver):
+            open(path, 'w').close()
+        self.cache_file = os.path.join(self.test_dir, '.cache', 'chrome.json')
+    
+    def tearDown(self):
+        """Clean up the temporary directory."""
+        shutil.rmtree(self.test_dir)
+    
+    def resolve(self):
+        manager = mock.Mock()
+        manager.return_value.install.return_value = self.driver
+        with mock.patch.object(browser, 'find_chrome_binary', return_value=self.binary) as find, \
+                mock.patch.object(browser, 'chrome_version', return_value=120), \
+                mock.patch('webdriver_manager.chrome.ChromeDriverManager', manager):
+            resolved = resolve_chrome(cache_file=self.cache_file)
+        return resolved, find.call_count, manager.return_value.install.call_count
+    
+    def test_cached_until_chrome_changes(self):
+        """Test that resolution is cached on disk and redone when the binary changes."""
+        resolved, finds, installs = self.resolve()
+        self.assertEqual((resolved['binary'], resolved['version_main'], resolved['driver']), (self.binary, 120, self.driver))
+        self.assertEqual((finds, installs), (1, 1))
+        with open(self.cache_file) as f:
+            self.assertEqual(json.load(f)['driver'], self.driver)
+        
+        resolved, finds, installs = self.resolve()
+        self.assertEqual(resolved['driver'], self.driver)
+        self.assertEqual((finds, installs), (0, 0))
+        
+        # Chrome was updated
+        stat = os.stat(self.binary)
+        os.utime(self.binary, (stat.st_atime, stat.st_mtime + 10))
+        _, finds, installs = self.resolve()
+        self.assertEqual((finds, installs), (1, 1))
+        
+        # The driver was deleted
+        os.remove(self.driver)
+        _, finds, installs = self.resolve()
+        self.assertEqual((finds, installs), (1, 1))
+    
+    def test_failed_driver_install_is_not_cached(self):
+        """Test that a failed driver install is retried on the next call."""
+        manager = mock.Mock()
+        manager.return_value.install.side_effect = ConnectionError('offline')
+        with mock.patch.object(browser, 'find_chrome_binary', return_value=self.binary), \
+                mock.patch.object(browser, 'chrome_version', return_value=120), \
+                mock.patch.object(browser.shutil, 'which', return_value=None), \
+                mock.patch('webdriver_manager.chrome.ChromeDriverManager', manager):
+            resolved = resolve_chrome(cache_file=self.cache_file)
+        self.assertIsNone(resolved['driver'])
+        self.assertFalse(os.path.exists(self.cache_file))
+        
+        resolved, finds, installs = self.resolve()
+        self.assertEqual(resolved['driver'], self.driver)
+        self.assertEqual((finds, installs), (1, 1))
+        
+        # A cache written without a driver is a miss too
+        with open(self.cache_file, 'w') as f:
+            json.dump(dict(resolved, driver=None), f)
+        _, finds, installs = self.resolve()
+        self.assertEqual((finds, installs), (1, 1))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,91 @@
+"""
+Tests for the proxy capture channel.
+"""
+import os
+import json
+import time
+import unittest
+import tempfile
+import shutil
+import threading
+
+# Add the project root to the path so we can import our modules
+import sys
+project_root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.append(project_root)
+
+from src.scrapers.core.capture_channel import ChannelWriter, ChannelReader
+
+class TestCaptureChannel(unittest.TestCase):
+    """Test cases for the capture channel."""
+    
+    def setUp(self):
+        """Set up test environment."""
+        self.temp_dir = tempfile.mkdtemp()
+        self.channel_file = os.path.join(self.temp_dir, 'capture.channel')
+    
+    def tearDown(self):
+        """Clean up test environment."""
+        shutil.rmtree(self.temp_dir)
+    
+    def test_partial_frame(self):
+        """Test that a frame still being written is delivered on the next read."""
+        reader = ChannelReader(self.channel_file)
+        writer = ChannelWriter(self.channel_file)
+        writer.send('{"data": {"a": 1}}')
+        
+        with open(self.channel_file, 'ab') as f:
+            f.write(b'1 18\n{"data": ')
+        self.assertEqual(reader.read(), [b'{"data": {"a": 1}}'])
+        
+        with open(self.channel_file, 'ab') as f:
+            f.write(b'{"b": 2}}\n')
+        self.assertEqual(reader.read(), [b'{"data": {"b": 2}}'])
+        self.assertEqual(reader.read(), [])
+        self.assertEqual(reader.lost, 0)
+        writer.close()
+    
+    def test_bursts_are_lossless(self):
+        """Stress test: bursts of responses from several threads while the reader tails."""
+        reader = ChannelReader(self.channel_file)
+        writer = ChannelWriter(self.channel_file)
+        threads, bursts, burst_size = 4, 20, 25
+        received = []
+        done = threading.Event()
+        
+        def tail():
+            while True:
+                finished = done.is_set()
+                received.extend(reader.read())
+                if finished:
+                    break
+                time.sleep(0.001)
+        
+        def addon(thread):
+            # Stand-in for mitmproxy's response hook, bodies of varying size
+            for burst in range(bursts):
+                for i in range(burst_size):
+                    body = {'data': {'thread': thread, 'n': burst * burst_size + i, 'pad': 'x' * (i * 97)}}
+                    writer.send(json.dumps(body))
+                time.sleep(0.002)
+        
+        tailer = threading.Thread(target=tail)
+        tailer.start()
+        senders = [threading.Thread(target=addon, args=(t,)) for t in range(threads)]
+        for sender in senders:
+            sender.start()
+        for sender in senders:
+            sender.join()
+        done.set()
+        tailer.join()
+        writer.close()
+        
+        self.assertEqual(len(received), threads * bursts * burst_size)
+        self.assertEqual(reader.lost, 0)
+        # Each thread's responses arrive in the order they were sent
+        for t in range(threads):
+            sequence = [body['data']['n'] for body in map(json.loads, received) if body['data']['thread'] == t]
+            self.assertEqual(sequence, list(range(bursts * burst_size)))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,114 @@
+"""
+Tests for the network response capture.
+"""
+import os
+import json
+import time
+import unittest
+
+# Add the project root to the path so we can import our modules
+import sys
+project_root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.append(project_root)
+
+from src.scrapers.core.cdp_capture import ResponseCapture, enable_performance_log, PERF_LOGGING_PREFS
+
+def event(method, **params):
+    return {'message': json.dumps({'message': {'method': method, 'params': params}})}
+
+class FakeDriver:
+    """Driver that replays batches of performance log entries."""
+    
+    def __init__(self, batches, bodies):
+        self.batches = list(batches)
+        self.bodies = bodies
+    
+    def get_log(self, log_type):
+        return self.batches.pop(0) if self.batches else []
+    
+    def execute_cdp_cmd(self, cmd, params):
+        return {'body': self.bodies[params['requestId']]}
+
+class TestResponseCapture(unittest.TestCase):
+    """Test cases for ResponseCapture."""
+    
+    def test_returns_when_responses_finish(self):
+        """Test that the capture waits for every tracked response to finish."""
+        driver = FakeDriver([
+            [
+                event('Network.responseReceived', requestId='1', response={'url': 'https://x/list/jobs?p=1'}),
+                event('Network.responseReceived', requestId='2', response={'url': 'https://x/other'}),
+                event('Network.responseReceived', requestId='3', response={'url': 'https://x/list/jobs?p=2'}),
+                event('Network.loadingFinished', requestId='1'),
+                event('Network.loadingFinished', requestId='2'),
+            ],
+            [],
+            [event('Network.loadingFinished', requestId='3')],
+        ], {'1': 'page 1', '2': 'other', '3': 'page 2'})
+        capture = ResponseCapture(driver, '/list/jobs', poll_interval=0.01)
+        
+        responses = capture.wait(timeout=5)
+        self.assertEqual(responses, [('https://x/list/jobs?p=1', 'page 1'), ('https://x/list/jobs?p=2', 'page 2')])
+    
+    def test_timeout(self):
+        """Test that the capture gives up after the timeout."""
+        driver = FakeDriver([
+            [event('Network.responseReceived', requestId='1', response={'url': 'https://x/list/jobs'})],
+            [event('Network.loadingFailed', requestId='1', errorText='net::ERR_FAILED')],
+        ], {})
+        capture = ResponseCapture(driver, '/list/jobs', poll_interval=0.01)
+        
+        start = time.monotonic()
+        self.assertEqual(capture.wait(timeout=0.1), [])
+        self.assertLess(time.monotonic() - start, 1)
+    
+    def test_filters_before_decoding(self):
+        """Test that only events that can matter are decoded and counted as kept."""
+        driver = FakeDriver([[
+            event('Page.frameNavigated', frame={'url': 'https://x/list/jobs'}),
+            event('Network.responseReceived', requestId='1', response={'url': 'https://x/other'}),
+            event('Network.loadingFinished', requestId='1'),
+            event('Network.responseReceived', requestId='2', response={'url': 'https://x/list/jobs'}),
+            event('Network.dataReceived', requestId='2'),
+            event('Network.loadingFinished', requestId='2'),
+        ]], {'2': 'page'})
+        capture = ResponseCapture(driver, '/list/jobs', poll_interval=0.01)
+        
+        self.assertEqual(capture.wait(timeout=1), [('https://x/list/jobs', 'page')])
+        self.assertEqual((capture.seen, capture.kept), (6, 2))
+        self.assertIn('kept 2 of 6', capture.stats())
+    
+    def test_caps_pending_responses(self):
+        """Test that the oldest tracked responses are dropped past the cap."""
+        driver = FakeDriver([
+            [event('Network.responseReceived', requestId=str(i), response={'url': f'https://x/list/jobs?p={i}'}) for i in range(3)],
+            [event('Network.loadingFinished', requestId=str(i)) for i in range(3)],
+        ], {'1': 'page 1', '2': 'page 2'})
+        capture = ResponseCapture(driver, '/list/jobs', poll_interval=0.01, max_pending=2)
+        
+        responses = capture.wait(timeout=1)
+        self.assertEqual([body for _, body in responses], ['page 1', 'page 2'])
+        self.assertEqual(capture.dropped, 1)
+    
+    def test_enable_performance_log(self):
+        """Test that only Network events are enabled in the performance log."""
+        class FakeOptions:
+            def __init__(self):
+                self.capabilities = {}
+                self.experimental_options = {}
+            
+            def set_capability(self, name, value):
+                self.capabilities[name] = value
+            
+            def add_experimental_option(self, name, value):
+                self.experimental_options[name] = value
+        
+        options, capabilities = FakeOptions(), {}
+        enable_performance_log(options, capabilities)
+        self.assertEqual(options.capabilities['goog:loggingPrefs'], {'performance': 'ALL'})
+        self.assertEqual(options.experimental_options['perfLoggingPrefs'], PERF_LOGGING_PREFS)
+        self.assertFalse(PERF_LOGGING_PREFS['enablePage'])
+        self.assertEqual(capabilities['goog:loggingPrefs'], {'performance': 'ALL'})
+
+if __name__ == '__main__':
+    unittest.main()
@@ -12,7 +12,11 @@ import sys
 project_root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 sys.path.append(project_root)
 
-from src.scrapers.core.data_handler import save_to_excel, save_to_json
+from src.scrapers.core.data_handler import (
+    save_to_excel, save_to_json, JobSink, NDJSONSink, StreamingExcelSink, read_ndjson, create_job_sink,
+    ParquetSink, load_parquet_jobs, PYARROW_AVAILABLE
+)
+from src.scrapers.core.records import JobRightRecord, WellfoundRecord, records_to_columns
 
 class TestDataHandler(unittest.TestCase):
     """Test cases for the data handler functions."""
@@ -27,6 +31,12 @@ class TestDataHandler(unittest.TestCase):
         """Clean up temporary directory."""
         shutil.rmtree(self.temp_dir)
     
+    def crash(self, sink):
+        """Drop a sink the way a killed process would, releasing its files."""
+        if sink._spool is not None:
+            sink._spool._file.close()
+        sink._lock.close()
+    
     def test_save_to_excel(self):
         """Test saving data to Excel."""
         # Create test data
@@ -102,5 +112,182 @@ class TestDataHandler(unittest.TestCase):
         self.assertTrue('Title' in df.columns)
         self.assertTrue('Company' in df.columns)
 
+    def test_job_sink_writes_once_on_close(self):
+        """Test that the batch writer only writes the workbook on close."""
+        output_file = os.path.join(self.output_dir, 'test_sink.xlsx')
+        sink = JobSink(output_file=output_file, flush_rows=2)
+        
+        for i in range(5):
+            sink.write({'Title': [f'Job {i}'], 'Company': [f'Company {i}']})
+        
+        # Rows are spooled, but the workbook is not written yet
+        self.assertFalse(os.path.exists(output_file))
+        self.assertTrue(os.path.exists(sink.spool_file))
+        
+        result = sink.close()
+        
+        self.assertEqual(result, output_file)
+        self.assertFalse(os.path.exists(sink.spool_file))
+        df = pd.read_excel(output_file)
+        self.assertEqual(len(df), 5)
+        self.assertEqual(df['Title'][4], 'Job 4')
+    
+    def test_job_sink_recovers_spool(self):
+        """Test that rows spooled before a crash are written by the next sink."""
+        output_file = os.path.join(self.output_dir, 'test_recover.xlsx')
+        crashed = JobSink(output_file=output_file, flush_rows=1)
+        crashed.write({'Title': ['Job 1'], 'Company': ['Company 1']})
+        # The buffered row below is lost, as it never reached the spool
+        crashed.flush_rows = 10
+        crashed.write({'Title': ['Job 2'], 'Company': ['Company 2']})
+        self.crash(crashed)
+        
+        with JobSink(output_file=output_file) as sink:
+            sink.write({'Title': ['Job 3'], 'Company': ['Company 3']})
+        
+        df = pd.read_excel(output_file)
+        self.assertEqual(list(df['Title']), ['Job 1', 'Job 3'])
+    
+    def test_job_sink_recovers_spool_of_earlier_run(self):
+        """Test that a new run recovers the spool of a crashed run with another timestamp."""
+        crashed_file = os.path.join(self.output_dir, 'wellfound_2026-01-01-10-00.xlsx')
+        crashed = JobSink(output_file=crashed_file, flush_rows=1)
+        crashed.write({'Title': ['Job 1'], 'Company': ['Company 1']})
+        crashed.write({'Title': ['Job 2'], 'Company': ['Company 2']})
+        self.crash(crashed)
+        # Another source's spool is left alone
+        other = JobSink(output_file=os.path.join(self.output_dir, 'jobright_2026-01-01-10-00.xlsx'), flush_rows=1)
+        other.write({'Title': ['Job 9'], 'Company': ['Company 9']})
+        
+        output_file = os.path.join(self.output_dir, 'wellfound_2026-01-01-11-30.xlsx')
+        with JobSink(output_file=output_file) as sink:
+            self.assertFalse(os.path.exists(crashed.spool_file))
+            self.assertTrue(os.path.exists(other.spool_file))
+            sink.write({'Title': ['Job 3'], 'Company': ['Company 3']})
+        
+        self.assertEqual(list(pd.read_excel(crashed_file)['Title']), ['Job 1', 'Job 2'])
+        self.assertEqual(list(pd.read_excel(output_file)['Title']), ['Job 3'])
+        self.assertFalse(os.path.exists(crashed.lock_file))
+        other.close()
+    
+    def test_job_sink_leaves_spool_of_running_sink(self):
+        """Test that a sink does not recover the spool of another sink that is still open."""
+        first_file = os.path.join(self.output_dir, 'wellfound_2026-01-01-10-00.xlsx')
+        second_file = os.path.join(self.output_dir, 'wellfound_2026-01-01-11-00.xlsx')
+        first = JobSink(output_file=first_file, flush_rows=1)
+        first.write({'Title': ['Job 1'], 'Company': ['Company 1']})
+        
+        second = JobSink(output_file=second_file, flush_rows=1)
+        self.assertTrue(os.path.exists(first.spool_file))
+        self.assertFalse(os.path.exists(first_file))
+        
+        first.write({'Title': ['Job 2'], 'Company': ['Company 2']})
+        second.write({'Title': ['Job 3'], 'Company': ['Company 3']})
+        self.assertEqual(first.close(), first_file)
+        self.assertEqual(second.close(), second_file)
+        
+        self.assertEqual(list(pd.read_excel(first_file)['Title']), ['Job 1', 'Job 2'])
+        self.assertEqual(list(pd.read_excel(second_file)['Title']), ['Job 3'])
+        self.assertEqual(sorted(os.listdir(self.output_dir)), sorted([os.path.basename(first_file), os.path.basename(second_file)]))
+
+    def test_ndjson_sink(self):
+        """Test streaming records to a line-delimited JSON file."""
+        output_file = os.path.join(self.output_dir, 'test_stream.ndjson')
+        sink = NDJSONSink(output_file=output_file, fsync='every_n', fsync_every=2)
+        
+        sink.write({'Title': ['Job 1'], 'Company': ['Company 1']})
+        sink.write([{'Title': 'Job 2', 'Company': 'Company 2'}, {'Title': 'Job 3', 'Company': 'Company 3'}])
+        
+        # Lines are readable before the sink is closed
+        self.assertEqual(len(read_ndjson(output_file)), 3)
+        
+        self.assertEqual(sink.close(), output_file)
+        records = read_ndjson(output_file)
+        self.assertEqual([r['Title'] for r in records], ['Job 1', 'Job 2', 'Job 3'])
+    
+    def test_ndjson_sink_rejects_unknown_policy(self):
+        """Test that an unknown fsync policy is rejected."""
+        with self.assertRaises(ValueError):
+            NDJSONSink(output_file=os.path.join(self.output_dir, 'bad.ndjson'), fsync='sometimes')
+    
+    def test_create_job_sink_multiple_formats(self):
+        """Test writing the same rows to Excel and NDJSON."""
+        output_file = os.path.join(self.output_dir, 'test_multi.xlsx')
+        sink = create_job_sink(output_file=output_file, formats=['xlsx', 'ndjson'])
+        sink.write({'Title': ['Job 1'], 'Company': ['Company 1']})
+        sink.close()
+        
+        self.assertEqual(len(pd.read_excel(output_file)), 1)
+        self.assertEqual(read_ndjson(os.path.join(self.output_dir, 'test_multi.ndjson'))[0]['Title'], 'Job 1')
+
+    def test_streaming_excel_sink(self):
+        """Test writing a workbook row by row in write-only mode."""
+        output_file = os.path.join(self.output_dir, 'test_stream.xlsx')
+        with StreamingExcelSink(output_file) as sink:
+            sink.write({'Title': ['Job 1'], 'Company': ['Company 1']})
+            sink.write({'Title': ['Job 2'], 'Company': ['Company 2'], 'Extra': ['dropped']})
+        
+        df = pd.read_excel(output_file)
+        self.assertEqual(list(df.columns), ['Title', 'Company'])
+        self.assertEqual(list(df['Title']), ['Job 1', 'Job 2'])
+        
+        # Streaming export only creates new files
+        with self.assertRaises(ValueError):
+            StreamingExcelSink(output_file)
+    
+    def test_job_records(self):
+        """Test writing typed records and converting them to columns."""
+        records = [JobRightRecord(apply_link=f'https://x/{i}', title=f'Job {i}') for i in range(3)]
+        
+        columns = records_to_columns(records)
+        self.assertEqual(list(columns), JobRightRecord.columns())
+        self.assertEqual(columns['Title'], ['Job 0', 'Job 1', 'Job 2'])
+        
+        output_file = os.path.join(self.output_dir, 'test_records.xlsx')
+        with JobSink(output_file=output_file) as sink:
+            for record in records:
+                sink.write(record)
+        
+        df = pd.read_excel(output_file)
+        self.assertEqual(list(df.columns), JobRightRecord.columns())
+        self.assertEqual(df['Apply now'][2], 'https://x/2')
+    
+    @unittest.skipUnless(PYARROW_AVAILABLE, 'pyarrow is not installed')
+    def test_parquet_sink_partitions(self):
+        """Test writing and loading partitioned Parquet output."""
+        dataset_dir = os.path.join(self.output_dir, 'parquet')
+        
+        with ParquetSink(dataset_dir, 'jobright', scrape_date='2025-01-01') as sink:
+            sink.write({'Title': ['Job 1'], 'Company name': ['Company 1']})
+        with ParquetSink(dataset_dir, 'jobright', scrape_date='2025-01-02') as sink:
+            sink.write({'Title': ['Job 2'], 'Company name': ['Company 2']})
+        with ParquetSink(dataset_dir, 'wellfound', scrape_date='2025-01-02') as sink:
+            sink.write(WellfoundRecord(title='Job 3', company_name='Company 3', badges='Hiring', website=None))
+        
+        self.assertTrue(os.path.isdir(os.path.join(dataset_dir, 'source=jobright', 'scrape_date=2025-01-01')))
+        
+        df = load_parquet_jobs(dataset_dir, source='jobright', start_date='2025-01-02', columns=['Title'])
+        self.assertEqual(list(df.columns), ['Title'])
+        self.assertEqual(list(df['Title']), ['Job 2'])
+        
+        df = load_parquet_jobs(dataset_dir, source='wellfound')
+        self.assertEqual(df['Badges'][0], 'Hiring')
+        self.assertTrue(pd.isna(df['Website'][0]))
+    
+    @unittest.skipUnless(PYARROW_AVAILABLE, 'pyarrow is not installed')
+    def test_parquet_sinks_started_together(self):
+        """Test that sinks of one source and date started in the same second keep their own files."""
+        dataset_dir = os.path.join(self.output_dir, 'parquet')
+        first = ParquetSink(dataset_dir, 'jobright', scrape_date='2025-01-01')
+        second = ParquetSink(dataset_dir, 'jobright', scrape_date='2025-01-01')
+        first.write({'Title': ['Job 1'], 'Company name': ['Company 1']})
+        second.write({'Title': ['Job 2'], 'Company name': ['Company 2']})
+        first.close()
+        second.close()
+        
+        self.assertEqual(len(set(first.files_written + second.files_written)), 2)
+        df = load_parquet_jobs(dataset_dir, source='jobright')
+        self.assertEqual(sorted(df['Title']), ['Job 1', 'Job 2'])
+
 if __name__ == '__main__':
     unittest.main()
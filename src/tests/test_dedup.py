@@ -0,0 +1,83 @@
+"""
+Tests for the deduplication module.
+"""
+import os
+import unittest
+import tempfile
+import shutil
+
+# Add the project root to the path so we can import our modules
+import sys
+project_root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.append(project_root)
+
+from src.scrapers.core.dedup import SeenIndex, BloomFilter, IncrementalStop, fingerprint
+
+class TestSeenIndex(unittest.TestCase):
+    """Test cases for the SeenIndex class."""
+    
+    def setUp(self):
+        """Set up a temporary output directory for testing."""
+        self.temp_dir = tempfile.mkdtemp()
+    
+    def tearDown(self):
+        """Clean up temporary directory."""
+        shutil.rmtree(self.temp_dir)
+    
+    def test_fingerprint_normalizes_key(self):
+        """Test that keys differing only in case and spacing match."""
+        self.assertEqual(fingerprint('42:Senior  Engineer '), fingerprint('42:senior engineer'))
+        self.assertNotEqual(fingerprint('42:Engineer'), fingerprint('43:Engineer'))
+    
+    def test_seen_across_runs(self):
+        """Test that saved jobs are seen by the next run only."""
+        index = SeenIndex(self.temp_dir, 'jobright')
+        index.add('https://x/1')
+        self.assertTrue(index.seen('https://x/1'))
+        
+        # Nothing is persisted until save()
+        self.assertFalse(SeenIndex(self.temp_dir, 'jobright').seen('https://x/1'))
+        index.save()
+        
+        for use_bloom in (False, True):
+            next_run = SeenIndex(self.temp_dir, 'jobright', use_bloom=use_bloom)
+            self.assertTrue(next_run.seen('https://x/1'))
+            self.assertFalse(next_run.seen('https://x/2'))
+            self.assertEqual(next_run.hits, 1)
+        
+        # Indexes are kept per source
+        self.assertFalse(SeenIndex(self.temp_dir, 'wellfound').seen('https://x/1'))
+    
+    def test_bloom_filter(self):
+        """Test that the Bloom filter has no false negatives."""
+        bloom = BloomFilter(1000)
+        fps = [fingerprint(f'job-{i}') for i in range(1000)]
+        for fp in fps:
+            bloom.add(fp)
+        
+        self.assertTrue(all(fp in bloom for fp in fps))
+        false_positives = sum(fingerprint(f'other-{i}') in bloom for i in range(1000))
+        self.assertLess(false_positives, 50)
+    
+    def test_incremental_stop(self):
+        """Test that the scrape stops after consecutive known pages only."""
+        stop = IncrementalStop(threshold=0.8, patience=2)
+        stop.observe(20, 17)
+        stop.observe(20, 2)
+        stop.observe(0, 0)
+        self.assertFalse(stop.done)
+        
+        stop.observe(20, 16)
+        self.assertFalse(stop.done)
+        stop.observe(20, 20)
+        self.assertTrue(stop.done)
+        self.assertEqual(stop.pages, 4)
+        
+        # Membership checks do not count as skipped jobs
+        index = SeenIndex(self.temp_dir, 'jobright')
+        index.add('https://x/1')
+        self.assertIn('https://x/1', index)
+        self.assertEqual(index.hits, 0)
+
+if __name__ == '__main__':
+    unittest.main()
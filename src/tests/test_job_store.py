@@ -0,0 +1,61 @@
+"""
+Tests for the job store module.
+"""
+import os
+import unittest
+import tempfile
+import shutil
+
+# Add the project root to the path so we can import our modules
+import sys
+project_root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.append(project_root)
+
+from src.scrapers.core.job_store import JobStore, JobStoreSink, job_key
+
+class TestJobStore(unittest.TestCase):
+    """Test cases for the JobStore class."""
+    
+    def setUp(self):
+        """Set up a temporary database for testing."""
+        self.temp_dir = tempfile.mkdtemp()
+        self.db_path = os.path.join(self.temp_dir, 'output', 'jobs.db')
+    
+    def tearDown(self):
+        """Clean up temporary directory."""
+        shutil.rmtree(self.temp_dir)
+    
+    def test_job_key(self):
+        """Test job identities for each source."""
+        self.assertEqual(job_key('jobright', {'Apply now': ' https://x/1 '}), 'https://x/1')
+        self.assertEqual(job_key('wellfound', {'Startup id': '42', 'Title': 'Engineer'}), '42:Engineer')
+        self.assertEqual(job_key('wellfound', {'Title': 'Engineer'}), '')
+    
+    def test_upsert_keeps_one_row_per_job(self):
+        """Test that re-scraped jobs update the existing row."""
+        store = JobStore(self.db_path)
+        store.upsert_many('jobright', [{'Apply now': 'https://x/1', 'Salary': '$1'}], seen_at='2025-01-01T00:00:00')
+        store.upsert_many('jobright', [
+            {'Apply now': 'https://x/1', 'Salary': '$2'},
+            {'Apply now': 'https://x/2', 'Salary': '$3'},
+        ], seen_at='2025-01-02T00:00:00')
+        
+        self.assertEqual(store.count('jobright'), 2)
+        self.assertTrue(store.has_job('jobright', 'https://x/1'))
+        
+        # Only the second job is new on the second day
+        new_jobs = store.new_since('jobright', '2025-01-02T00:00:00')
+        self.assertEqual([job['Apply now'] for job in new_jobs], ['https://x/2'])
+        store.close()
+    
+    def test_sink_skips_rows_without_key(self):
+        """Test that the sink only stores identifiable rows."""
+        with JobStoreSink(self.db_path, 'wellfound') as sink:
+            sink.write({'Startup id': ['1', '1', ''], 'Title': ['A', 'B', 'C']})
+        
+        store = JobStore(self.db_path)
+        self.assertEqual(store.count('wellfound'), 2)
+        store.close()
+
+if __name__ == '__main__':
+    unittest.main()
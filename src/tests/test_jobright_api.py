@@ -0,0 +1,71 @@
+"""
+Tests for the JobRight API pagination.
+"""
+import os
+import json
+import unittest
+
+# Add the project root to the path so we can import our modules
+import sys
+project_root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.append(project_root)
+
+from src.scrapers.jobright.api import iter_job_pages, job_page_fetcher, page_url
+
+def page(n):
+    return {'result': {'jobList': [{'jobResult': {'applyLink': f'https://x/{i}'}} for i in range(n)]}}
+
+class FakeResponse:
+    def __init__(self, body, status_code=200):
+        self.content = json.dumps(body).encode('utf-8')
+        self.status_code = status_code
+    
+    def raise_for_status(self):
+        if self.status_code != 200:
+            raise IOError(f'HTTP {self.status_code}')
+
+class FakeSession:
+    """Session that serves pages of a fixed size until a total is reached."""
+    
+    def __init__(self, total, size):
+        self.total = total
+        self.size = size
+        self.urls = []
+    
+    def get(self, url, timeout=None):
+        self.urls.append(url)
+        position = int(url.split('position=')[1].split('&')[0])
+        return FakeResponse(page(max(min(self.size, self.total - position), 0)))
+
+class TestJobRightApi(unittest.TestCase):
+    """Test cases for JobRight API pagination."""
+    
+    def test_page_url(self):
+        """Test that only the offset parameter is changed."""
+        url = page_url('https://jobright.ai/swan/recommend/list/jobs?refresh=true&position=0', 'position', 40)
+        self.assertEqual(url, 'https://jobright.ai/swan/recommend/list/jobs?refresh=true&position=40')
+    
+    def test_iter_job_pages(self):
+        """Test that pages follow the captured first page until an empty page."""
+        session = FakeSession(total=50, size=20)
+        first_url = 'https://jobright.ai/swan/recommend/list/jobs?refresh=true&position=0'
+        
+        pages = list(iter_job_pages(session, first_url, json.dumps(page(20))))
+        
+        self.assertEqual([url.split('position=')[1] for url, _ in pages], ['20', '40'])
+        self.assertEqual(sum(len(body['result']['jobList']) for _, body in pages), 30)
+        self.assertEqual(len(session.urls), 3)
+    
+    def test_job_page_fetcher(self):
+        """Test that concurrent paging yields the same pages in feed order."""
+        session = FakeSession(total=110, size=20)
+        first_url = 'https://jobright.ai/swan/recommend/list/jobs?refresh=true&position=0'
+        pages = []
+        
+        fetcher = job_page_fetcher(session, first_url, json.dumps(page(20)), lambda url, body: pages.append(url), concurrency=3)
+        fetcher.run()
+        
+        self.assertEqual([url.split('position=')[1] for url in pages], ['20', '40', '60', '80', '100'])
+
+if __name__ == '__main__':
+    unittest.main()
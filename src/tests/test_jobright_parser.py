@@ -0,0 +1,54 @@
+"""
+Tests for the JobRight response parser.
+"""
+import os
+import json
+import unittest
+
+# Add the project root to the path so we can import our modules
+import sys
+project_root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.append(project_root)
+
+from src.scrapers.jobright.parser import parse_job_list, job_to_record
+from src.scrapers.core.records import JobRightRecord
+
+FIXTURE = os.path.join(project_root, 'src', 'benchmarks', 'fixtures', 'jobright_list_jobs.json')
+
+class TestJobRightParser(unittest.TestCase):
+    """Test cases for parsing /list/jobs responses."""
+    
+    def setUp(self):
+        """Load the recorded response fixture."""
+        with open(FIXTURE) as f:
+            self.body = f.read()
+    
+    def test_parse_job_list(self):
+        """Test parsing a whole page into columns."""
+        batch = parse_job_list(self.body)
+        
+        self.assertEqual(list(batch), JobRightRecord.columns())
+        self.assertEqual(len(batch['Apply now']), 3)
+        self.assertEqual(batch['Inustry'][0], 'Software;Data Infrastructure')
+        self.assertEqual(batch['Tags'][1], '')
+        self.assertEqual(batch['Connection name'], ['Alex Kim', '', 'Sam Lee'])
+    
+    def test_matches_row_parser(self):
+        """Test that page and row parsing produce the same rows."""
+        batch = parse_job_list(self.body)
+        rows = [job_to_record(item).to_row() for item in json.loads(self.body)['result']['jobList']]
+        
+        for i, row in enumerate(rows):
+            self.assertEqual({column: values[i] for column, values in batch.items()}, row)
+    
+    def test_empty_and_partial_pages(self):
+        """Test that missing fields do not drop the page."""
+        self.assertEqual(parse_job_list({'result': {'jobList': []}})['Title'], [])
+        
+        batch = parse_job_list({'result': {'jobList': [{'jobResult': {'jobTitle': 'Intern'}}]}})
+        self.assertEqual(batch['Title'], ['Intern'])
+        self.assertEqual(batch['Company name'], [''])
+        self.assertEqual(batch['Inustry'], [''])
+
+if __name__ == '__main__':
+    unittest.main()
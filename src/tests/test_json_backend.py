@@ -0,0 +1,44 @@
+"""
+Tests for the JSON decoding backends.
+"""
+import os
+import unittest
+
+# Add the project root to the path so we can import our modules
+import sys
+project_root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.append(project_root)
+
+from src.scrapers.core import json_backend
+
+class TestJsonBackend(unittest.TestCase):
+    """Test cases for every available JSON backend."""
+    
+    def tearDown(self):
+        """Restore the default backend."""
+        json_backend.set_backend(next(iter(json_backend.BACKENDS)))
+    
+    def test_decodes(self):
+        """Test that every backend decodes str and bytes alike."""
+        for backend in json_backend.BACKENDS:
+            with self.subTest(backend=backend):
+                json_backend.set_backend(backend)
+                self.assertEqual(json_backend.loads('{"a": [1, "x"]}'), {'a': [1, 'x']})
+                self.assertEqual(json_backend.loads(b'{"a": [1, "x"]}'), {'a': [1, 'x']})
+    
+    def test_invalid_input_raises_value_error(self):
+        """Test that every backend raises ValueError on truncated or invalid input."""
+        for backend in json_backend.BACKENDS:
+            for data in (b'{"title": "Data Eng', b'not json', b''):
+                with self.subTest(backend=backend, data=data):
+                    json_backend.set_backend(backend)
+                    with self.assertRaises(ValueError):
+                        json_backend.loads(data)
+    
+    def test_unknown_backend(self):
+        """Test that selecting a missing backend fails."""
+        with self.assertRaises(ValueError):
+            json_backend.set_backend('simdjson')
+
+if __name__ == '__main__':
+    unittest.main()
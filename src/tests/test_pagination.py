@@ -0,0 +1,95 @@
+"""
+Tests for the concurrent pagination engine.
+"""
+import os
+import time
+import random
+import threading
+import unittest
+
+# Add the project root to the path so we can import our modules
+import sys
+project_root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.append(project_root)
+
+from src.scrapers.core.pagination import PageFetcher
+
+class FakeSource:
+    """Paged source with random latency that records concurrency."""
+    
+    def __init__(self, pages, latency=0.02):
+        self.pages = pages
+        self.latency = latency
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.lock = threading.Lock()
+    
+    def fetch(self, page):
+        with self.lock:
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        time.sleep(self.latency * random.uniform(0.5, 1.5))
+        with self.lock:
+            self.in_flight -= 1
+        if page >= self.pages:
+            return None, False
+        return f'page {page}', page < self.pages - 1
+
+class TestPageFetcher(unittest.TestCase):
+    """Test cases for PageFetcher."""
+    
+    def test_pages_consumed_in_order(self):
+        """Test that pages are consumed once each, in order, with bounded concurrency."""
+        source = FakeSource(pages=20)
+        consumed = []
+        fetcher = PageFetcher(source.fetch, lambda page, result: consumed.append(result), concurrency=4)
+        
+        start = time.monotonic()
+        self.assertEqual(fetcher.run(), 20)
+        elapsed = time.monotonic() - start
+        
+        self.assertEqual(consumed, [f'page {i}' for i in range(20)])
+        self.assertLessEqual(source.max_in_flight, 4)
+        self.assertGreater(source.max_in_flight, 1)
+        # Sequential fetching would take about 20 * latency
+        self.assertLess(elapsed, 20 * source.latency)
+    
+    def test_request_budget(self):
+        """Test that no more requests than the budget are made."""
+        source = FakeSource(pages=100, latency=0.001)
+        consumed = []
+        fetcher = PageFetcher(source.fetch, lambda page, result: consumed.append(page), concurrency=3, max_requests=10)
+        
+        fetcher.run()
+        self.assertEqual(fetcher.requests, 10)
+        self.assertEqual(consumed, list(range(10)))
+    
+    def test_consumer_stops_early(self):
+        """Test that returning False from the consumer stops fetching."""
+        source = FakeSource(pages=100, latency=0.001)
+        consumed = []
+        
+        def consume(page, result):
+            consumed.append(page)
+            return page < 4
+        
+        fetcher = PageFetcher(source.fetch, consume, concurrency=4)
+        fetcher.run()
+        self.assertEqual(consumed, [0, 1, 2, 3, 4])
+        self.assertLessEqual(fetcher.requests, 5 + fetcher.window)
+    
+    def test_failed_page_ends_run(self):
+        """Test that a failed page ends the run without gaps in the output."""
+        def fetch(page):
+            if page == 3:
+                raise IOError('connection reset')
+            return page, True
+        
+        consumed = []
+        fetcher = PageFetcher(fetch, lambda page, result: consumed.append(result), concurrency=4, max_requests=50)
+        fetcher.run()
+        self.assertEqual(consumed, [0, 1, 2])
+        self.assertEqual(fetcher.errors, 1)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,91 @@
+"""
+Tests for the in-process Mitmproxy engine.
+"""
+import os
+import queue
+import unittest
+from types import SimpleNamespace
+from unittest.mock import Mock
+
+# Add the project root to the path so we can import our modules
+import sys
+project_root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.append(project_root)
+
+from src.scrapers.wellfound.proxy_engine import ProxyEngine, QueueAddon, REQUEST_KEY, is_capture
+
+def flow(url, content, body='{}'):
+    request = SimpleNamespace(url=url, headers={'Cookie': 'session=1'}, get_text=lambda: body)
+    return SimpleNamespace(request=request, response=SimpleNamespace(content=content))
+
+class TestProxyEngine(unittest.TestCase):
+    """Test cases for the proxy engine addon."""
+    
+    def test_is_capture(self):
+        """Test that only GraphQL responses with startup data are captured."""
+        self.assertTrue(is_capture(flow('https://wellfound.com/graphql', b'{"data": {"talent": {}}}')))
+        self.assertTrue(is_capture(flow('https://wellfound.com/graphql', b'{"data": {"startupOverview": {}}}')))
+        self.assertFalse(is_capture(flow('https://wellfound.com/graphql', b'{"data": {"viewer": {}}}')))
+        self.assertFalse(is_capture(flow('https://wellfound.com/jobs', b'{"data": {"talent": {}}}')))
+        self.assertFalse(is_capture(flow('https://wellfound.com/graphql', b'')))
+    
+    def test_queue_addon(self):
+        """Test that captured responses reach the queue decoded and in order."""
+        captures = queue.Queue()
+        addon = QueueAddon(captures)
+        for i in range(3):
+            addon.response(flow('https://wellfound.com/graphql', b'{"data": {"talent": {"n": %d}}}' % i))
+        addon.response(flow('https://wellfound.com/graphql', b'{"talent": broken'))
+        
+        received = [captures.get_nowait()['data']['talent']['n'] for _ in range(captures.qsize())]
+        self.assertEqual(received, [0, 1, 2])
+    
+    def test_search_request_precedes_response(self):
+        """Test that search requests are captured right before their response."""
+        captures = queue.Queue()
+        addon = QueueAddon(captures)
+        addon.response(flow('https://wellfound.com/graphql', b'{"data": {"talent": {"searchStartups": {}}}}', '{"operationName": "Search"}'))
+        
+        request = captures.get_nowait()[REQUEST_KEY]
+        self.assertEqual(request['body'], '{"operationName": "Search"}')
+        self.assertEqual(request['headers'], {'Cookie': 'session=1'})
+        self.assertIn('talent', captures.get_nowait()['data'])
+
+class TestProxyEngineStartup(unittest.TestCase):
+    """Test cases for starting the in-process proxy."""
+    
+    def engine_with_servers(self, *servers):
+        engine = ProxyEngine('127.0.0.1', 8080)
+        proxyserver = SimpleNamespace(servers=list(servers))
+        engine._master = SimpleNamespace(addons=SimpleNamespace(get=lambda name: proxyserver), shutdown=Mock())
+        return engine
+    
+    def test_ready_once_listening(self):
+        """Test that a running server makes the engine ready without an error."""
+        engine = self.engine_with_servers(SimpleNamespace(is_running=True, last_exception=None))
+        engine._running()
+        self.assertTrue(engine._ready.is_set())
+        self.assertIsNone(engine._error)
+    
+    def test_bind_failure(self):
+        """Test that a server that failed to bind is reported and shuts the proxy down."""
+        bind_error = OSError('[Errno 98] Address already in use')
+        engine = self.engine_with_servers(SimpleNamespace(is_running=False, last_exception=bind_error))
+        engine._running()
+        self.assertTrue(engine._ready.is_set())
+        self.assertIs(engine._error, bind_error)
+        engine._master.shutdown.assert_called_once()
+    
+    def test_start_fails_fast(self):
+        """Test that an exit during startup is raised from start()."""
+        engine = ProxyEngine('127.0.0.1', 8080)
+        
+        async def serve():
+            raise SystemExit(1)
+        
+        engine._serve = serve
+        with self.assertRaises(RuntimeError):
+            engine.start(timeout=5)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,120 @@
+"""
+Tests for the adaptive rate controller.
+"""
+import os
+import unittest
+import threading
+from types import SimpleNamespace
+from http.server import BaseHTTPRequestHandler, HTTPServer
+
+# Add the project root to the path so we can import our modules
+import sys
+project_root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.append(project_root)
+
+from src.scrapers.core.rate_control import RateController
+from src.scrapers.core.http_session import create_session
+
+class ThrottlingHandler(BaseHTTPRequestHandler):
+    """Answers with the next status of the server's ``statuses``."""
+    
+    def do_GET(self):
+        self.server.requests += 1
+        status = self.server.statuses.pop(0) if self.server.statuses else 200
+        self.send_response(status)
+        self.send_header('Content-Length', '2')
+        self.end_headers()
+        self.wfile.write(b'{}')
+    
+    def log_message(self, format, *args):
+        pass
+
+class TestRateController(unittest.TestCase):
+    """Test cases for RateController."""
+    
+    def test_backs_off_and_recovers(self):
+        """Test multiplicative backoff and additive recovery within the bounds."""
+        rate = RateController('test', min_delay=0.5, max_delay=8.0, initial_delay=2.0, backoff=2.0, recovery=0.5)
+        
+        for _ in range(10):
+            rate.record(latency=0.2)
+        self.assertEqual(rate.delay, 0.5)
+        
+        rate.record(status=429)
+        self.assertEqual(rate.delay, 1.0)
+        rate.record(error=True)
+        rate.record(status=503)
+        rate.record(status=429)
+        self.assertEqual(rate.delay, 8.0)
+        self.assertEqual(rate.backoffs, 4)
+        
+        rate.record(latency=0.2)
+        self.assertEqual(rate.delay, 7.5)
+    
+    def test_slow_response_is_pushback(self):
+        """Test that a response much slower than the running average backs off."""
+        rate = RateController('test', min_delay=1.0, max_delay=30.0)
+        for _ in range(5):
+            rate.record(latency=0.1)
+        rate.record(latency=2.0)
+        self.assertEqual(rate.delay, 2.0)
+    
+    def test_call(self):
+        """Test that paced requests record their status."""
+        rate = RateController('test', min_delay=0.0, max_delay=1.0, initial_delay=0.0, recovery=0.1)
+        response = rate.call(lambda url: SimpleNamespace(status_code=429), 'https://x')
+        self.assertEqual(response.status_code, 429)
+        self.assertEqual(rate.backoffs, 1)
+        
+        def fail(url):
+            raise IOError('connection reset')
+        
+        with self.assertRaises(IOError):
+            rate.call(fail, 'https://x')
+        self.assertEqual(rate.backoffs, 2)
+    
+    def test_call_retries_throttled_responses(self):
+        """Test that throttled responses are retried after backing off."""
+        statuses = [SimpleNamespace(status_code=429, headers={}), SimpleNamespace(status_code=503, headers={}),
+                    SimpleNamespace(status_code=200, headers={})]
+        rate = RateController('test', min_delay=0.0, max_delay=1.0, initial_delay=0.0, retries=2)
+        response = rate.call(lambda url: statuses.pop(0), 'https://x')
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(rate.backoffs, 2)
+        
+        # The last throttled response is returned when the retries run out
+        rate = RateController('test', min_delay=0.0, max_delay=1.0, initial_delay=0.0, retries=1)
+        response = rate.call(lambda url: SimpleNamespace(status_code=429, headers={'Retry-After': '0'}), 'https://x')
+        self.assertEqual(response.status_code, 429)
+        self.assertEqual(rate.backoffs, 2)
+    
+    def test_paced_session_lets_throttling_reach_controller(self):
+        """Test that a 429 over a paced session doubles the delay instead of being retried by urllib3."""
+        server = HTTPServer(('127.0.0.1', 0), ThrottlingHandler)
+        server.statuses, server.requests = [429], 0
+        thread = threading.Thread(target=server.serve_forever, daemon=True)
+        thread.start()
+        self.addCleanup(server.server_close)
+        self.addCleanup(server.shutdown)
+        
+        url = f'http://127.0.0.1:{server.server_port}/'
+        rate = RateController('test', min_delay=0.01, max_delay=1.0, backoff=2.0, recovery=0.0, retries=0)
+        session = create_session(paced=True)
+        self.addCleanup(session.close)
+        
+        response = rate.call(session.get, url, timeout=5)
+        self.assertEqual(response.status_code, 429)
+        self.assertEqual(server.requests, 1)
+        self.assertEqual(rate.delay, 0.02)
+        self.assertEqual(rate.backoffs, 1)
+        
+        # With retries, the controller repeats the request after backing off
+        server.statuses = [429]
+        rate.retries = 1
+        response = rate.call(session.get, url, timeout=5)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(server.requests, 3)
+        self.assertEqual(rate.delay, 0.04)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,80 @@
+"""
+Tests for the on-disk response cache.
+"""
+import os
+import time
+import shutil
+import tempfile
+import unittest
+
+# Add the project root to the path so we can import our modules
+import sys
+project_root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.append(project_root)
+
+from src.scrapers.core.response_cache import ResponseCache, cache_key
+
+class TestResponseCache(unittest.TestCase):
+    """Test cases for ResponseCache."""
+    
+    def setUp(self):
+        """Set up a temporary cache directory."""
+        self.test_dir = tempfile.mkdtemp()
+        self.db_path = os.path.join(self.test_dir, '.cache', 'responses.db')
+    
+    def tearDown(self):
+        """Clean up the temporary directory."""
+        shutil.rmtree(self.test_dir)
+    
+    def test_cache_key(self):
+        """Test that keys ignore variable order and tell operations apart."""
+        self.assertEqual(cache_key('startupOverview', {'a': 1, 'b': 2}), cache_key('startupOverview', {'b': 2, 'a': 1}))
+        self.assertNotEqual(cache_key('startupOverview', {'a': 1}), cache_key('searchStartups', {'a': 1}))
+    
+    def test_round_trip_and_persistence(self):
+        """Test that responses survive reopening the cache and lookups are counted."""
+        cache = ResponseCache(self.db_path)
+        key = cache_key('startupOverview', {'startupId': '1'})
+        self.assertIsNone(cache.get('overview', key))
+        cache.put('overview', key, {'startupId': '1', 'name': 'Acme'})
+        cache.close()
+        
+        cache = ResponseCache(self.db_path)
+        self.assertEqual(cache.get('overview', key), {'startupId': '1', 'name': 'Acme'})
+        self.assertEqual((cache.hits, cache.misses), (1, 0))
+        cache.close()
+    
+    def test_expiry(self):
+        """Test that entries expire after the TTL of their kind only."""
+        cache = ResponseCache(self.db_path, ttls={'overview': 0.05})
+        cache.put('overview', 'a', {'x': 1})
+        cache.put('other', 'b', {'x': 2})
+        time.sleep(0.1)
+        
+        self.assertIsNone(cache.get('overview', 'a'))
+        self.assertEqual(cache.get('other', 'b'), {'x': 2})
+        self.assertEqual(cache.purge_expired(), 1)
+        self.assertEqual(len(cache), 1)
+        cache.close()
+    
+    def test_evicts_least_recently_used(self):
+        """Test that the least recently read entries are evicted past the size limit."""
+        body = {'data': 'x' * 100}
+        cache = ResponseCache(self.db_path, max_bytes=350)
+        cache.put('overview', 'a', body)
+        time.sleep(0.01)
+        cache.put('overview', 'b', body)
+        time.sleep(0.01)
+        cache.put('overview', 'c', body)
+        time.sleep(0.01)
+        cache.get('overview', 'a')
+        time.sleep(0.01)
+        cache.put('overview', 'd', body)
+        
+        self.assertIsNotNone(cache.get('overview', 'a'))
+        self.assertIsNone(cache.get('overview', 'b'))
+        self.assertEqual(len(cache), 3)
+        cache.close()
+
+if __name__ == '__main__':
+    unittest.main()
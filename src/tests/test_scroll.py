@@ -0,0 +1,59 @@
+"""
+Tests for the infinite scroll driver.
+"""
+import os
+import unittest
+
+# Add the project root to the path so we can import our modules
+import sys
+project_root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.append(project_root)
+
+from src.scrapers.core.scroll import FeedScroller, INSTALL_SCRIPT, ADVANCE_SCRIPT
+
+class FakeDriver:
+    """Driver that emulates the scroll state of a page."""
+    
+    def __init__(self, has_list=True):
+        self.has_list = has_list
+        self.installed = False
+        self.total = 10
+        self.scripts = []
+    
+    def execute_script(self, script, *args):
+        self.scripts.append((script, args))
+        if script == INSTALL_SCRIPT:
+            self.installed = self.has_list
+            return self.has_list
+        if not self.installed:
+            return None
+        prune, keep = args
+        self.total += 10
+        loaded = min(self.total, keep) if prune else self.total
+        return {'total': self.total, 'loaded': loaded, 'removed': self.total - loaded}
+
+class TestFeedScroller(unittest.TestCase):
+    """Test cases for FeedScroller."""
+    
+    def test_installs_and_advances(self):
+        """Test that the state is installed on demand and each step is a single script."""
+        driver = FakeDriver()
+        scroller = FeedScroller(driver, 'ul.ant-list-items', prune=True, keep=15)
+        
+        self.assertEqual(scroller.advance(), 20)
+        self.assertEqual([s for s, _ in driver.scripts], [ADVANCE_SCRIPT, INSTALL_SCRIPT, ADVANCE_SCRIPT])
+        self.assertEqual(driver.scripts[1][1], ('ul.ant-list-items',))
+        
+        driver.scripts.clear()
+        for _ in range(100):
+            scroller.advance()
+        self.assertEqual(len(driver.scripts), 100)
+        self.assertEqual((scroller.total, scroller.loaded, scroller.removed), (1020, 15, 1005))
+    
+    def test_missing_list(self):
+        """Test that a page without the list cannot be scrolled."""
+        scroller = FeedScroller(FakeDriver(has_list=False), 'ul.ant-list-items')
+        self.assertIsNone(scroller.advance())
+
+if __name__ == '__main__':
+    unittest.main()
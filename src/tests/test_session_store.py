@@ -0,0 +1,79 @@
+"""
+Tests for the session store.
+"""
+import os
+import stat
+import time
+import json
+import shutil
+import tempfile
+import unittest
+
+# Add the project root to the path so we can import our modules
+import sys
+project_root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.append(project_root)
+
+from src.scrapers.core.session_store import SessionStore, cookie_expired
+
+class TestSessionStore(unittest.TestCase):
+    """Test cases for SessionStore."""
+    
+    def setUp(self):
+        """Set up a temporary session directory."""
+        self.test_dir = tempfile.mkdtemp()
+    
+    def tearDown(self):
+        """Clean up the temporary directory."""
+        shutil.rmtree(self.test_dir)
+    
+    def test_save_and_load(self):
+        """Test that a saved session is restored without its expired cookies."""
+        store = SessionStore(self.test_dir, 'jobright', 'user@example.com')
+        self.assertIsNone(store.load())
+        
+        now = time.time()
+        store.save([
+            {'name': 'sid', 'value': '1', 'expiry': now + 3600},
+            {'name': 'old', 'value': '2', 'expiry': now - 1},
+            {'name': 'tab', 'value': '3'},
+        ], {'token': 'abc'})
+        
+        session = SessionStore(self.test_dir, 'jobright', 'user@example.com').load()
+        self.assertEqual([c['name'] for c in session['cookies']], ['sid', 'tab'])
+        self.assertEqual(session['local_storage'], {'token': 'abc'})
+        self.assertNotIn('user@example.com', store.session_file)
+        self.assertEqual(stat.S_IMODE(os.stat(store.session_file).st_mode), 0o600)
+        
+        # Other accounts and sources have their own sessions
+        self.assertIsNone(SessionStore(self.test_dir, 'jobright', 'other@example.com').load())
+        self.assertIsNone(SessionStore(self.test_dir, 'wellfound', 'user@example.com').load())
+    
+    def test_stale_sessions_are_not_restored(self):
+        """Test that old, fully expired and cleared sessions are not restored."""
+        store = SessionStore(self.test_dir, 'wellfound', 'user', max_age=60)
+        store.save([{'name': 'sid', 'value': '1'}])
+        with open(store.session_file) as f:
+            session = json.load(f)
+        session['saved_at'] -= 120
+        with open(store.session_file, 'w') as f:
+            json.dump(session, f)
+        self.assertIsNone(store.load())
+        
+        store.save([{'name': 'sid', 'value': '1', 'expires': time.time() - 1}])
+        self.assertIsNone(store.load())
+        
+        store.save([{'name': 'sid', 'value': '1', 'expires': -1}])
+        self.assertIsNotNone(store.load())
+        store.clear()
+        self.assertIsNone(store.load())
+    
+    def test_cookie_expired(self):
+        """Test expiry of WebDriver and DevTools cookies."""
+        self.assertTrue(cookie_expired({'expiry': 100}, now=200))
+        self.assertFalse(cookie_expired({'expires': 300}, now=200))
+        self.assertFalse(cookie_expired({'expires': -1}, now=200))
+        self.assertFalse(cookie_expired({}, now=200))
+
+if __name__ == '__main__':
+    unittest.main()
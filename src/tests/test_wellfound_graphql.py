@@ -0,0 +1,118 @@
+"""
+Tests for the Wellfound GraphQL replay.
+"""
+import os
+import json
+import unittest
+
+# Add the project root to the path so we can import our modules
+import sys
+project_root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.append(project_root)
+
+from src.scrapers.wellfound.graphql import GraphQLReplay, iter_search_pages, search_results, overview_variable, overview_fetcher
+
+def search_page(ids, cursor, more):
+    edges = [{'node': {'__typename': 'StartupSearchResult', 'startupId': i}} for i in ids]
+    page_info = {'hasNextPage': more, 'endCursor': cursor}
+    return {'data': {'talent': {'searchStartups': {'edges': edges, 'pageInfo': page_info}}}}
+
+class FakeResponse:
+    def __init__(self, body):
+        self.content = json.dumps(body).encode('utf-8')
+    
+    def raise_for_status(self):
+        pass
+
+class FakeSession:
+    """GraphQL endpoint serving three pages of search results."""
+    
+    PAGES = {
+        'c1': search_page(['3', '4'], 'c2', True),
+        'c2': search_page(['5'], 'c3', False),
+    }
+    
+    def __init__(self):
+        self.requests = []
+    
+    def post(self, url, headers=None, data=None, timeout=None):
+        payload = json.loads(data)
+        self.requests.append((url, headers, payload))
+        return FakeResponse(self.PAGES[payload['variables']['after']])
+
+class FakeOverviewSession:
+    """GraphQL endpoint serving startup overviews by slug."""
+    
+    def __init__(self):
+        self.slugs = []
+    
+    def post(self, url, headers=None, data=None, timeout=None):
+        slug = json.loads(data)['variables']['slug']
+        self.slugs.append(slug)
+        if slug == 'broken':
+            return FakeResponse({'errors': [{'message': 'not found'}]})
+        return FakeResponse({'data': {'startupOverview': {'startupResult': {'startupId': slug.upper()}}}})
+
+class TestGraphQLReplay(unittest.TestCase):
+    """Test cases for the GraphQL replay."""
+    
+    def setUp(self):
+        """Set up a captured search request."""
+        self.request = {
+            'url': 'https://wellfound.com/graphql',
+            'headers': {'Cookie': 'session=1', 'Content-Length': '120', 'Content-Type': 'application/json'},
+            'body': json.dumps({
+                'operationName': 'JobSearchResultsX',
+                'variables': {'filterConfigurationInput': {'page': 1}, 'after': None},
+                'extensions': {'persistedQuery': {'version': 1, 'sha256Hash': 'abc'}},
+            }),
+        }
+    
+    def test_replays_until_exhausted(self):
+        """Test that pages are fetched with each endCursor until hasNextPage is false."""
+        replay = GraphQLReplay.from_capture(self.request)
+        session = FakeSession()
+        _, page_info = search_results(search_page(['1', '2'], 'c1', True))
+        
+        pages = list(iter_search_pages(session, replay, page_info))
+        
+        self.assertEqual([[e['node']['startupId'] for e in edges] for edges in pages], [['3', '4'], ['5']])
+        self.assertEqual([payload['variables']['after'] for _, _, payload in session.requests], ['c1', 'c2'])
+        
+        # The captured operation, variables and cookies are replayed
+        url, headers, payload = session.requests[0]
+        self.assertEqual(replay.operation, 'JobSearchResultsX')
+        self.assertEqual(payload['extensions'], {'persistedQuery': {'version': 1, 'sha256Hash': 'abc'}})
+        self.assertEqual(payload['variables']['filterConfigurationInput'], {'page': 1})
+        self.assertEqual(headers['Cookie'], 'session=1')
+        self.assertNotIn('Content-Length', headers)
+        # The captured request is left untouched
+        self.assertIsNone(replay.payload['variables']['after'])
+    
+    def test_last_page(self):
+        """Test that nothing is fetched when the captured page is the last one."""
+        session = FakeSession()
+        pages = list(iter_search_pages(session, GraphQLReplay.from_capture(self.request), {'hasNextPage': False}))
+        self.assertEqual(pages, [])
+        self.assertEqual(session.requests, [])
+    
+    def test_overview_fetcher(self):
+        """Test that overviews are fetched for every startup with the identifying variable replaced."""
+        request = {
+            'url': 'https://wellfound.com/graphql',
+            'headers': {'Cookie': 'session=1'},
+            'body': json.dumps({'operationName': 'StartupOverview', 'variables': {'slug': 'acme', 'first': 10}}),
+        }
+        replay = GraphQLReplay.from_capture(request, operation='startupOverview')
+        startups = [{'startupId': str(i), 'slug': slug} for i, slug in enumerate(['acme', 'beta', 'broken', 'gamma'])]
+        self.assertEqual(overview_variable(replay.variables, startups[0]), ('slug', 'slug'))
+        
+        session = FakeOverviewSession()
+        overviews = []
+        overview_fetcher(session, replay, startups[1:], 'slug', 'slug', overviews.append, concurrency=3).run()
+        
+        self.assertEqual(sorted(session.slugs), ['beta', 'broken', 'gamma'])
+        self.assertEqual([o['startupResult']['startupId'] for o in overviews], ['BETA', 'GAMMA'])
+
+if __name__ == '__main__':
+    unittest.main()
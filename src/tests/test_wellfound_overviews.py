@@ -0,0 +1,63 @@
+"""
+Tests for the Wellfound overview collection with a response cache.
+"""
+import os
+import shutil
+import tempfile
+import threading
+import unittest
+
+# Add the project root to the path so we can import our modules
+import sys
+project_root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.append(project_root)
+
+from src.scrapers.core.response_cache import ResponseCache
+from src.scrapers.wellfound import scraper
+
+class TestCachedOverviews(unittest.TestCase):
+    """Test cases for a run whose overviews are partly cached."""
+    
+    def setUp(self):
+        """Set up a cache holding the overview of one of three startups."""
+        self.test_dir = tempfile.mkdtemp()
+        scraper.all_statups.clear()
+        scraper.all_extended_statups_pages.clear()
+        for k in ('1', '2', '3'):
+            scraper.all_statups[k] = {'id': k, 'name': f'Startup {k}'}
+        scraper.response_cache = ResponseCache(os.path.join(self.test_dir, 'responses.db'))
+        scraper.response_cache.put('overview', scraper.overview_cache_key('2'), {'startupId': '2', 'badges': []})
+    
+    def tearDown(self):
+        """Close the cache and clean up."""
+        scraper.response_cache.close()
+        scraper.response_cache = None
+        scraper.all_statups.clear()
+        scraper.all_extended_statups_pages.clear()
+        shutil.rmtree(self.test_dir)
+    
+    def test_only_uncached_startups_are_clicked(self):
+        """Test that arrows of cached startups are skipped."""
+        scraper.load_cached_overviews()
+        self.assertEqual(set(scraper.all_extended_statups_pages), {'2'})
+        self.assertEqual(scraper.response_cache.hits, 1)
+        
+        arrows = ['arrow 1', 'arrow 2', 'arrow 3']
+        self.assertEqual(scraper.arrows_to_click(arrows, list(scraper.all_statups)), ['arrow 1', 'arrow 3'])
+        # Unmatched arrows are all clicked
+        self.assertEqual(scraper.arrows_to_click(arrows[:2], list(scraper.all_statups)), arrows[:2])
+    
+    def test_cached_overview_arriving_again_counts(self):
+        """Test that an overview replacing a cached one ends the wait instead of timing out."""
+        scraper.load_cached_overviews()
+        arrivals = scraper.overview_arrivals
+        threading.Timer(0.05, scraper.get_extended_page_results,
+                        args=({'startupResult': {'startupId': '2', 'badges': []}},)).start()
+        
+        latency = scraper.wait_for_overview(arrivals, timeout=5)
+        self.assertIsNotNone(latency)
+        self.assertLess(latency, 1)
+        self.assertEqual(len(scraper.all_extended_statups_pages), 1)
+
+if __name__ == '__main__':
+    unittest.main()